@@ -164,7 +164,7 @@ def __le__(self, other):
         >>> a <= a
         True
         >>> a <= b
-        true
+        True
         """
         return self.sort_key() <= sympify(other).sort_key()
 
@@ -181,7 +181,7 @@ def __lt__(self, other):
         >>> a.rank, b.rank
         (9, 34)
         >>> a < b
-        true
+        True
         """
         return self.sort_key() < sympify(other).sort_key()
 
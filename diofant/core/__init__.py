@@ -27,6 +27,7 @@
 from .containers import Tuple, Dict
 from .exprtools import gcd_terms, factor_terms, factor_nc
 from .evaluate import evaluate
+from .deadline import deadline, DeadlineExceeded
 
 # expose singletons
 Catalan = S.Catalan
@@ -8,10 +8,13 @@
 from .cache import cacheit
 from .numbers import ilcm, igcd
 from .expr import Expr
+from .evaluate import global_evaluate
 
 
 class Add(Expr, AssocOp):
 
+    __slots__ = ()
+
     is_Add = True
 
     @classmethod
@@ -212,6 +215,90 @@ def flatten(cls, seq):
         else:
             return newseq, [], None
 
+    @classmethod
+    def from_terms(cls, terms):
+        """Return the sum of ``coeff*term`` for all pairs of ``terms``.
+
+        This is a fast way to construct large sums of collected terms,
+        e.g. after expansion.  The ``terms`` is a mapping of terms to
+        their coefficients or an iterable of ``(term, coeff)`` pairs.
+        Equal terms are merged, terms that are sums are merged with
+        their arguments and the result is sorted only once.  Arguments
+        of terms are not flattened again.  With evaluation disabled
+        (see :func:`~diofant.core.evaluate.evaluate`), the sum is not
+        evaluated.
+
+        Examples
+        ========
+
+        >>> from diofant.abc import x, y
+        >>> Add.from_terms({x: 2, x*y: 3, 1: 4})
+        3*x*y + 2*x + 4
+        >>> Add.from_terms([(x, 1), (2*x, 3), (x + y, -1)])
+        6*x - y
+
+        See Also
+        ========
+
+        flatten
+        """
+        from .mul import Mul
+        from .numbers import Integer
+        from .sympify import _sympify
+
+        if isinstance(terms, dict):
+            terms = terms.items()
+        terms = [(_sympify(t), Integer(c) if type(c) is int else _sympify(c))
+                 for t, c in terms]
+
+        if not global_evaluate[0]:
+            return cls(*[t if c is S.One else Mul(c, t) for t, c in terms])
+
+        collected = {}
+        coeff = S.Zero
+        stack = terms[::-1]
+        while stack:
+            t, c = stack.pop()
+            if not c.is_Number:
+                t, c = c*t, S.One
+            if not (c.is_Rational or c.is_Float):
+                break
+            if t.is_Mul:
+                c0, t = t.as_coeff_Mul()
+                if c0 is not S.One:
+                    c *= c0
+                    if not (c.is_Rational or c.is_Float):
+                        break
+            if t.is_Rational or t.is_Float:
+                coeff += c*t
+            elif t.is_Add:
+                stack.extend((a, c) for a in reversed(t.args))
+            elif (t.is_Number or t is S.ComplexInfinity or t.is_Order or
+                  not t.is_commutative):
+                break
+            elif t in collected:
+                collected[t] += c
+            else:
+                collected[t] = c
+        else:
+            args = []
+            for t, c in collected.items():
+                if c is S.Zero:
+                    continue
+                elif c is S.One:
+                    args.append(t)
+                elif t.is_Mul:
+                    args.append(t._new_rawargs(*((c,) + t.args)))
+                else:
+                    args.append(Mul(c, t))
+            args.sort(key=default_sort_key)
+            if coeff is not S.Zero:
+                args.insert(0, coeff)
+            return cls._from_args(args)
+
+        # infinities, orders or noncommutative terms
+        return cls(*[c*t for t, c in terms])
+
     @classmethod
     def class_key(cls):
         """Nice order of classes"""
@@ -46,50 +46,59 @@
 attributes of objects/classes.
 """
 
-from random import shuffle
-
+from .assumptions_generated import generated_assumptions
 from .facts import FactRules, FactKB
 from .sympify import sympify
 
-_assume_rules = FactRules([
-    'integer        ->  rational',
-    'rational       ->  real',
-    'real           ==  extended_real & finite',
-    'rational       ->  algebraic',
-    'algebraic      ->  complex',
-    'real           ->  complex & hermitian',
-    'imaginary      ->  complex & antihermitian',
-    'complex        ->  finite & commutative',
-    'extended_real  ->  commutative',
 
-    'odd            ==  integer & ~even',
-    'even           ==  integer & ~odd',
+def _generate_assumption_rules():
+    """Compile the assumption rules.
+
+    Result is stored in ``diofant.core.assumptions_generated``, so it
+    should be regenerated after changes in rules.
+    """
+    return FactRules([
+        'integer        ->  rational',
+        'rational       ->  real',
+        'real           ==  extended_real & finite',
+        'rational       ->  algebraic',
+        'algebraic      ->  complex',
+        'real           ->  complex & hermitian',
+        'imaginary      ->  complex & antihermitian',
+        'complex        ->  finite & commutative',
+        'extended_real  ->  commutative',
+
+        'odd            ==  integer & ~even',
+        'even           ==  integer & ~odd',
+
+        'extended_real  ==  negative | zero | positive',
+        'transcendental ==  complex & ~algebraic',
+
+        'negative       ==  nonpositive & nonzero',
+        'positive       ==  nonnegative & nonzero',
+        'zero           ==  nonnegative & nonpositive',
 
-    'extended_real  ==  negative | zero | positive',
-    'transcendental ==  complex & ~algebraic',
+        'nonpositive    ==  extended_real & ~positive',
+        'nonnegative    ==  extended_real & ~negative',
 
-    'negative       ==  nonpositive & nonzero',
-    'positive       ==  nonnegative & nonzero',
-    'zero           ==  nonnegative & nonpositive',
+        'zero           ->  even & finite',
 
-    'nonpositive    ==  extended_real & ~positive',
-    'nonnegative    ==  extended_real & ~negative',
+        'prime          ->  integer & positive',
+        'composite      ->  integer & positive & ~prime',
 
-    'zero           ->  even & finite',
+        'irrational     ==  real & ~rational',
 
-    'prime          ->  integer & positive',
-    'composite      ->  integer & positive & ~prime',
+        'imaginary      ->  ~extended_real | zero',
 
-    'irrational     ==  real & ~rational',
+        'infinite       ->  ~finite',
+        'noninteger     ==  real & ~integer',
+        'nonzero        ==  ~zero',
 
-    'imaginary      ->  ~extended_real | zero',
+        'polar          -> commutative',
+    ])
 
-    'infinite       ->  ~finite',
-    'noninteger     ==  real & ~integer',
-    'nonzero        ==  ~zero',
 
-    'polar          -> commutative',
-])
+_assume_rules = FactRules._from_python(generated_assumptions)
 
 _assume_defined = frozenset(_assume_rules.defined_facts.copy())
 _assume_docs = {
@@ -331,6 +340,7 @@ class StdFactKB(FactKB):
     rules = _assume_rules
 
     def __init__(self, facts=None):
+        self._true = self._false = 0
         # save a copy of the facts dict
         if not facts:
             self._generator = {}
@@ -341,9 +351,6 @@ def __init__(self, facts=None):
         if facts:
             self.deduce_all_facts(facts)
 
-    def copy(self):
-        return self.__class__(self)
-
     @property
     def generator(self):
         return self._generator.copy()
@@ -415,6 +422,46 @@ def check_assumptions(expr, **assumptions):
     return result
 
 
+def _implications_count(fact):
+    true, false = _assume_rules.deduction_table[fact, True][:2]
+    n = bin(true | false).count('1')
+    true, false = _assume_rules.deduction_table[fact, False][:2]
+    return n + bin(true | false).count('1')
+
+
+# Facts with more implications first, so answers to the next queries are
+# likely already deduced.
+_batch_order = {fact: i for i, fact in
+                enumerate(sorted(_assume_defined,
+                                 key=lambda f: (-_implications_count(f), f)))}
+
+
+def get_assumptions(expr, *facts):
+    """Return a dictionary with truth values of ``facts`` for ``expr``.
+
+    This is same as querying ``is_<fact>`` attributes one by one, but facts
+    are asked in an order, that allows to reuse deduced values.  If no
+    facts are given, all defined facts are queried.
+
+    Examples
+    ========
+
+    >>> from diofant import Symbol
+    >>> x = Symbol('x', positive=True)
+    >>> get_assumptions(x + 1, 'real', 'positive', 'zero')
+    {'positive': True, 'real': None, 'zero': False}
+    >>> get_assumptions(x)['nonnegative']
+    True
+    """
+    expr = sympify(expr)
+    if not facts:
+        facts = sorted(_assume_defined)
+    result = {}
+    for fact in sorted(facts, key=lambda f: _batch_order.get(f, -1)):
+        result[fact] = getattr(expr, as_property(fact), None)
+    return {fact: result[fact] for fact in facts}
+
+
 def _ask(fact, obj):
     """
     Find the truth value for a property of an object.
@@ -458,9 +505,7 @@ def _ask(fact, obj):
             return a
 
     # Try assumption's prerequisites
-    prereq = list(_assume_rules.prereq[fact])
-    shuffle(prereq)
-    for pk in prereq:
+    for pk in _assume_rules.prereq_order.get(fact, ()):
         if pk in assumptions:
             continue
         if pk in handler_map:
@@ -0,0 +1,147 @@
+"""Pre-generated tables for the assumption rules.
+
+Do not edit this file by hand.  If rules in
+``diofant.core.assumptions._generate_assumption_rules()`` are changed,
+replace the ``generated_assumptions`` value below with output of::
+
+    >>> from diofant.core.assumptions import _generate_assumption_rules
+    >>> print(_generate_assumption_rules()._to_python())  # doctest: +SKIP
+"""
+
+generated_assumptions = {
+    'defined_facts': {'algebraic', 'antihermitian', 'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'imaginary', 'infinite', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'nonzero', 'odd', 'polar', 'positive', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+    'full_implications': {
+        ('algebraic', False): {('composite', False), ('even', False), ('integer', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('zero', False)},
+        ('algebraic', True): {('commutative', True), ('complex', True), ('finite', True), ('infinite', False), ('transcendental', False)},
+        ('antihermitian', False): {('imaginary', False)},
+        ('commutative', False): {('algebraic', False), ('complex', False), ('composite', False), ('even', False), ('extended_real', False), ('imaginary', False), ('integer', False), ('irrational', False), ('negative', False), ('noninteger', False), ('nonnegative', False), ('nonpositive', False), ('nonzero', True), ('odd', False), ('polar', False), ('positive', False), ('prime', False), ('rational', False), ('real', False), ('transcendental', False), ('zero', False)},
+        ('complex', False): {('algebraic', False), ('composite', False), ('even', False), ('imaginary', False), ('integer', False), ('irrational', False), ('noninteger', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('real', False), ('transcendental', False), ('zero', False)},
+        ('complex', True): {('commutative', True), ('finite', True), ('infinite', False)},
+        ('composite', True): {('algebraic', True), ('commutative', True), ('complex', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('imaginary', False), ('infinite', False), ('integer', True), ('irrational', False), ('negative', False), ('noninteger', False), ('nonnegative', True), ('nonpositive', False), ('nonzero', True), ('positive', True), ('prime', False), ('rational', True), ('real', True), ('transcendental', False), ('zero', False)},
+        ('even', False): {('nonzero', True), ('zero', False)},
+        ('even', True): {('algebraic', True), ('commutative', True), ('complex', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('infinite', False), ('integer', True), ('irrational', False), ('noninteger', False), ('odd', False), ('rational', True), ('real', True), ('transcendental', False)},
+        ('extended_real', False): {('composite', False), ('even', False), ('integer', False), ('irrational', False), ('negative', False), ('noninteger', False), ('nonnegative', False), ('nonpositive', False), ('nonzero', True), ('odd', False), ('positive', False), ('prime', False), ('rational', False), ('real', False), ('zero', False)},
+        ('extended_real', True): {('commutative', True)},
+        ('finite', False): {('algebraic', False), ('complex', False), ('composite', False), ('even', False), ('imaginary', False), ('integer', False), ('irrational', False), ('noninteger', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('real', False), ('transcendental', False), ('zero', False)},
+        ('finite', True): {('infinite', False)},
+        ('hermitian', False): {('composite', False), ('even', False), ('integer', False), ('irrational', False), ('noninteger', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('real', False), ('zero', False)},
+        ('imaginary', True): {('antihermitian', True), ('commutative', True), ('complex', True), ('finite', True), ('infinite', False)},
+        ('infinite', True): {('algebraic', False), ('complex', False), ('composite', False), ('even', False), ('finite', False), ('imaginary', False), ('integer', False), ('irrational', False), ('noninteger', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('real', False), ('transcendental', False), ('zero', False)},
+        ('integer', False): {('composite', False), ('even', False), ('nonzero', True), ('odd', False), ('prime', False), ('zero', False)},
+        ('integer', True): {('algebraic', True), ('commutative', True), ('complex', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('infinite', False), ('irrational', False), ('noninteger', False), ('rational', True), ('real', True), ('transcendental', False)},
+        ('irrational', True): {('commutative', True), ('complex', True), ('composite', False), ('even', False), ('extended_real', True), ('finite', True), ('hermitian', True), ('imaginary', False), ('infinite', False), ('integer', False), ('noninteger', True), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('real', True), ('zero', False)},
+        ('negative', False): set(),
+        ('negative', True): {('commutative', True), ('composite', False), ('extended_real', True), ('imaginary', False), ('nonnegative', False), ('nonpositive', True), ('nonzero', True), ('positive', False), ('prime', False), ('zero', False)},
+        ('noninteger', True): {('commutative', True), ('complex', True), ('composite', False), ('even', False), ('extended_real', True), ('finite', True), ('hermitian', True), ('imaginary', False), ('infinite', False), ('integer', False), ('nonzero', True), ('odd', False), ('prime', False), ('real', True), ('zero', False)},
+        ('nonnegative', False): {('composite', False), ('nonzero', True), ('positive', False), ('prime', False), ('zero', False)},
+        ('nonnegative', True): {('commutative', True), ('extended_real', True), ('negative', False)},
+        ('nonpositive', False): {('negative', False), ('nonzero', True), ('zero', False)},
+        ('nonpositive', True): {('commutative', True), ('composite', False), ('extended_real', True), ('positive', False), ('prime', False)},
+        ('nonzero', False): {('algebraic', True), ('commutative', True), ('complex', True), ('composite', False), ('even', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('infinite', False), ('integer', True), ('irrational', False), ('negative', False), ('noninteger', False), ('nonnegative', True), ('nonpositive', True), ('odd', False), ('positive', False), ('prime', False), ('rational', True), ('real', True), ('transcendental', False), ('zero', True)},
+        ('nonzero', True): {('zero', False)},
+        ('odd', False): set(),
+        ('odd', True): {('algebraic', True), ('commutative', True), ('complex', True), ('even', False), ('extended_real', True), ('finite', True), ('hermitian', True), ('imaginary', False), ('infinite', False), ('integer', True), ('irrational', False), ('noninteger', False), ('nonzero', True), ('rational', True), ('real', True), ('transcendental', False), ('zero', False)},
+        ('polar', True): {('commutative', True)},
+        ('positive', False): {('composite', False), ('prime', False)},
+        ('positive', True): {('commutative', True), ('extended_real', True), ('imaginary', False), ('negative', False), ('nonnegative', True), ('nonpositive', False), ('nonzero', True), ('zero', False)},
+        ('prime', True): {('algebraic', True), ('commutative', True), ('complex', True), ('composite', False), ('extended_real', True), ('finite', True), ('hermitian', True), ('imaginary', False), ('infinite', False), ('integer', True), ('irrational', False), ('negative', False), ('noninteger', False), ('nonnegative', True), ('nonpositive', False), ('nonzero', True), ('positive', True), ('rational', True), ('real', True), ('transcendental', False), ('zero', False)},
+        ('rational', False): {('composite', False), ('even', False), ('integer', False), ('nonzero', True), ('odd', False), ('prime', False), ('zero', False)},
+        ('rational', True): {('algebraic', True), ('commutative', True), ('complex', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('infinite', False), ('irrational', False), ('real', True), ('transcendental', False)},
+        ('real', False): {('composite', False), ('even', False), ('integer', False), ('irrational', False), ('noninteger', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('zero', False)},
+        ('real', True): {('commutative', True), ('complex', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('infinite', False)},
+        ('transcendental', True): {('algebraic', False), ('commutative', True), ('complex', True), ('composite', False), ('even', False), ('finite', True), ('infinite', False), ('integer', False), ('nonzero', True), ('odd', False), ('prime', False), ('rational', False), ('zero', False)},
+        ('zero', False): {('nonzero', True)},
+        ('zero', True): {('algebraic', True), ('commutative', True), ('complex', True), ('composite', False), ('even', True), ('extended_real', True), ('finite', True), ('hermitian', True), ('infinite', False), ('integer', True), ('irrational', False), ('negative', False), ('noninteger', False), ('nonnegative', True), ('nonpositive', True), ('nonzero', False), ('odd', False), ('positive', False), ('prime', False), ('rational', True), ('real', True), ('transcendental', False)},
+    },
+    'beta_rules': [
+        ({('algebraic', False), ('complex', True)}, ('transcendental', True)),
+        ({('even', False), ('integer', True)}, ('odd', True)),
+        ({('extended_real', True), ('finite', True)}, ('real', True)),
+        ({('extended_real', True), ('imaginary', True)}, ('zero', True)),
+        ({('extended_real', True), ('negative', False)}, ('nonnegative', True)),
+        ({('extended_real', True), ('negative', False), ('positive', False)}, ('zero', True)),
+        ({('extended_real', True), ('negative', False), ('zero', False)}, ('positive', True)),
+        ({('extended_real', True), ('positive', False)}, ('nonpositive', True)),
+        ({('extended_real', True), ('positive', False), ('zero', False)}, ('negative', True)),
+        ({('extended_real', True), ('zero', False)}, ('imaginary', False)),
+        ({('imaginary', True), ('zero', False)}, ('extended_real', False)),
+        ({('integer', False), ('real', True)}, ('noninteger', True)),
+        ({('integer', True), ('odd', False)}, ('even', True)),
+        ({('negative', False), ('positive', False), ('zero', False)}, ('extended_real', False)),
+        ({('nonnegative', True), ('nonpositive', True)}, ('zero', True)),
+        ({('nonnegative', True), ('nonzero', True)}, ('positive', True)),
+        ({('nonpositive', True), ('nonzero', True)}, ('negative', True)),
+        ({('rational', False), ('real', True)}, ('irrational', True)),
+    ],
+    'beta_triggers': {
+        ('algebraic', False): [0, 6, 8, 9, 10, 11, 13, 15, 16, 17],
+        ('algebraic', True): [2],
+        ('antihermitian', False): [],
+        ('commutative', False): [],
+        ('complex', False): [6, 8, 13, 15, 16],
+        ('complex', True): [0, 2],
+        ('composite', True): [1, 12],
+        ('even', False): [1, 6, 8, 9, 10, 13, 15, 16],
+        ('even', True): [3, 4, 5, 6, 7, 8, 9],
+        ('extended_real', False): [],
+        ('extended_real', True): [2, 3, 4, 5, 6, 7, 8, 9],
+        ('finite', False): [6, 8, 13, 15, 16],
+        ('finite', True): [2],
+        ('hermitian', False): [6, 8, 9, 10, 13, 15, 16],
+        ('imaginary', True): [0, 2, 3, 10],
+        ('infinite', True): [6, 8, 13, 15, 16],
+        ('integer', False): [6, 8, 9, 10, 11, 13, 15, 16],
+        ('integer', True): [1, 3, 4, 5, 6, 7, 8, 9, 12],
+        ('irrational', True): [0, 4, 6, 7, 8, 15, 16],
+        ('negative', False): [4, 5, 6, 13],
+        ('negative', True): [2],
+        ('noninteger', True): [0, 4, 6, 7, 8, 15, 16, 17],
+        ('nonnegative', False): [7, 8, 9, 10, 13, 16],
+        ('nonnegative', True): [2, 3, 5, 6, 7, 9, 14, 15],
+        ('nonpositive', False): [4, 6, 9, 10, 13, 15],
+        ('nonpositive', True): [2, 3, 4, 5, 8, 9, 14, 16],
+        ('nonzero', False): [],
+        ('nonzero', True): [6, 8, 9, 10, 13, 15, 16],
+        ('odd', False): [12],
+        ('odd', True): [4, 6, 7, 8, 15, 16],
+        ('polar', True): [],
+        ('positive', False): [5, 7, 8, 13],
+        ('positive', True): [2],
+        ('prime', True): [1, 12],
+        ('rational', False): [6, 8, 9, 10, 11, 13, 15, 16, 17],
+        ('rational', True): [3, 4, 5, 6, 7, 8, 9, 11],
+        ('real', False): [6, 8, 9, 10, 13, 15, 16],
+        ('real', True): [0, 3, 4, 5, 6, 7, 8, 9, 11, 17],
+        ('transcendental', True): [2, 6, 8, 9, 10, 11, 13, 15, 16, 17],
+        ('zero', False): [6, 8, 9, 10, 13, 15, 16],
+        ('zero', True): [],
+    },
+    'prereq': {
+        'algebraic': {'commutative', 'complex', 'composite', 'even', 'finite', 'infinite', 'integer', 'nonzero', 'odd', 'prime', 'rational', 'transcendental', 'zero'},
+        'antihermitian': {'imaginary'},
+        'commutative': {'algebraic', 'complex', 'composite', 'even', 'extended_real', 'imaginary', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'nonzero', 'odd', 'polar', 'positive', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'complex': {'algebraic', 'commutative', 'composite', 'even', 'finite', 'imaginary', 'infinite', 'integer', 'irrational', 'noninteger', 'nonzero', 'odd', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'composite': {'algebraic', 'commutative', 'complex', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'nonzero', 'positive', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'even': {'algebraic', 'commutative', 'complex', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'noninteger', 'nonzero', 'odd', 'rational', 'real', 'transcendental', 'zero'},
+        'extended_real': {'commutative', 'composite', 'even', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'nonzero', 'odd', 'positive', 'prime', 'rational', 'real', 'zero'},
+        'finite': {'algebraic', 'complex', 'composite', 'even', 'imaginary', 'infinite', 'integer', 'irrational', 'noninteger', 'nonzero', 'odd', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'hermitian': {'composite', 'even', 'integer', 'irrational', 'noninteger', 'nonzero', 'odd', 'prime', 'rational', 'real', 'zero'},
+        'imaginary': {'antihermitian', 'commutative', 'complex', 'composite', 'finite', 'infinite', 'irrational', 'negative', 'noninteger', 'odd', 'positive', 'prime'},
+        'infinite': {'algebraic', 'complex', 'composite', 'even', 'finite', 'imaginary', 'integer', 'irrational', 'noninteger', 'nonzero', 'odd', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'integer': {'algebraic', 'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'irrational', 'noninteger', 'nonzero', 'odd', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'irrational': {'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'nonzero', 'odd', 'prime', 'rational', 'real', 'zero'},
+        'negative': {'commutative', 'composite', 'extended_real', 'nonnegative', 'nonpositive', 'nonzero', 'positive', 'prime', 'zero'},
+        'noninteger': {'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'nonzero', 'odd', 'prime', 'real', 'zero'},
+        'nonnegative': {'commutative', 'composite', 'extended_real', 'negative', 'nonzero', 'positive', 'prime', 'zero'},
+        'nonpositive': {'commutative', 'composite', 'extended_real', 'negative', 'nonzero', 'positive', 'prime', 'zero'},
+        'nonzero': {'algebraic', 'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'odd', 'positive', 'prime', 'rational', 'real', 'transcendental', 'zero'},
+        'odd': {'algebraic', 'commutative', 'complex', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'noninteger', 'nonzero', 'rational', 'real', 'transcendental', 'zero'},
+        'polar': {'commutative'},
+        'positive': {'commutative', 'composite', 'extended_real', 'negative', 'nonnegative', 'nonpositive', 'nonzero', 'prime', 'zero'},
+        'prime': {'algebraic', 'commutative', 'complex', 'composite', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'nonzero', 'positive', 'rational', 'real', 'transcendental', 'zero'},
+        'rational': {'algebraic', 'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'nonzero', 'odd', 'prime', 'real', 'transcendental', 'zero'},
+        'real': {'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'noninteger', 'nonzero', 'odd', 'prime', 'rational', 'zero'},
+        'transcendental': {'algebraic', 'commutative', 'complex', 'composite', 'even', 'finite', 'infinite', 'integer', 'nonzero', 'odd', 'prime', 'rational', 'zero'},
+        'zero': {'algebraic', 'commutative', 'complex', 'composite', 'even', 'extended_real', 'finite', 'hermitian', 'infinite', 'integer', 'irrational', 'negative', 'noninteger', 'nonnegative', 'nonpositive', 'nonzero', 'odd', 'positive', 'prime', 'rational', 'real', 'transcendental'},
+    },
+}
@@ -1,12 +1,15 @@
 """Base class for all the objects in Diofant"""
 
+import os
+import weakref
 from inspect import getmro
 from itertools import zip_longest
 
 from .assumptions import ManagedProperties
-from .cache import cacheit
+from .cache import cacheit, cache_sort_key
 from .sympify import _sympify, sympify, SympifyError
 from .compatibility import iterable, ordered
+from .deadline import check_deadline
 from .singleton import S
 
 
@@ -35,6 +38,9 @@ class Basic(metaclass=ManagedProperties):
     y
     """
 
+    __slots__ = ('_mhash', '_sort_key', '_args', '_assumptions', '_interned',
+                 '__weakref__')
+
     # To be overridden with True in the appropriate subclasses
     is_number = False
     is_Atom = False
@@ -66,6 +72,8 @@ def __new__(cls, *args):
         obj = object.__new__(cls)
         obj._assumptions = cls.default_assumptions
         obj._mhash = None  # will be set by __hash__ method.
+        obj._sort_key = None  # will be set by sort_key method.
+        obj._interned = False  # see intern()
 
         obj._args = args  # all items in args must be Basic objects
         return obj
@@ -152,7 +160,7 @@ def class_key(cls):
         """Nice order of classes. """
         return 5, 0, cls.__name__
 
-    @cacheit
+    @cache_sort_key
     def sort_key(self, order=None):
         """Return a sort key.
 
@@ -180,7 +188,7 @@ def inner_key(arg):
 
         args = self._sorted_args
         args = len(args), tuple(inner_key(arg) for arg in args)
-        return self.class_key(), args, S.One.sort_key(), S.One
+        return self.class_key(), args, S.One.sort_key(), 1
 
     def __eq__(self, other):
         """Return a boolean indicating whether a == b on the basis of
@@ -809,47 +817,62 @@ def _subs(self, old, new, **hints):
               on any of its summation variables.
         """
 
-        def fallback(self, old, new):
+        hack2 = hints.get('hack2', False)
+
+        def fallback(node, args):
             """
-            Try to replace old with new in any of self's arguments.
+            Rebuild node with substituted arguments.
             """
-            hit = False
-            args = list(self.args)
-            for i, arg in enumerate(args):
-                if not hasattr(arg, '_eval_subs'):
-                    continue
-                arg = arg._subs(old, new, **hints)
-                if not _aresame(arg, args[i]):
-                    hit = True
-                    args[i] = arg
-            if hit:
-                rv = self.func(*args)
-                hack2 = hints.get('hack2', False)
-                if hack2 and self.is_Mul and not rv.is_Mul:  # 2-arg hack
-                    coeff = S.One
-                    nonnumber = []
-                    for i in args:
-                        if i.is_Number:
-                            coeff *= i
-                        else:
-                            nonnumber.append(i)
-                    nonnumber = self.func(*nonnumber)
-                    if coeff is S.One:
-                        return nonnumber
-                    elif nonnumber is S.One:
-                        return coeff
+            rv = node.func(*args)
+            if hack2 and node.is_Mul and not rv.is_Mul:  # 2-arg hack
+                coeff = S.One
+                nonnumber = []
+                for i in args:
+                    if i.is_Number:
+                        coeff *= i
                     else:
-                        return self.func(coeff, nonnumber, evaluate=False)
-                return rv
-            return self
-
-        if _aresame(self, old):
-            return new
+                        nonnumber.append(i)
+                nonnumber = node.func(*nonnumber)
+                if coeff is S.One:
+                    return nonnumber
+                elif nonnumber is S.One:
+                    return coeff
+                else:
+                    return node.func(coeff, nonnumber, evaluate=False)
+            return rv
 
-        rv = self._eval_subs(old, new)
-        if rv is None:
-            rv = fallback(self, old, new)
-        return rv
+        # Post-order traversal with an explicit stack.  Results for
+        # (possibly shared) subtrees are memoized by identity, along
+        # with a flag, telling if the result is the same as the subtree.
+        # Arguments are taken only once per node and nodes are kept in
+        # the memo, as args could be computed on the fly (see RootSum)
+        # and ids of garbage-collected objects could be reused.
+        memo = {}
+        stack = [(self, None)]
+        while stack:
+            node, args = stack.pop()
+            if args is not None:
+                args = [memo.get(id(a), (a, True, a)) for a in args]
+                if all(same for _, same, _ in args):
+                    memo[id(node)] = node, True, node
+                else:
+                    args = [a for a, _, _ in args]
+                    memo[id(node)] = fallback(node, args), False, node
+                continue
+            if id(node) in memo:
+                continue
+            if _aresame(node, old):
+                rv = new
+            else:
+                rv = node._eval_subs(old, new)
+            if rv is None:
+                args = node.args
+                stack.append((node, args))
+                stack.extend((a, None) for a in reversed(args)
+                             if hasattr(a, '_eval_subs'))
+            else:
+                memo[id(node)] = rv, rv is node or _aresame(rv, node), node
+        return memo[id(self)][0]
 
     def _eval_subs(self, old, new):
         """Override this stub if you want to do anything more than
@@ -923,13 +946,7 @@ def xreplace(self, rule):
         subs: substitution of subexpressions as defined by the objects
               themselves.
         """
-        if self in rule:
-            return rule[self]
-        elif rule:
-            args = tuple(a.xreplace(rule) for a in self.args)
-            if not _aresame(args, self.args):
-                return self.func(*args)
-        return self
+        return bulk_xreplace([self], rule)[0]
 
     @cacheit
     def has(self, *patterns):
@@ -965,14 +982,31 @@ def _has(self, pattern):
 
         pattern = sympify(pattern)
         if isinstance(pattern, type):
-            return any(isinstance(arg, pattern)
-            for arg in preorder_traversal(self))
-
-        try:
-            match = pattern._has_matcher()
-            return any(match(arg) for arg in preorder_traversal(self))
-        except AttributeError:
-            return any(arg == pattern for arg in preorder_traversal(self))
+            def match(arg):
+                return isinstance(arg, pattern)
+        else:
+            try:
+                match = pattern._has_matcher()
+            except AttributeError:
+                def match(arg):
+                    return arg == pattern
+
+        # Shared subtrees are visited only once.  Visited nodes are kept
+        # alive, so their ids can't be reused, see Basic._subs().
+        seen = {}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen[id(node)] = node
+            if match(node):
+                return True
+            if isinstance(node, Basic):
+                stack.extend(node.args)
+            elif iterable(node):
+                stack.extend(node)
+        return False
 
     def _has_matcher(self):
         """Helper for .has()"""
@@ -1176,6 +1210,8 @@ def _value(expr, result):
         mask = []  # the dummies that were used as change placeholders
 
         def rec_replace(expr):
+            check_deadline('replace', replaced=len(mapping))
+
             result = _query(expr)
             if result or result == {}:
                 new = _value(expr, result)
@@ -1434,6 +1470,8 @@ class Atom(Basic):
     Number, Rational or Integer, but not Add, Mul, Pow.
     """
 
+    __slots__ = ()
+
     is_Atom = True
 
     def matches(self, expr, repl_dict={}):
@@ -1472,11 +1510,11 @@ def class_key(cls):
         """Nice order of classes."""
         return 2, 0, cls.__name__
 
-    @cacheit
+    @cache_sort_key
     def sort_key(self, order=None):
         """Return a sort key."""
         from diofant.core import S
-        return self.class_key(), (1, (str(self),)), S.One.sort_key(), S.One
+        return self.class_key(), (1, (str(self),)), S.One.sort_key(), 1
 
     def _eval_simplify(self, ratio, measure):
         return self
@@ -1491,6 +1529,78 @@ def _sorted_args(self):
         ' to make a check for Atoms in the calling code.')
 
 
+def bulk_xreplace(exprs, rule):
+    """Apply :meth:`~Basic.xreplace` with same ``rule`` to ``exprs``.
+
+    Subtrees, shared by expressions (or repeated in one), are
+    processed only once.
+
+    Examples
+    ========
+
+    >>> from diofant import sin
+    >>> from diofant.abc import x, y
+    >>> from diofant.core.basic import bulk_xreplace
+    >>> bulk_xreplace([sin(x + 1), (x + 1)**2, y], {x + 1: y})
+    [sin(y), y**2, y]
+
+    See Also
+    ========
+
+    Basic.xreplace
+    """
+    exprs = list(exprs)
+    if not rule:
+        return exprs
+
+    # Post-order traversal with an explicit stack, see Basic._subs().
+    memo = {}
+    for expr in exprs:
+        stack = [(expr, None)]
+        while stack:
+            node, args = stack.pop()
+            if args is not None:
+                args = [memo[id(a)] for a in args]
+                if all(same for _, same, _ in args):
+                    memo[id(node)] = node, True, node
+                else:
+                    args = [a for a, _, _ in args]
+                    memo[id(node)] = node.func(*args), False, node
+                continue
+            if id(node) in memo:
+                continue
+            try:
+                found = node in rule
+            except RecursionError:
+                _prehash(node)
+                found = node in rule
+            if found:
+                rv = rule[node]
+            elif type(node).xreplace is not Basic.xreplace:
+                rv = node.xreplace(rule)
+            else:
+                args = node.args
+                stack.append((node, args))
+                stack.extend((a, None) for a in reversed(args))
+                continue
+            memo[id(node)] = rv, rv is node or _aresame(rv, node), node
+    return [memo[id(e)][0] for e in exprs]
+
+
+def _prehash(expr):
+    """Compute (and cache) hashes of subexpressions of ``expr``, starting
+    from leaves.  This works for expressions that are too deep to be
+    hashed recursively."""
+    stack = [(expr, False)]
+    while stack:
+        node, ready = stack.pop()
+        if ready:
+            hash(node)
+        elif isinstance(node, Basic) and node._mhash is None:
+            stack.append((node, True))
+            stack.extend((a, False) for a in node.args)
+
+
 def _aresame(a, b):
     """Return True if a and b are structurally the same, else False.
 
@@ -1626,3 +1736,112 @@ def _make_find_query(query):
     elif isinstance(query, Basic):
         return lambda expr: expr.match(query) is not None
     return query
+
+
+# Weak table of interned instances, see intern().
+_intern_table = weakref.WeakValueDictionary()
+
+
+def _intern_key(content, strong=True):
+    key = []
+    for a in content:
+        if isinstance(a, Basic):
+            a = intern(a)
+            if strong:
+                key.append((id(a), a))
+            else:
+                key.append(id(a))
+        elif type(a) is tuple:
+            key.append(_intern_key(a, strong))
+        else:
+            key.append((type(a), a))
+    return tuple(key)
+
+
+def intern(expr):
+    """Return the interned (canonical) instance of ``expr``.
+
+    Interned instances are shared: every instance of the same type and with
+    the same (structurally, with the same types of numbers) hashable content
+    is replaced by a single instance.  Interned instances are referenced
+    weakly, i.e. they are removed from the table, when not used anymore.
+    Instances of classes, that override ``__eq__()`` (except for numbers)
+    or ``__init__()``, are not interned.
+
+    Examples
+    ========
+
+    >>> from diofant import Add
+    >>> from diofant.abc import x
+    >>> a, b = Add(x, 1), Add(1, x)
+    >>> a is b
+    False
+    >>> intern(a) is intern(b)
+    True
+    >>> intern(x + 1.0) is intern(a)
+    False
+
+    See Also
+    ========
+
+    set_interning
+    """
+    if (not isinstance(expr, Basic) or getattr(expr, '_interned', False) or
+            (type(expr).__eq__ is not Basic.__eq__ and not expr.is_Number) or
+            type(expr).__init__ is not object.__init__):
+        return expr
+    content = expr._hashable_content()
+    is_args = content is expr._args
+    try:
+        if is_args:
+            # Replace arguments by interned ones, then the interned
+            # instance keeps alive objects with ids in the key.
+            content = tuple(map(intern, content))
+        key = type(expr), _intern_key(content, not is_args)
+        obj = _intern_table.setdefault(key, expr)
+    except TypeError:  # unhashable content
+        return expr
+    if obj is expr:
+        if is_args:
+            expr._args = content
+        expr._interned = True
+    return obj
+
+
+def _interning_call(cls, *args, **kwargs):
+    return intern(type.__call__(cls, *args, **kwargs))
+
+
+def set_interning(enable=True):
+    """Enable or disable interning of new instances.
+
+    With interning enabled, instances, created by calling classes (e.g.
+    ``Add(x, y)`` or ``self.func(*args)``), are replaced by interned ones
+    (see :func:`intern`).  Thus, equal expressions usually share a single
+    object, structurally equal subtrees are compared by identity and memory
+    for large expressions (e.g. with many repeated subexpressions) is saved.
+    Interning is disabled by default, unless the ``DIOFANT_USE_INTERN``
+    environment variable is set to ``True``.
+
+    Returns the previous state.
+
+    Examples
+    ========
+
+    >>> from diofant.abc import x, y
+    >>> old = set_interning()
+    >>> (x + y)**2 is (x + y)**2
+    True
+    >>> set_interning(old)
+    True
+    """
+    old = ManagedProperties.__dict__.get('__call__') is _interning_call
+    if enable:
+        ManagedProperties.__call__ = _interning_call
+    elif old:
+        del ManagedProperties.__call__
+    return old
+
+
+if os.getenv('DIOFANT_USE_INTERN', 'False') == 'True':
+    set_interning()
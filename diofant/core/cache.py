@@ -1,5 +1,6 @@
 """ Caching facility for Diofant """
 
+import functools
 import os
 
 from cachetools import cached
@@ -73,3 +74,24 @@ def cacheit(f):
         return cached(f_cache_it_cache, key=cache_key)(f)
     else:
         return f
+
+
+def cache_sort_key(f):
+    """Caching decorator for ``sort_key()`` methods.
+
+    The key for the default order is computed once per expression and
+    stored in the instance (like its hash), keys for other orders are
+    cached with :func:`cacheit`.
+    """
+    f_cached = cacheit(f)
+
+    @functools.wraps(f)
+    def sort_key(self, order=None):
+        if order is None:
+            key = self._sort_key
+            if key is None:
+                key = self._sort_key = f(self)
+            return key
+        return f_cached(self, order)
+
+    return sort_key
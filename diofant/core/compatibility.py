@@ -305,7 +305,7 @@ def default_sort_key(item, order=None):
         cls_index, args = 0, (1, (str(item),))
 
     return (cls_index, 0, item.__class__.__name__
-            ), args, S.One.sort_key(), S.One
+            ), args, S.One.sort_key(), 1
 
 
 def _nodes(e):
@@ -0,0 +1,122 @@
+"""Deadlines and cooperative cancellation of computations."""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class DeadlineExceeded(Exception):
+    """Raised at a checkpoint of a computation, when its deadline has passed.
+
+    Attributes
+    ==========
+
+    where : str
+        Name of the checkpoint.
+    progress : dict
+        Partial progress information, reported by the checkpoint.
+    elapsed : float
+        Seconds, elapsed since the deadline was set.
+    deadline : Deadline
+        The exceeded deadline.
+    """
+
+    def __init__(self, deadline, where, progress, elapsed):
+        super().__init__(deadline, where, progress, elapsed)
+        self.deadline = deadline
+        self.where = where
+        self.progress = progress
+        self.elapsed = elapsed
+
+    def __str__(self):
+        s = 'deadline exceeded in %s after %.3g seconds' % (self.where,
+                                                            self.elapsed)
+        if self.progress:
+            s += ' (%s)' % ', '.join('%s=%s' % (k, self.progress[k])
+                                     for k in sorted(self.progress))
+        return s
+
+
+class Deadline:
+    """A point in time, before which a computation should be finished."""
+
+    __slots__ = ('start', 'expires', 'parent')
+
+    def __init__(self, seconds, parent=None):
+        self.start = time.monotonic()
+        self.expires = self.start + seconds
+        self.parent = parent
+        if parent is not None:
+            self.expires = min(self.expires, parent.expires)
+
+    def remaining(self):
+        """Return seconds, remaining before the deadline."""
+        return self.expires - time.monotonic()
+
+
+class _State(threading.local):
+    active = None
+
+
+_state = _State()
+
+
+@contextmanager
+def deadline(seconds):
+    """Limit time of computations in the context to ``seconds``.
+
+    Long-running algorithms (e.g. Groebner bases, factorization of
+    multivariate polynomials, heuristic integration or simplification)
+    call :func:`check_deadline` in their main loops, which raises
+    :class:`DeadlineExceeded` once the deadline has passed.  Nested
+    deadlines can't extend outer ones.  ``seconds=None`` means no time
+    limit.  Deadlines are local to the thread.
+
+    Examples
+    ========
+
+    >>> from diofant import deadline, DeadlineExceeded
+    >>> from diofant.core.deadline import check_deadline
+
+    >>> with deadline(10):
+    ...     check_deadline('loop', step=1)
+    >>> try:
+    ...     with deadline(0):
+    ...         check_deadline('loop', step=1)
+    ... except DeadlineExceeded as exc:
+    ...     print(exc.where, exc.progress)
+    loop {'step': 1}
+    """
+    if seconds is None:
+        yield
+        return
+
+    d = Deadline(seconds, _state.active)
+    _state.active = d
+    try:
+        yield d
+    finally:
+        _state.active = d.parent
+
+
+def get_deadline():
+    """Return the active :class:`Deadline` of the thread or None."""
+    return _state.active
+
+
+def check_deadline(where, **progress):
+    """Raise :class:`DeadlineExceeded`, if the deadline has passed.
+
+    ``where`` names the checkpoint, keyword arguments describe partial
+    progress of the computation.  The outermost exceeded deadline is
+    reported.
+    """
+    d = _state.active
+    if d is None:
+        return
+    now = time.monotonic()
+    if now < d.expires:
+        return
+    while d.parent is not None and d.parent.expires <= now:
+        d = d.parent
+    raise DeadlineExceeded(d, where, progress, now - d.start)
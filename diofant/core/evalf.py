@@ -1221,6 +1221,8 @@ def evalf(x, prec, options):
 class EvalfMixin:
     """Mixin class adding evalf capabililty."""
 
+    __slots__ = ()
+
     def evalf(self, n=15, subs=None, maxn=100, chop=False, strict=False, quad=None):
         """
         Evaluate the given formula to an accuracy of n digits.
@@ -1364,3 +1366,344 @@ def N(x, n=15, **options):
     diofant.core.evalf.EvalfMixin.evalf
     """
     return sympify(x).evalf(n, **options)
+
+
+############################################################################
+#                                                                          #
+#                         Compiled evaluation plans                        #
+#                                                                          #
+############################################################################
+
+plan_table = None
+
+
+def _create_plan_table():
+    """Create table of elementary functions, supported by :class:`EvalfPlan`.
+
+    Each entry is a pair of the mpmath function and a function, estimating
+    log2 of the absolute value of the derivative from magnitudes of the
+    argument and the result.
+    """
+    global plan_table
+    from diofant.functions.elementary.complexes import Abs, im, re
+    from diofant.functions.elementary.exponential import exp, log
+    from diofant.functions.elementary.hyperbolic import (acosh, asinh, atanh,
+                                                         cosh, sinh, tanh)
+    from diofant.functions.elementary.trigonometric import (acos, asin, atan,
+                                                            cos, cot, sin,
+                                                            tan)
+    from diofant.functions.special.error_functions import erf
+    plan_table = {
+        exp: (mp.exp, lambda mx, mr: mr),
+        log: (mp.log, lambda mx, mr: -mx),
+
+        sin: (mp.sin, lambda mx, mr: 0),
+        cos: (mp.cos, lambda mx, mr: 0),
+        tan: (mp.tan, lambda mx, mr: max(0, 2*mr)),
+        cot: (mp.cot, lambda mx, mr: max(0, 2*mr)),
+        asin: (mp.asin, lambda mx, mr: 0),
+        acos: (mp.acos, lambda mx, mr: 0),
+        atan: (mp.atan, lambda mx, mr: min(0, -2*mx)),
+
+        sinh: (mp.sinh, lambda mx, mr: mr),
+        cosh: (mp.cosh, lambda mx, mr: mr),
+        tanh: (mp.tanh, lambda mx, mr: 0),
+        asinh: (mp.asinh, lambda mx, mr: min(0, -mx)),
+        acosh: (mp.acosh, lambda mx, mr: -mx),
+        atanh: (mp.atanh, lambda mx, mr: 0),
+
+        Abs: (abs, lambda mx, mr: 0),
+        re: (mp.re, lambda mx, mr: 0),
+        im: (mp.im, lambda mx, mr: 0),
+
+        erf: (mp.erf, lambda mx, mr: 0),
+    }
+
+
+def _mag(x):
+    """Return an upper bound for log2 of the absolute value of x."""
+    return mp.mag(x) if x else MINUS_INF
+
+
+def _to_mp(x, prec, options):
+    """Evaluate a numerical value to an mpmath number.
+
+    Returns the value and its estimated relative accuracy.
+    """
+    if isinstance(x, DIOFANT_INTS):
+        x = int(x)
+    elif getattr(x, 'is_Integer', False):
+        x = int(x.p)
+    elif getattr(x, 'is_Float', False):
+        return make_mpf(x._mpf_), INF
+
+    if isinstance(x, int):
+        acc = INF if bitcount(abs(x)) <= prec else prec
+        return make_mpf(from_int(x, prec, rnd)), acc
+    elif isinstance(x, (float, complex, mpf, mpc)):
+        # binary floating-point numbers are exact
+        return mp.mpmathify(x), INF
+
+    re, im, re_acc, im_acc = evalf(sympify(x), prec, options)
+    if iszero(re, scaled=True) or iszero(im, scaled=True):
+        return mp.zero, MINUS_INF
+    acc = complex_accuracy((re, im, re_acc, im_acc))
+    if im:
+        return make_mpc((re or fzero, im)), acc
+    return make_mpf(re or fzero), acc
+
+
+class EvalfPlan:
+    """Compiled plan for repeated numerical evaluation of an expression.
+
+    The expression is flattened to a list of instructions (one for every
+    distinct subexpression), which are executed with mpmath.  For each
+    instruction, the plan keeps its working precision and an estimate
+    of the accuracy of its result.  When the result isn't accurate enough,
+    only subexpressions of instructions that lost accuracy (e.g. by
+    cancellation) are evaluated again with higher precision.
+
+    Precision levels and values of subexpressions, that don't depend on
+    parameters, are kept between calls, so evaluation for many values of
+    parameters is much faster than with :meth:`~EvalfMixin.evalf`.
+
+    Parameters
+    ==========
+
+    expr : Expr
+        Expression to evaluate.
+    symbols : iterable of Symbol, optional
+        Parameters of the plan.  By default, free symbols of ``expr``
+        in the sorted order.
+    n, maxn, strict : optional
+        Same as for :meth:`~EvalfMixin.evalf`.
+
+    Examples
+    ========
+
+    >>> from diofant.core.evalf import EvalfPlan
+    >>> from diofant.abc import x
+
+    >>> plan = EvalfPlan((x + 1)**2 - x**2 - 2*x)
+    >>> plan(10**20)
+    1.00000000000000
+    >>> plan(10**30)
+    1.00000000000000
+
+    Subexpressions, not supported by plans (e.g. special functions or
+    integrals), are evaluated with :func:`evalf` after substitution
+    of values of parameters.
+    """
+
+    def __init__(self, expr, symbols=None, n=15, maxn=100, strict=False):
+        from diofant.core.compatibility import default_sort_key
+
+        expr = sympify(expr)
+        if symbols is None:
+            symbols = sorted(expr.free_symbols, key=default_sort_key)
+        self.expr = expr
+        self.symbols = tuple(symbols)
+
+        if not evalf_table:
+            _create_evalf_table()
+        if not plan_table:
+            _create_plan_table()
+
+        self._prec = dps_to_prec(n)
+        self._maxprec = max(self._prec, int(maxn*LG10))
+        self.strict = strict
+
+        self._compile()
+
+    def _compile(self):
+        """Flatten the expression to the list of instructions."""
+        params = {s: i for i, s in enumerate(self.symbols)}
+        index = {}
+        code, depends = [], []
+
+        # Post-order traversal with an explicit stack, see Basic._subs().
+        stack = [(self.expr, False)]
+        while stack:
+            node, ready = stack.pop()
+            if node in index:
+                continue
+            if node in params:
+                op, args, data = 'param', (), params[node]
+            elif node.is_Atom and node.is_number:
+                op, args, data = 'const', (), node
+            elif node.is_Add or node.is_Mul:
+                op, args, data = 'add' if node.is_Add else 'mul', node.args, None
+            elif node.is_Pow and node.exp.is_Integer:
+                op, args, data = 'powi', (node.base,), int(node.exp)
+            elif node.is_Pow:
+                op, args, data = 'pow', node.args, None
+            elif node.func in plan_table and len(node.args) == 1:
+                op, args, data = 'func', node.args, plan_table[node.func]
+            else:
+                op, args, data = 'evalf', (), node
+            if not ready and args:
+                stack.append((node, True))
+                stack.extend((a, False) for a in reversed(args))
+                continue
+            args = tuple(index[a] for a in args)
+            if op == 'param':
+                dep = True
+            elif op == 'evalf':
+                dep = node.has(*self.symbols)
+            else:
+                dep = any(depends[a] for a in args)
+            index[node] = len(code)
+            code.append((op, args, data))
+            depends.append(dep)
+
+        self._code = code
+        self._depends = depends
+        self._has_evalf = any(op == 'evalf' for op, _, _ in code)
+
+        self._precs = [self._prec + 10]*len(code)
+        self._values = [None]*len(code)
+        self._accs = [None]*len(code)
+        self._fresh = True
+
+    def __call__(self, *args):
+        """Evaluate the expression for given values of parameters."""
+        from diofant import Float
+
+        if len(args) != len(self.symbols):
+            raise TypeError("expected %d arguments, got %d" %
+                            (len(self.symbols), len(args)))
+
+        options = {'maxprec': self._maxprec}
+        if self._has_evalf:
+            options['subs'] = dict(zip(self.symbols, args))
+
+        target = self._prec
+        dirty = [self._fresh or d for d in self._depends]
+        while True:
+            self._run(args, dirty, options)
+            acc = self._accs[-1]
+            if acc >= target:
+                break
+            dirty = self._escalate(target - acc)
+            if dirty is None:
+                if self.strict:
+                    raise PrecisionExhausted("Failed to evaluate %s to %d "
+                                             "accurate bits with maximal "
+                                             "precision %d" % (self.expr,
+                                                               target,
+                                                               self._maxprec))
+                break
+        self._fresh = False
+
+        value = self._values[-1]
+        mag = _mag(value)
+
+        def part(x):
+            if not x:
+                return S.Zero
+            p = max(min(target, acc + _mag(x) - mag), 1)
+            return Float._new(x._mpf_, p)
+
+        return part(value.real) + part(value.imag)*S.ImaginaryUnit
+
+    def _run(self, args, dirty, options):
+        """Execute instructions, that are dirty or have dirty arguments."""
+        code, precs, values, accs = (self._code, self._precs,
+                                     self._values, self._accs)
+        oldprec = mp.prec
+        try:
+            for i, (op, iargs, data) in enumerate(code):
+                if not (dirty[i] or any(dirty[a] for a in iargs)):
+                    continue
+                dirty[i] = True
+                prec = mp.prec = precs[i]
+                if op == 'param':
+                    values[i], accs[i] = _to_mp(args[data], prec, options)
+                elif op == 'const' or op == 'evalf':
+                    values[i], accs[i] = _to_mp(data, prec, options)
+                elif op == 'add':
+                    # Absolute error of the sum is bounded by the
+                    # largest absolute error of terms.
+                    terms = [values[a] for a in iargs]
+                    err = max(_mag(t) - accs[a] if t else
+                              (MINUS_INF if accs[a] == INF else INF)
+                              for t, a in zip(terms, iargs))
+                    s = mp.fsum(terms)
+                    if s:
+                        acc = min(prec, _mag(s) - err)
+                    else:
+                        acc = INF if err == MINUS_INF else MINUS_INF
+                    values[i], accs[i] = s, acc
+                elif op == 'mul':
+                    # Relative errors of factors are added.
+                    factors = [values[a] for a in iargs]
+                    p = mp.fprod(factors)
+                    if p or all(accs[a] == INF for a in iargs):
+                        acc = min(accs[a] for a in iargs) - bitcount(len(iargs))
+                    elif any(not values[a] and accs[a] == INF for a in iargs):
+                        acc = INF
+                    else:
+                        acc = MINUS_INF
+                    values[i], accs[i] = p, min(prec, acc)
+                elif op == 'powi':
+                    (b,) = iargs
+                    values[i] = values[b]**data
+                    accs[i] = min(prec, accs[b] - bitcount(abs(data)))
+                elif op == 'pow':
+                    b, e = iargs
+                    vb, ve = values[b], values[e]
+                    values[i] = mp.power(vb, ve)
+                    # Relative error of b**e is e*db/b + log(b)*de.
+                    if vb:
+                        me = _mag(ve)
+                        mlogb = bitcount(abs(_mag(vb)))
+                        acc = -max(me - accs[b], mlogb + me - accs[e])
+                    else:
+                        acc = INF if accs[b] == INF else MINUS_INF
+                    accs[i] = min(prec, acc)
+                else:
+                    f, dmag = data
+                    (x,) = iargs
+                    vx = values[x]
+                    r = f(vx)
+                    if not r or not vx:
+                        acc = INF if accs[x] == INF else MINUS_INF
+                    else:
+                        mx, mr = _mag(vx), _mag(r)
+                        acc = accs[x] + mr - mx - dmag(mx, mr)
+                    values[i], accs[i] = r, min(prec, acc)
+        finally:
+            mp.prec = oldprec
+
+    def _escalate(self, deficit):
+        """Raise precision of subexpressions, that lost accuracy.
+
+        Returns flags for instructions with changed precision or None,
+        if precision can't be increased anymore.
+        """
+        code, precs, accs = self._code, self._precs, self._accs
+
+        if deficit == INF:
+            deficit = precs[-1]
+        deficit = int(deficit) + 10
+
+        lossy = [i for i, (_, iargs, _) in enumerate(code) if iargs and
+                 accs[i] < min([precs[i]] + [accs[a] for a in iargs]) - 3]
+        if lossy:
+            raised = set()
+            stack = lossy
+            while stack:
+                i = stack.pop()
+                if i not in raised:
+                    raised.add(i)
+                    stack.extend(code[i][1])
+        else:
+            raised = range(len(code))
+
+        dirty = [False]*len(code)
+        for i in raised:
+            prec = min(precs[i] + deficit, self._maxprec)
+            if prec > precs[i]:
+                precs[i] = prec
+                dirty[i] = True
+        return dirty if any(dirty) else None
@@ -8,7 +8,7 @@
 from .singleton import S
 from .evalf import EvalfMixin, pure_complex
 from .decorators import _sympifyit, call_highest_priority
-from .cache import cacheit
+from .cache import cacheit, cache_sort_key
 from .compatibility import as_int, default_sort_key
 
 
@@ -27,6 +27,8 @@ class Expr(Basic, EvalfMixin):
     diofant.core.basic.Basic
     """
 
+    __slots__ = ()
+
     @property
     def _diff_wrt(self):
         """Is it allowed to take derivative wrt to this instance.
@@ -58,7 +60,7 @@ def _diff_wrt(self):
         """
         return False
 
-    @cacheit
+    @cache_sort_key
     def sort_key(self, order=None):
         """Return a sort key. """
 
@@ -87,7 +89,7 @@ def sort_key(self, order=None):
         args = (len(args), tuple(args))
         exp = exp.sort_key(order=order)
 
-        return expr.class_key(), args, exp, coeff
+        return expr.class_key(), args, exp, coeff.sort_key()[-1]
 
     # ***************
     # * Arithmetics *
@@ -885,6 +887,9 @@ def as_ordered_terms(self, order=None, data=False):
         >>> (sin(x)**2*cos(x) + sin(x)**2 + 1).as_ordered_terms()
         [sin(x)**2*cos(x), sin(x)**2, 1]
         """
+        if not data:
+            return list(self._ordered_terms(order))
+
         key, reverse = self._parse_order(order)
         terms, gens = self.as_terms()
 
@@ -902,10 +907,13 @@ def as_ordered_terms(self, order=None, data=False):
             ordered = sorted(_terms, key=key, reverse=True) \
                 + sorted(_order, key=key, reverse=True)
 
-        if data:
-            return ordered, gens
-        else:
-            return [term for term, _ in ordered]
+        return ordered, gens
+
+    @cacheit
+    def _ordered_terms(self, order=None):
+        # terms are reordered by printers and by sort_key() many times
+        return tuple(term for term, _ in
+                     self.as_ordered_terms(order=order, data=True)[0])
 
     def as_terms(self):
         """Transform an expression to a list of terms. """
@@ -2521,6 +2529,19 @@ def series(self, x=None, x0=0, n=6, dir="+", logx=None):
 
         # from here on it's x0=0 and dir='+' handling
 
+        if (n is not None and n > 0 and self.free_symbols == {x} and
+                not self.is_polynomial(x)):
+            # try fast truncated power series in the ring QQ[x]
+            from diofant.polys.ring_series import rs_series
+            try:
+                s = rs_series(self, x, n)
+            except NotImplementedError:
+                pass
+            else:
+                # Laurent and Puiseux series are left for _eval_nseries()
+                if s.ring.symbols == (x,) and all(m[0] >= 0 for m in s):
+                    return s.as_expr() + Order(x**n, x)
+
         if x.is_positive is x.is_negative is None or x.is_Symbol is not True:
             # replace x with an x that has a positive assumption
             xpos = Dummy('x', positive=True, finite=True)
@@ -2956,7 +2977,10 @@ def _expand_hint(expr, hint, deep=True, **hints):
                 sargs.append(arg)
 
             if hit:
-                expr = expr.func(*sargs)
+                if expr.func is Add:
+                    expr = Add.from_terms((a, S.One) for a in sargs)
+                else:
+                    expr = expr.func(*sargs)
 
         if hasattr(expr, hint):
             newexpr = getattr(expr, hint)(**hints)
@@ -3049,9 +3073,9 @@ def _expand_hint_key(hint):
                 coeff %= modulus
 
                 if coeff:
-                    terms.append(coeff*tail)
+                    terms.append((tail, coeff))
 
-            expr = Add(*terms)
+            expr = Add.from_terms(terms)
 
         return expr
 
@@ -3222,6 +3246,9 @@ class AtomicExpr(Atom, Expr):
     For example: Symbol, Number, Rational, Integer, ...
     But not: Add, Mul, Pow, ...
     """
+
+    __slots__ = ()
+
     is_number = False
     is_Atom = True
 
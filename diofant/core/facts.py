@@ -432,8 +432,12 @@ def __init__(self, rules):
                 raise ValueError('unknown op %r' % op)
 
         # --- build deduction networks ---
+        # (beta rules are sorted, so their indices are reproducible)
+        rules_beta = sorted(P.rules_beta,
+                            key=lambda r: (sorted(map(_as_pair, r[0].args)),
+                                           _as_pair(r[1])))
         self.beta_rules = []
-        for bcond, bimpl in P.rules_beta:
+        for bcond, bimpl in rules_beta:
             self.beta_rules.append(
                 ({_as_pair(a) for a in bcond.args}, _as_pair(bimpl)))
 
@@ -443,7 +447,7 @@ def __init__(self, rules):
         # now:
         # - apply beta rules to alpha chains  (static extension), and
         # - further associate beta rules to alpha chain (for inference at runtime)
-        impl_ab = apply_beta_to_alpha_route(impl_a, P.rules_beta)
+        impl_ab = apply_beta_to_alpha_route(impl_a, rules_beta)
 
         # extract defined fact names
         self.defined_facts = {_base_fact(k) for k in impl_ab.keys()}
@@ -465,6 +469,77 @@ def __init__(self, rules):
             prereq[k] |= pitems
         self.prereq = prereq
 
+        self._compile()
+
+    def _compile(self):
+        """Build bitmask tables for :meth:`FactKB.deduce_all_facts`.
+
+        Each defined fact gets a bit, so a set of facts with known values
+        is a pair of integers: masks of true and false facts.
+        """
+        self.fact_order = tuple(sorted(self.defined_facts))
+        bits = {f: 1 << i for i, f in enumerate(self.fact_order)}
+
+        def masks(pairs):
+            true = false = 0
+            for k, v in pairs:
+                if v:
+                    true |= bits[k]
+                else:
+                    false |= bits[k]
+            return true, false
+
+        # (k, v) -> (true mask, false mask, {implied fact: value},
+        #            indices of beta rules to check)
+        self.deduction_table = {}
+        for fact in self.fact_order:
+            for value in (True, False):
+                impl = self.full_implications.get((fact, value), set())
+                impl = impl | {(fact, value)}
+                triggers = tuple(self.beta_triggers.get((fact, value), ()))
+                self.deduction_table[fact, value] = (masks(impl) +
+                                                     (dict(impl), triggers))
+
+        self.beta_masks = [masks(bcond) + (bimpl,)
+                           for bcond, bimpl in self.beta_rules]
+
+        # deterministic order of prerequisites
+        self.prereq_order = {k: tuple(sorted(v))
+                             for k, v in self.prereq.items()}
+
+    def _to_python(self):
+        """Return Python code for tables, see :meth:`_from_python`."""
+        def fmt(s):
+            return '{%s}' % ', '.join(map(repr, sorted(s))) if s else 'set()'
+
+        lines = ['{', "    'defined_facts': %s," % fmt(self.defined_facts),
+                 "    'full_implications': {"]
+        lines.extend('        %r: %s,' % (k, fmt(v))
+                     for k, v in sorted(self.full_implications.items()))
+        lines.extend(['    },', "    'beta_rules': ["])
+        lines.extend('        (%s, %r),' % (fmt(bcond), bimpl)
+                     for bcond, bimpl in self.beta_rules)
+        lines.extend(['    ],', "    'beta_triggers': {"])
+        lines.extend('        %r: %r,' % (k, sorted(v))
+                     for k, v in sorted(self.beta_triggers.items()))
+        lines.extend(['    },', "    'prereq': {"])
+        lines.extend('        %r: %s,' % (k, fmt(v))
+                     for k, v in sorted(self.prereq.items()))
+        lines.extend(['    },', '}'])
+        return '\n'.join(lines)
+
+    @classmethod
+    def _from_python(cls, data):
+        """Create FactRules from tables, generated by :meth:`_to_python`."""
+        self = cls.__new__(cls)
+        self.defined_facts = set(data['defined_facts'])
+        self.full_implications = defaultdict(set, data['full_implications'])
+        self.beta_rules = list(data['beta_rules'])
+        self.beta_triggers = defaultdict(set, data['beta_triggers'])
+        self.prereq = defaultdict(set, data['prereq'])
+        self._compile()
+        return self
+
 
 class InconsistentAssumptions(ValueError):
     def __str__(self):
@@ -475,6 +550,9 @@ def __str__(self):
 class FactKB(dict):
     """
     A simple propositional knowledge base relying on compiled inference rules.
+
+    Known values of defined facts are also kept as a pair of bitmasks
+    (see :meth:`FactRules._compile`), which are used for deduction.
     """
     def __str__(self):
         return '{\n%s}' % ',\n'.join(
@@ -482,6 +560,13 @@ def __str__(self):
 
     def __init__(self, rules):
         self.rules = rules
+        self._true = self._false = 0
+
+    def copy(self):
+        kb = dict.__new__(self.__class__)
+        dict.update(kb, self)
+        kb.__dict__.update(self.__dict__)
+        return kb
 
     def _tell(self, k, v):
         """
@@ -510,9 +595,8 @@ def deduce_all_facts(self, facts):
         """
         # keep frequently used attributes locally, so we'll avoid extra
         # attribute access overhead
-        full_implications = self.rules.full_implications
-        beta_triggers = self.rules.beta_triggers
-        beta_rules = self.rules.beta_rules
+        deduction_table = self.rules.deduction_table
+        beta_masks = self.rules.beta_masks
 
         if isinstance(facts, dict):
             facts = facts.items()
@@ -526,14 +610,26 @@ def deduce_all_facts(self, facts):
                     continue
 
                 # lookup routing tables
-                for key, value in full_implications[k, v]:
-                    self._tell(key, value)
+                try:
+                    true, false, implied, triggers = deduction_table[k, v]
+                except KeyError:
+                    continue  # not a defined fact
+
+                conflict = (true & self._false) | (false & self._true)
+                if conflict:
+                    i = (conflict & -conflict).bit_length() - 1
+                    key = self.rules.fact_order[i]
+                    raise InconsistentAssumptions(self, key, implied[key])
+
+                self._true |= true
+                self._false |= false
+                self.update(implied)
 
-                beta_maytrigger.update(beta_triggers[k, v])
+                beta_maytrigger.update(triggers)
 
             # --- beta chains ---
             facts = []
-            for bidx in beta_maytrigger:
-                bcond, bimpl = beta_rules[bidx]
-                if all(self.get(k) is v for k, v in bcond):
+            for bidx in sorted(beta_maytrigger):
+                true, false, bimpl = beta_masks[bidx]
+                if self._true & true == true and self._false & false == false:
                     facts.append(bimpl)
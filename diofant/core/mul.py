@@ -80,6 +80,8 @@ def _unevaluated_Mul(*args):
 
 class Mul(Expr, AssocOp):
 
+    __slots__ = ()
+
     is_Mul = True
 
     @classmethod
@@ -760,6 +762,10 @@ def _expandsums(sums):
     def _eval_expand_mul(self, **hints):
         from diofant import fraction
 
+        # Nothing to distribute, e.g. a term of an expanded polynomial.
+        if not any(a.is_Add or a.is_Pow and a.base.is_Add for a in self.args):
+            return self
+
         # Handle things like 1/(x*(x + 1)), which are automatically converted
         # to 1/x*1/(x + 1)
         expr = self
@@ -794,7 +800,7 @@ def _eval_expand_mul(self, **hints):
                     if t.is_Mul and any(a.is_Add for a in t.args):
                         t = t._eval_expand_mul()
                     args.append(t)
-                return Add(*args)
+                return Add.from_terms((t, S.One) for t in args)
             else:
                 return plain
 
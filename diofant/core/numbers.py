@@ -17,7 +17,7 @@
 from .singleton import S, Singleton
 from .expr import Expr, AtomicExpr
 from .decorators import _sympifyit
-from .cache import cacheit, clear_cache
+from .cache import cacheit, cache_sort_key, clear_cache
 from .logic import fuzzy_not
 from .compatibility import as_int, HAS_GMPY, DIOFANT_INTS
 import diofant.core.compatibility
@@ -231,6 +231,9 @@ class Number(AtomicExpr):
 
       Rational(1) + sqrt(Rational(2))
     """
+
+    __slots__ = ()
+
     is_commutative = True
     is_number = True
     is_Number = True
@@ -317,10 +320,29 @@ def class_key(cls):
         """Nice order of classes."""
         return 1, 0, 'Number'
 
-    @cacheit
+    @cache_sort_key
     def sort_key(self, order=None):
         """Return a sort key."""
-        return self.class_key(), (0, ()), (), self
+        # Plain Python numbers are compared much faster than Numbers.
+        if self.is_Integer:
+            value = int(self.p)
+        elif self.is_Rational:
+            value = fractions.Fraction(int(self.p), int(self.q))
+        elif (self.is_Float and
+              self._mpf_ not in (_mpf_inf, _mpf_ninf, _mpf_nan) and
+              abs(self._mpf_[2]) < 1 << 16):
+            # Floats with huge exponents aren't converted to fractions.
+            sign, man, exp, _ = self._mpf_
+            man = -int(man) if sign else int(man)
+            value = fractions.Fraction(man << exp if exp >= 0 else man,
+                                       1 if exp >= 0 else 1 << -exp)
+        elif self is S.Infinity:
+            value = math.inf
+        elif self is S.NegativeInfinity:
+            value = -math.inf
+        else:
+            value = self
+        return self.class_key(), (0, ()), (), value
 
     @_sympifyit('other', NotImplemented)
     def __add__(self, other):
@@ -638,6 +660,8 @@ class Float(Number):
 
     """
 
+    __slots__ = ('_mpf_', '_prec')
+
     # A Float represents many real numbers,
     # both rational and irrational.
     is_number = True
@@ -1110,6 +1134,9 @@ class Rational(Number):
     diofant.core.sympify.sympify
     diofant.simplify.simplify.nsimplify
     """
+
+    __slots__ = ('p', 'q')
+
     is_real = True
     is_integer = False
     is_rational = True
@@ -1482,6 +1509,8 @@ def as_content_primitive(self, radical=False):
 
 class Integer(Rational):
 
+    __slots__ = ()
+
     q = 1
     is_integer = True
     is_number = True
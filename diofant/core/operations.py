@@ -18,6 +18,8 @@ class AssocOp(Basic):
     the attribute `identity`.
     """
 
+    __slots__ = ()
+
     @cacheit
     def __new__(cls, *args, **options):
         from diofant import Order
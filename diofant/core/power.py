@@ -155,6 +155,9 @@ class Pow(Expr):
     .. [3] http://en.wikipedia.org/wiki/Indeterminate_forms
 
     """
+
+    __slots__ = ()
+
     is_Pow = True
 
     @cacheit
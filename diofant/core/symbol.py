@@ -7,7 +7,7 @@
 from .sympify import sympify
 from .singleton import S
 from .expr import Expr, AtomicExpr
-from .cache import cacheit
+from .cache import cacheit, cache_sort_key
 from .function import FunctionClass
 from .logic import fuzzy_bool
 from diofant.logic.boolalg import Boolean
@@ -19,6 +19,8 @@ class BaseSymbol(AtomicExpr, Boolean):
     Do not instantiate this, use Symbol, Dummy or Wild.
     """
 
+    __slots__ = ('name',)
+
     is_comparable = False
 
     is_Symbol = True
@@ -116,10 +118,10 @@ def class_key(cls):
         """Nice order of classes."""
         return 2, 0, cls.__name__
 
-    @cacheit
+    @cache_sort_key
     def sort_key(self, order=None):
         """Return a sort key."""
-        return self.class_key(), (1, (str(self),)), S.One.sort_key(), S.One
+        return self.class_key(), (1, (str(self),)), S.One.sort_key(), 1
 
     def as_dummy(self):
         """Return a Dummy having the same name and same assumptions as self."""
@@ -198,6 +200,9 @@ class Symbol(BaseSymbol):
 
     :mod:`diofant.core.assumptions`
     """
+
+    __slots__ = ()
+
     pass
 
 
@@ -221,6 +226,8 @@ class Dummy(BaseSymbol):
     Symbol
     """
 
+    __slots__ = ('dummy_index',)
+
     _count = 0
 
     is_Dummy = True
@@ -244,11 +251,11 @@ def class_key(cls):
         """Nice order of classes."""
         return 3, 0, cls.__name__
 
-    @cacheit
+    @cache_sort_key
     def sort_key(self, order=None):
         """Return a sort key."""
         return self.class_key(), (
-            2, (str(self), self.dummy_index)), S.One.sort_key(), S.One
+            2, (str(self), self.dummy_index)), S.One.sort_key(), 1
 
     def _hashable_content(self):
         return BaseSymbol._hashable_content(self) + (self.dummy_index,)
@@ -324,6 +331,9 @@ class Wild(BaseSymbol):
 
     Symbol
     """
+
+    __slots__ = ('exclude', 'properties')
+
     is_Wild = True
 
     def __new__(cls, name, exclude=(), properties=(), **assumptions):
@@ -1681,6 +1681,11 @@ def test_diofant__integrals__integrals__Integral():
     assert _test_args(Integral(2, (x, 0, 1)))
 
 
+def test_diofant__integrals__meijerint__IsNonPositiveInteger():
+    from diofant.integrals.meijerint import IsNonPositiveInteger
+    assert _test_args(IsNonPositiveInteger(x))
+
+
 def test_diofant__integrals__risch__NonElementaryIntegral():
     from diofant.integrals.risch import NonElementaryIntegral
     assert _test_args(NonElementaryIntegral(exp(-x**2), x))
@@ -6,6 +6,7 @@
                      re, pi, sympify, Add, Mul, Pow, Mod, I, log, S, Max,
                      symbols, oo, Integer, sign, im, nan, Dummy,
                      factorial, comp, O, zoo)
+from diofant.core.evaluate import evaluate
 from diofant.utilities.randtest import verify_numerically
 
 
@@ -1919,3 +1920,31 @@ def test_sympyissue_10728():
     A, B = symbols('A B', commutative=False)
     assert (A + B).is_commutative is None
     assert (A + B).is_zero is None
+
+
+def test_Add_from_terms():
+    assert Add.from_terms({}) == 0
+    assert Add.from_terms({x: 2, x*y: 3, 1: 4}) == 3*x*y + 2*x + 4
+    assert Add.from_terms([(x, 1), (2*x, 3), (x + y, -1)]) == 6*x - y
+    assert Add.from_terms([(x, 1), (-x, 1)]) == 0
+    assert Add.from_terms([(x, y), (x*y, 2)]) == 3*x*y
+    assert Add.from_terms([(x, Rational(1, 2)), (x, 0.5)]) == 1.0*x
+    assert Add.from_terms([(x, 2), (2, 3)]).args == (6, 2*x)
+
+    # fallback to Add
+    assert Add.from_terms([(x, 1), (oo, 1)]) == x + oo
+    assert Add.from_terms([(x, oo), (x, 1)]) == oo*x
+    assert Add.from_terms([(zoo, 1), (zoo, 1)]) is nan
+    assert Add.from_terms([(O(x), 1), (x**2, 1), (1, 1)]) == 1 + O(x)
+    A, B = symbols('A B', commutative=False)
+    assert Add.from_terms([(A*B, 2), (B*A, 1)]) == 2*A*B + B*A
+
+    terms = [(x**i*y**(10 - i), i) for i in range(11)]
+    assert Add.from_terms(terms) == Add(*[c*t for t, c in terms])
+
+    # evaluation is disabled
+    with evaluate(False):
+        e = Add.from_terms([(x*y, 1), (x*y, 2), (x, 1)])
+        assert e.args == (x*y, Mul(2, x*y), x)
+        e = Add(x*(y + 1), x*(y + 1)).expand()
+    assert len(e.args) == 2 and e.args[0] == e.args[1]
@@ -3,6 +3,8 @@
 from diofant import I, sqrt, log, exp, sin, asin
 from diofant.core import (Symbol, S, Rational, Integer, Dummy,
                           Wild, Pow, Float, Mod, pi)
+from diofant.core.assumptions import (_assume_rules, get_assumptions,
+                                      _generate_assumption_rules)
 from diofant.core.facts import InconsistentAssumptions
 from diofant import simplify
 
@@ -905,3 +907,17 @@ def test_sympyissue_9165():
 def test_sympyissue_10024():
     x = Dummy('x')
     assert Mod(x, 2*pi).is_zero is None
+
+
+def test_generated_rules():
+    assert (_assume_rules._to_python() ==
+            _generate_assumption_rules()._to_python())
+
+
+def test_get_assumptions():
+    x = Symbol('x', positive=True)
+    assert get_assumptions(x + 1, 'zero', 'nonnegative') == {'zero': False,
+                                                             'nonnegative': True}
+    assert get_assumptions(pi) == {k: getattr(pi, 'is_' + k)
+                                   for k in _assume_rules.defined_facts}
+    assert get_assumptions(x, 'spam') == {'spam': None}
@@ -3,11 +3,17 @@
 
 import pytest
 
-from diofant.core.basic import Basic, Atom, preorder_traversal
+import gc
+import pickle
+import weakref
+
+from diofant.core import basic
+from diofant.core.basic import (Basic, Atom, preorder_traversal, intern,
+                                set_interning, bulk_xreplace)
 from diofant.core.singleton import S, Singleton
 from diofant.core.symbol import symbols
 from diofant.core.compatibility import default_sort_key
-from diofant import sin, cos, Lambda
+from diofant import sin, cos, Lambda, Float, Integer, Rational, Pow
 
 
 b1 = Basic()
@@ -203,3 +209,82 @@ def test_literal_evalf_is_number_is_zero_is_comparable():
     n = sin(1)**2 + cos(1)**2 - 1
     assert n.is_comparable is not True
     assert n.n(2).is_comparable is not True
+
+
+def test_intern():
+    old = set_interning(False)
+    try:
+        a, b = Basic(b1, b2), Basic(b1, b2)
+        assert a is not b
+        c = intern(a)
+        assert c is a and intern(b) is a
+        assert intern(Basic(Basic(), b2)) is a
+        assert intern(Basic(b2, b1)) is not a
+        assert intern(1) == 1
+
+        # interned arguments of interned instances
+        d = Basic(Basic(b2), Basic(Basic(b2)))
+        assert intern(d) is d
+        assert d.args[0] is intern(Basic(b2))
+
+        # instances with equal, but not identical content are distinct
+        x = symbols('x')
+        assert intern(Basic(S.One, x)) is not intern(Basic(Float(1), x))
+
+        # weak references
+        e = intern(Basic(b3, b3, b3, b3))
+        n = len(basic._intern_table)
+        r = weakref.ref(e)
+        del e
+        gc.collect()
+        assert r() is None
+        assert len(basic._intern_table) < n
+
+        assert set_interning() is False
+        assert set_interning() is True
+        assert Basic(b3, b2) is Basic(b3, b2)
+        assert sin(x + 1) is sin(1 + x)
+        set_interning(False)
+        assert Basic(b3, b2) is not Basic(b3, b2)
+    finally:
+        set_interning(old)
+
+
+def test_slots():
+    x = symbols('x', positive=True)
+    for e in [b21, Atom(), x, Integer(7), Rational(1, 3), Float(1.5), x + 1,
+              2*x, x**2]:
+        assert not hasattr(e, '__dict__')
+        assert pickle.loads(pickle.dumps(e)) == e
+    assert pickle.loads(pickle.dumps(x)).is_positive is True
+    assert weakref.ref(x)() is x
+    pytest.raises(AttributeError, lambda: setattr(x, 'spam', 1))
+
+
+def test_bulk_xreplace():
+    x = symbols('x')
+    r = bulk_xreplace([b21, b2, x], {b1: x})
+    assert r == [Basic(Basic(x), x), Basic(x), x]
+    assert r[0].args[0] is r[1]
+    assert bulk_xreplace((b21, b2), {}) == [b21, b2]
+
+
+def test_deep_and_shared():
+    x, y, z = symbols('x y z')
+
+    # deeper than the recursion limit
+    e = x
+    for i in range(2000):
+        e = Pow(e, 2, evaluate=False)
+    assert e.has(x) and not e.has(y)
+    for r in [e.xreplace({x: y}), e.subs(x, y)]:
+        assert r.has(y) and not r.has(x)
+
+    # 2**40 paths, but only 41 distinct nodes
+    d = x
+    for i in range(40):
+        d = Basic(d, d)
+    assert d.has(x) and not d.has(y)
+    for r, s in [(d.xreplace({x: y}), y), (d.subs(x, z), z)]:
+        assert r.has(s) and not r.has(x)
+        assert r.args[0] is r.args[1]
@@ -106,6 +106,11 @@ def test_nocache(clear_imports, monkeypatch):
     g = sinh(x)
     r = f*g  # not raises
 
+    # monomials of Risch towers aren't shared
+    from diofant.integrals.risch import DifferentialExtension, towers
+    DifferentialExtension(x*exp(x), x)
+    assert not towers.monomials
+
 
 def test_sympyissue_8825():
     import weakref
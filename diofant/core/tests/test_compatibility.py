@@ -2,9 +2,10 @@
 
 from diofant.core.compatibility import (default_sort_key, as_int, ordered,
                                         iterable)
+from diofant.core.numbers import Float, Rational, oo
 from diofant.core.singleton import S
 
-from diofant.abc import x
+from diofant.abc import x, y
 
 
 def test_default_sort_key():
@@ -12,6 +13,16 @@ def func(x):
         return x
     assert sorted([func, x, func], key=default_sort_key) == [func, func, x]
 
+    assert (sorted([oo, Float(0.5), Rational(1, 3), -oo, 2, S.Zero],
+                   key=default_sort_key) ==
+            [-oo, 0, Rational(1, 3), Float(0.5), 2, oo])
+
+    # sort keys are cached
+    e = x*y + 2
+    assert e.sort_key() is e.sort_key()
+    assert default_sort_key(e) == e.sort_key()
+    assert e.as_ordered_terms() == [x*y, 2]
+
 
 def test_as_int():
     pytest.raises(ValueError, lambda: as_int(1.1))
@@ -0,0 +1,60 @@
+import pytest
+
+from diofant import deadline, DeadlineExceeded, groebner, simplify, sin, cos
+from diofant.core.deadline import check_deadline, get_deadline
+
+from diofant.abc import x, y, z
+
+
+def test_deadline():
+    check_deadline('nowhere')
+
+    with deadline(None) as d:
+        assert d is None
+        check_deadline('nowhere')
+
+    with deadline(100) as d:
+        assert get_deadline() is d
+        assert 0 < d.remaining() <= 100
+        check_deadline('loop', step=1)
+
+    with pytest.raises(DeadlineExceeded) as exc:
+        with deadline(0) as d:
+            check_deadline('loop', step=1, total=2)
+    assert exc.value.deadline is d
+    assert exc.value.where == 'loop'
+    assert exc.value.progress == {'step': 1, 'total': 2}
+    assert exc.value.elapsed >= 0
+    assert str(exc.value).startswith('deadline exceeded in loop after ')
+    assert str(exc.value).endswith(' (step=1, total=2)')
+
+    # nested deadlines can't extend outer ones
+    with pytest.raises(DeadlineExceeded) as exc:
+        with deadline(0) as outer:
+            with deadline(100) as inner:
+                assert inner.expires == outer.expires
+                check_deadline('loop')
+    assert exc.value.deadline is outer
+
+    with pytest.raises(DeadlineExceeded) as exc:
+        with deadline(100):
+            with deadline(0) as inner:
+                check_deadline('loop')
+    assert exc.value.deadline is inner
+
+    check_deadline('nowhere')
+    assert get_deadline() is None
+
+
+def test_checkpoints():
+    with pytest.raises(DeadlineExceeded) as exc:
+        with deadline(0):
+            groebner([x**2 + y*z, x*y - z, y**3 - x], x, y, z)
+    assert exc.value.where == '_buchberger'
+    assert set(exc.value.progress) == {'basis', 'pairs', 'reductions_to_zero'}
+
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0):
+            simplify(sin(x)**2 + cos(x)**2)
+
+    assert simplify(sin(x)**2 + cos(x)**2) == 1
@@ -7,7 +7,7 @@
                      integrate, log, Mul, N, oo, pi, Pow, product, Product,
                      Rational, S, Sum, sin, sqrt, sstr, sympify, Symbol, Float)
 from diofant.core.evalf import (complex_accuracy, PrecisionExhausted,
-                                scaled_zero, as_mpmath)
+                                scaled_zero, as_mpmath, EvalfPlan)
 
 from diofant.abc import n, x, y
 
@@ -496,3 +496,30 @@ def test_sympyissue_9326():
     d2 = Dummy('d')
     e = d1 + d2
     assert e.evalf(subs={d1: 1, d2: 2}) == 3
+
+
+def test_EvalfPlan():
+    plan = EvalfPlan((x + 1)**2 - x**2 - 2*x)
+    assert plan(10**20) == 1
+    assert plan(10**30) == 1
+    assert plan(Rational(1, 3))._prec == 53
+
+    e = sin(x) + y*pi + sqrt(x*y)
+    plan = EvalfPlan(e, [x, y], n=30)
+    for a, b in [(2, Rational(1, 3)), (0.5, 7), (-1, 2)]:
+        r = plan(a, b)
+        assert abs(r - e.evalf(30, subs={x: a, y: b})) < 1e-29
+    assert plan.symbols == (x, y)
+    pytest.raises(TypeError, lambda: plan(1))
+
+    # fallback to evalf
+    from diofant import gamma
+    plan = EvalfPlan(gamma(x) + x)
+    assert abs(plan(5) - 29) < 1e-13
+
+    plan = EvalfPlan(exp(I*x))
+    assert abs(plan(pi) + 1) < 1e-14
+
+    plan = EvalfPlan(exp(x) - exp(x + Rational(1, 10**120)), maxn=50,
+                     strict=True)
+    pytest.raises(PrecisionExhausted, lambda: plan(0))
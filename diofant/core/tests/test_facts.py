@@ -337,3 +337,23 @@ def test_inconsistent_assumptions():
         kb.deduce_all_facts({'pos': T, 'npos': T})
     assert str(err.value) in ['{\n\tnpos: False,\n\tpos: True}, npos=True',
                               '{\n\tnpos: True,\n\tpos: False}, pos=True']
+
+
+def test_FactKB_copy():
+    kb = FactKB(FactRules(['a -> b', 'b -> c']))
+    kb.deduce_all_facts({'b': T})
+    kb2 = kb.copy()
+    assert type(kb2) is FactKB and kb2 == kb
+    kb2.deduce_all_facts({'a': T})
+    assert kb == {'b': T, 'c': T}
+    assert kb2 == {'a': T, 'b': T, 'c': T}
+    pytest.raises(InconsistentAssumptions,
+                  lambda: kb2.deduce_all_facts({'c': F}))
+
+
+def test_FactRules_generated():
+    f = FactRules(['real == neg | zero | pos', 'pos -> ~neg'])
+    g = FactRules._from_python(eval(f._to_python()))
+    assert g._to_python() == f._to_python()
+    assert g.deduction_table == f.deduction_table
+    assert g.beta_masks == f.beta_masks
@@ -87,6 +87,18 @@ def runtest_ufuncify(language, backend):
     numpy.testing.assert_allclose(facb(grid, c, b), expected)
 
 
+def runtest_ufuncify_multioutput(language, backend):
+    a, b = symbols('a b')
+    f = ufuncify((a, b), (diofant.sin(a + b), diofant.cos(a + b)),
+                 backend=backend, openmp=True)
+    grid = numpy.linspace(-2, 2, 5000)
+    r = f(grid, 1.0)
+    numpy.testing.assert_allclose(r[0], numpy.sin(grid + 1))
+    numpy.testing.assert_allclose(r[1], numpy.cos(grid + 1))
+    r = f(grid[::2], 1.0)  # non-contiguous input
+    numpy.testing.assert_allclose(r[0], numpy.sin(grid[::2] + 1))
+
+
 def runtest_issue_10274(language, backend):
     expr = (a - b + c)**(13)
     tmp = tempfile.mkdtemp()
@@ -194,3 +206,8 @@ def test_ufuncify_numpy():
     # This test doesn't use Cython, but if Cython works, then there is a valid
     # C compiler, which is needed.
     runtest_ufuncify('C', 'numpy')
+
+
+@pytest.mark.skipif(Cython is None, reason="Couldn't import Cython.")
+def test_ufuncify_multioutput_numpy():
+    runtest_ufuncify_multioutput('C', 'numpy')
@@ -20,9 +20,15 @@
 from diofant.polys.monomials import itermonomials
 from diofant.polys.polyroots import root_factors
 from diofant.polys.rings import PolyRing
-from diofant.polys.solvers import solve_lin_sys
+from diofant.polys.solvers import (lin_sys_consistent_mod,
+                                   solve_sparse_lin_sys)
 from diofant.polys.constructor import construct_domain
 from diofant.core.compatibility import ordered
+from diofant.core.deadline import check_deadline
+
+
+#: Prime modulus of the consistency check for linear systems.
+_prime = 2147483647
 
 
 def components(f, x):
@@ -352,6 +358,8 @@ def _substitute(expr):
         return expr.subs(mapping)
 
     for mapping in mappings:
+        check_deadline('heurisch', terms=len(terms), retries=retries)
+
         mapping = list(mapping)
         mapping = mapping + unnecessary_permutations
         diffs = [ _substitute(cancel(g.diff(x))) for g in terms ]
@@ -482,6 +490,9 @@ def _exponent(g):
                 reducibles.add(factorization)
 
     def _integrate(field=None):
+        check_deadline('heurisch', terms=len(terms), retries=retries,
+                       coefficients=len(poly_coeffs))
+
         irreducibles = set()
 
         for poly in reducibles:
@@ -540,12 +551,31 @@ def find_non_syms(expr):
         else:
             ground, _ = construct_domain(non_syms, field=True)
 
+        # The numerator is linear in poly_coeffs, its coefficients (as a
+        # polynomial in V) are sparse rows of the linear system.
         coeff_ring = PolyRing(poly_coeffs, ground)
-        ring = PolyRing(V, coeff_ring)
+        ring = PolyRing(V + poly_coeffs, ground)
 
         numer = ring.from_expr(raw_numer)
 
-        solution = solve_lin_sys(numer.coeffs(), coeff_ring)
+        n, m = len(V), len(poly_coeffs)
+        rows = {}
+        for monom, coeff in numer.terms():
+            row = rows.setdefault(monom[:n], {})
+            monom = monom[n:]
+            if not any(monom):
+                row[m] = -coeff
+            else:
+                row[monom.index(1)] = coeff
+        rows = list(rows.values())
+
+        # Inconsistent systems are common, they are rejected (with high
+        # probability) by a cheap check modulo a large prime.
+        if (ground.is_RationalField and
+                lin_sys_consistent_mod(rows, m + 1, ground, _prime) is False):
+            return
+
+        solution = solve_sparse_lin_sys(rows, coeff_ring)
 
         if solution is None:
             return
@@ -1,8 +1,14 @@
+import time
+
+from cachetools import LRUCache
+
 from diofant.concrete.expr_with_limits import AddWithLimits
 from diofant.core.add import Add
 from diofant.core.basic import Basic
+from diofant.core.cache import CACHE, USE_CACHE
 from diofant.core.compatibility import is_sequence
 from diofant.core.containers import Tuple
+from diofant.core.deadline import deadline, DeadlineExceeded
 from diofant.core.expr import Expr
 from diofant.core.function import diff
 from diofant.core.numbers import oo
@@ -13,6 +19,7 @@
 from diofant.integrals.trigonometry import trigintegrate
 from diofant.integrals.meijerint import meijerint_definite, meijerint_indefinite
 from diofant.utilities.misc import filldedent
+from diofant.utilities.racing import get_racing, race
 from diofant.polys import Poly, PolynomialError
 from diofant.functions import Piecewise, sqrt, sign, piecewise_fold
 from diofant.functions.elementary.exponential import log
@@ -21,6 +28,165 @@
 from diofant.matrices import MatrixBase
 
 
+class StrategyProfiler:
+    """Timing counters, time budgets and results of integration strategies.
+
+    Strategies, tried by :meth:`Integral._eval_integral`, are run with
+    :meth:`run`, which counts calls and successful calls and measures the
+    time spent in every strategy (including time of nested integrations).
+    Results, including failures, are cached for integrands, that are equal
+    up to renaming of the integration variable.
+
+    A strategy can be given a time budget (in seconds).  Once the total
+    time spent in it exceeds the budget, a running strategy is cut off
+    (see :func:`~diofant.core.deadline.deadline`) and further calls are
+    skipped.
+
+    Examples
+    ========
+
+    >>> from diofant import exp, integrate
+    >>> from diofant.abc import x, y
+    >>> from diofant.integrals.integrals import profiler
+
+    >>> profiler.reset()
+    >>> integrate(x*exp(x), x)
+    E**x*(x - 1)
+    >>> profiler.stats['risch']['successes']
+    1
+    >>> integrate(y*exp(y), y)
+    E**y*(y - 1)
+    >>> profiler.stats['risch']['calls']
+    1
+
+    >>> profiler.set_budget('heurisch', 10)
+    >>> profiler.set_budget('heurisch', None)
+    """
+
+    def __init__(self, maxsize=1000):
+        self.stats = {}
+        self.budgets = {}
+        self.cache = LRUCache(maxsize=maxsize)
+        self.skipped = 0
+        self._symbols = {}
+        if USE_CACHE:
+            CACHE.append((self, self.cache))
+
+    def reset(self):
+        """Reset counters and clear cached results."""
+        self.stats.clear()
+        self.cache.clear()
+
+    def set_budget(self, strategy, seconds):
+        """Set the time budget for ``strategy``, ``None`` removes it."""
+        if seconds is None:
+            self.budgets.pop(strategy, None)
+        else:
+            self.budgets[strategy] = seconds
+
+    def canonical_key(self, f, x, *options):
+        """Return cache key of ``f`` (up to renaming of ``x``) and the
+        canonical integration variable or ``(None, None)`` if the result
+        for ``f`` can't be cached."""
+        if (not USE_CACHE or not isinstance(f, Expr) or isinstance(f, Poly) or
+                not isinstance(x, Symbol) or f.has(Order)):
+            return None, None
+        assumptions = x._assumptions.generator
+        k = tuple(sorted(assumptions.items()))
+        try:
+            d = self._symbols[k]
+        except KeyError:
+            d = self._symbols[k] = Dummy('x', **assumptions)
+        # d is a part of the key, as f may not depend on x
+        return (f.xreplace({x: d}), d) + options, d
+
+    def cached(self, key, d, x):
+        """Return cached result for ``key`` with ``d`` renamed to ``x``.
+
+        Raises KeyError if there is no cached result.
+        """
+        r = self.cache[key]
+        return _rename(r, d, x)
+
+    def store(self, key, d, x, result, skipped):
+        """Cache ``result``, unless strategies were skipped since the
+        ``skipped`` count was taken."""
+        if key is not None and self.skipped == skipped:
+            self.cache[key] = _rename(result, x, d)
+
+    def run(self, strategy, func, f, x, *args, **kwargs):
+        """Return ``func(f, x, *args, **kwargs)`` or ``None`` on failure.
+
+        NotImplementedError and PolynomialError are counted as failures.
+        """
+        counters = self.stats.setdefault(strategy, {'calls': 0,
+                                                    'successes': 0,
+                                                    'skipped': 0,
+                                                    'time': 0.0})
+        options = tuple((k, tuple(v) if isinstance(v, list) else v)
+                        for k, v in sorted(kwargs.items()))
+        key, d = self.canonical_key(f, x, strategy, args, options)
+        if key is not None:
+            try:
+                return self.cached(key, d, x)
+            except KeyError:
+                pass
+        budget = self.budgets.get(strategy)
+        if budget is not None and counters['time'] >= budget:
+            counters['skipped'] += 1
+            self.skipped += 1
+            return
+        skipped = self.skipped
+        start = time.perf_counter()
+        try:
+            if budget is not None:
+                budget -= counters['time']
+            with deadline(budget) as limit:
+                result = func(f, x, *args, **kwargs)
+        except (NotImplementedError, PolynomialError):
+            result = None
+        except DeadlineExceeded as exc:
+            if exc.deadline is not limit:
+                raise
+            counters['skipped'] += 1
+            self.skipped += 1
+            result = None
+        finally:
+            counters['time'] += time.perf_counter() - start
+            counters['calls'] += 1
+        if result is not None:
+            counters['successes'] += 1
+        self.store(key, d, x, result, skipped)
+        return result
+
+    def __str__(self):
+        return '%s(budgets=%s)' % (self.__class__.__name__, self.budgets)
+
+
+def _rename(r, old, new):
+    if r is None:
+        return
+    elif isinstance(r, tuple):
+        return tuple(_rename(_, old, new) for _ in r)
+    return sympify(r).xreplace({old: new})
+
+
+def _race_integrate(integral, f, x, meijerg, risch, conds, strict=True):
+    """Integrate ``f`` in a worker of :func:`~diofant.utilities.racing.race`.
+
+    With ``strict``, results with unevaluated integrals are failures.
+    """
+    result = integral._integrate(f, x, meijerg=meijerg, risch=risch,
+                                 conds=conds)
+    if strict and result is not None and result.has(Integral):
+        return
+    return result
+
+
+#: Default profiler of integration strategies.
+profiler = StrategyProfiler()
+
+
 class Integral(AddWithLimits):
     """Represents unevaluated integral."""
 
@@ -710,17 +876,35 @@ def _eval_integral(self, f, x, meijerg=None, risch=None,
              integrals that can only be computed using this method.  The goal
              is to implement enough of the Risch and Meijer G-function methods
              so that this can be deleted.
+
+        With racing enabled (see :mod:`~diofant.utilities.racing`), the full
+        Risch algorithm, the Meijer G-Function algorithm, heuristics
+        (including the Heuristic Risch algorithm) and the default sequence
+        of algorithms above are run concurrently in worker processes and
+        the first result is returned (partial results, with unevaluated
+        integrals, are accepted only from the default sequence).
         """
+        key, d = profiler.canonical_key(f, x, 'integrate',
+                                        meijerg, risch, conds)
+        if key is not None:
+            try:
+                return profiler.cached(key, d, x)
+            except KeyError:
+                pass
+        skipped = profiler.skipped
+        result = self._integrate(f, x, meijerg=meijerg, risch=risch,
+                                 conds=conds)
+        profiler.store(key, d, x, result, skipped)
+        return result
+
+    def _integrate(self, f, x, meijerg=None, risch=None, conds='piecewise'):
         from diofant.integrals.deltafunctions import deltaintegrate
         from diofant.integrals.heurisch import heurisch, heurisch_wrapper
         from diofant.integrals.rationaltools import ratint
         from diofant.integrals.risch import risch_integrate
 
         if risch:
-            try:
-                return risch_integrate(f, x, conds=conds)
-            except NotImplementedError:
-                return
+            return profiler.run('risch', risch_integrate, f, x, conds=conds)
 
         # if it is a poly(x) then let the polynomial integrate itself (fast)
         #
@@ -745,12 +929,23 @@ def _eval_integral(self, f, x, meijerg=None, risch=None,
         if poly is not None and not meijerg:
             return poly.integrate().as_expr()
 
+        if risch is None and meijerg is None and get_racing():
+            # the default sequence of strategies gives a fallback result
+            r = race([('risch', _race_integrate,
+                       (self, f, x, None, True, conds), {}),
+                      ('meijerint', _race_integrate,
+                       (self, f, x, True, False, conds), {}),
+                      ('heurisch', _race_integrate,
+                       (self, f, x, False, False, conds), {}),
+                      ('default', _race_integrate,
+                       (self, f, x, None, None, conds), {'strict': False})])
+            return r[1] if r else None
+
         if risch is not False:
-            try:
-                result, i = risch_integrate(f, x, separate_integral=True, conds=conds)
-            except NotImplementedError:
-                pass
-            else:
+            r = profiler.run('risch', risch_integrate, f, x,
+                             separate_integral=True, conds=conds)
+            if r is not None:
+                result, i = r
                 if i:
                     # There was a nonelementary integral. Try integrating it.
                     return result + i.doit(risch=False)
@@ -818,57 +1013,51 @@ def _eval_integral(self, f, x, meijerg=None, risch=None,
             # g(x) = -------
             #        poly(x)
             if g.is_rational_function(x) and not meijerg:
-                parts.append(coeff * ratint(g, x))
-                continue
+                h = profiler.run('ratint', ratint, g, x)
+                if h is not None:
+                    parts.append(coeff * h)
+                    continue
 
             if not meijerg:
                 # g(x) = Mul(trig)
-                h = trigintegrate(g, x, conds=conds)
+                h = profiler.run('trigintegrate', trigintegrate, g, x,
+                                 conds=conds)
                 if h is not None:
                     parts.append(coeff * h)
                     continue
 
                 # g(x) has at least a DiracDelta term
-                h = deltaintegrate(g, x)
+                h = profiler.run('deltaintegrate', deltaintegrate, g, x)
                 if h is not None:
                     parts.append(coeff * h)
                     continue
 
                 # Try risch again.
                 if risch is not False:
-                    try:
-                        h, i = risch_integrate(g, x, separate_integral=True, conds=conds)
-                    except NotImplementedError:
-                        h = None
-                    else:
+                    r = profiler.run('risch', risch_integrate, g, x,
+                                     separate_integral=True, conds=conds)
+                    if r is not None:
+                        h, i = r
                         if i:
                             h = h + i.doit(risch=False)
 
                         parts.append(coeff*h)
                         continue
 
-                # fall back to heurisch
-                try:
-                    if conds == 'piecewise':
-                        h = heurisch_wrapper(g, x, hints=[])
-                    else:
-                        h = heurisch(g, x, hints=[])
-                except PolynomialError:
-                    # XXX: this exception means there is a bug in the
-                    # implementation of heuristic Risch integration
-                    # algorithm.
-                    h = None
+                # fall back to heurisch; PolynomialError from it means
+                # there is a bug in the implementation of heuristic Risch
+                # integration algorithm, it's counted as a failure.
+                if conds == 'piecewise':
+                    h = profiler.run('heurisch', heurisch_wrapper, g, x,
+                                     hints=[])
+                else:
+                    h = profiler.run('heurisch', heurisch, g, x, hints=[])
             else:
                 h = None
 
             if meijerg is not False and h is None:
                 # rewrite using G functions
-                try:
-                    h = meijerint_indefinite(g, x)
-                except NotImplementedError:
-                    from diofant.integrals.meijerint import _debug
-                    _debug('NotImplementedError from meijerint_definite')
-                    res = None
+                h = profiler.run('meijerint', meijerint_indefinite, g, x)
                 if h is not None:
                     parts.append(coeff * h)
                     continue
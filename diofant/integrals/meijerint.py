@@ -26,15 +26,19 @@
     Gordon and Breach Science Publisher
 """
 
+import sys
+
 from diofant.core import oo, S, pi, Expr, Pow, sympify
 from diofant.core.exprtools import factor_terms
-from diofant.core.function import expand, expand_mul, expand_power_base
+from diofant.core.function import (expand, expand_mul, expand_power_base,
+                                   Function)
 from diofant.core.add import Add
 from diofant.core.mul import Mul
 from diofant.core.numbers import Integer, Rational
 from diofant.core.cache import cacheit
 from diofant.core.symbol import Dummy, Wild
 from diofant.core.compatibility import ordered
+from diofant.core.deadline import check_deadline
 from diofant.simplify import hyperexpand, powdenest, collect
 from diofant.logic.boolalg import And, Or, BooleanAtom
 from diofant.functions.special.delta_functions import Heaviside
@@ -45,6 +49,7 @@
 from diofant.utilities.iterables import multiset_partitions
 from diofant.utilities.misc import debug as _debug
 from diofant.utilities import default_sort_key
+from diofant.utilities.tables import cached_table
 
 # keep this at top for easy reference
 z = Dummy('z')
@@ -59,12 +64,51 @@ def _has(res, *f):
     return res.has(*f)
 
 
+def _is_positive_integer(x):
+    return x.is_Integer and x > 0
+
+
+# Functions, used in the lookup table, are defined at the module level,
+# so the table can be serialized (see _rewrite_single()).
+
+class IsNonPositiveInteger(Function):
+
+    @classmethod
+    def eval(cls, arg):
+        from diofant import unpolarify
+        arg = unpolarify(arg)
+        if arg.is_Integer is True:
+            return arg <= 0
+
+
+_n = Wild('n', properties=[_is_positive_integer])
+_t = Wild('p', exclude=[z])*z**Wild('q', exclude=[z])
+
+
+def _make_log1(subs):
+    from diofant import factorial
+    N = subs[_n]
+    return [((-1)**N*factorial(N),
+             meijerg([], [1]*(N + 1), [0]*(N + 1), [], _t))]
+
+
+def _make_log2(subs):
+    from diofant import factorial
+    N = subs[_n]
+    return [(factorial(N),
+             meijerg([1]*(N + 1), [], [], [0]*(N + 1), _t))]
+
+
+def _make_log3(subs):
+    return _make_log1(subs) + _make_log2(subs)
+
+
 def _create_lookup_table(table):
     """ Add formulae for the function -> meijerg lookup table. """
     def wild(n):
         return Wild(n, exclude=[z])
     p, q, a, b, c = list(map(wild, 'pqabc'))
-    n = Wild('n', properties=[lambda x: x.is_Integer and x > 0])
+    n = _n
     t = p*z**q
 
     def add(formula, an, ap, bm, bq, arg=t, fac=Integer(1), cond=True, hint=True):
@@ -82,19 +126,11 @@ def constant(a):
 
     # [P], Section 8.
 
-    from diofant import unpolarify, Function, Not
-
-    class IsNonPositiveInteger(Function):
-
-        @classmethod
-        def eval(cls, arg):
-            arg = unpolarify(arg)
-            if arg.is_Integer is True:
-                return arg <= 0
+    from diofant import Not
 
     # Section 8.4.2
     from diofant import (gamma, pi, cos, exp, re, sin, sqrt, sinh, cosh,
-                       factorial, log, erf, erfc, erfi, polar_lift)
+                       log, erf, erfc, erfi, polar_lift)
     # TODO this needs more polar_lift (c/f entry for exp)
     add(Heaviside(t - b)*(t - b)**(a - 1), [a], [], [], [0], t/b,
         gamma(a)*b**(a - 1), And(b > 0))
@@ -154,24 +190,12 @@ def tmpadd(r, sgn):
     add(cos(t), [], [], [0], [Rational(1, 2)], t**2/4, sqrt(pi))
 
     # Section 8.5.5
-    def make_log1(subs):
-        N = subs[n]
-        return [((-1)**N*factorial(N),
-                 meijerg([], [1]*(N + 1), [0]*(N + 1), [], t))]
-
-    def make_log2(subs):
-        N = subs[n]
-        return [(factorial(N),
-                 meijerg([1]*(N + 1), [], [], [0]*(N + 1), t))]
     # TODO these only hold for positive p, and can be made more general
     #      but who uses log(x)*Heaviside(a-x) anyway ...
     # TODO also it would be nice to derive them recursively ...
-    addi(log(t)**n*Heaviside(1 - t), make_log1, True)
-    addi(log(t)**n*Heaviside(t - 1), make_log2, True)
-
-    def make_log3(subs):
-        return make_log1(subs) + make_log2(subs)
-    addi(log(t)**n, make_log3, True)
+    addi(log(t)**n*Heaviside(1 - t), _make_log1, True)
+    addi(log(t)**n*Heaviside(t - 1), _make_log2, True)
+    addi(log(t)**n, _make_log3, True)
     addi(log(t + a),
          constant(log(a)) + [(Integer(1), meijerg([1, 1], [], [1], [0], t/a))],
          True)
@@ -363,7 +387,6 @@ def _exponents_(expr, x, res):
 
 def _functions(expr, x):
     """ Find the types of functions in expr, to estimate the complexity. """
-    from diofant import Function
     return ({e.func for e in expr.atoms(Function) if x in e.free_symbols} |
             {e.func for e in expr.atoms(Pow) if e.base is S.Exp1 and x in e.free_symbols})
 
@@ -1404,6 +1427,12 @@ def _int_inversion(g, x, t):
 _lookup_table = None
 
 
+def _build_lookup_table():
+    table = {}
+    _create_lookup_table(table)
+    return table
+
+
 @cacheit
 def _rewrite_single(f, x, recursive=True):
     """
@@ -1416,9 +1445,9 @@ def _rewrite_single(f, x, recursive=True):
     """
     from diofant import polarify, unpolarify, oo, zoo, Tuple
     global _lookup_table
-    if not _lookup_table:
-        _lookup_table = {}
-        _create_lookup_table(_lookup_table)
+    if _lookup_table is None:
+        _lookup_table = cached_table('meijerint', _build_lookup_table,
+                                     [sys.modules[__name__]], [z])
 
     if isinstance(f, meijerg):
         from diofant import factor
@@ -1438,7 +1467,9 @@ def _rewrite_single(f, x, recursive=True):
     t = _mytype(f, z)
     if t in _lookup_table:
         l = _lookup_table[t]
-        for formula, terms, cond, hint in l:
+        for i, (formula, terms, cond, hint) in enumerate(l):
+            check_deadline('meijerint', formula=i, formulas=len(l))
+
             subs = f.match(formula)
             if subs:
                 subs_ = {}
@@ -1585,6 +1616,8 @@ def _rewrite2(f, x):
 
     for recursive in [False, True]:
         for fac1, fac2 in l:
+            check_deadline('meijerint', recursive=recursive)
+
             g1 = _rewrite_single(fac1, x, recursive)
             g2 = _rewrite_single(fac2, x, recursive)
             if g1 and g2:
@@ -26,7 +26,10 @@
 
 from functools import reduce
 
+from cachetools import LRUCache
+
 from diofant import real_roots, sympify, default_sort_key
+from diofant.core.cache import CACHE, USE_CACHE
 from diofant.core.function import Lambda
 from diofant.core.numbers import ilcm, oo, Integer
 from diofant.core.mul import Mul
@@ -112,6 +115,83 @@ def integer_powers(exprs):
     return sorted(iter(newterms.items()), key=lambda item: item[0].sort_key())
 
 
+class TowerCache:
+    """Memoized monomials, derivations and conversions of Risch towers.
+
+    Monomials, added by :class:`DifferentialExtension` to a tower, are
+    keyed by their generating functions (e.g. ``exp(x)`` over ``QQ(x)``),
+    so extensions, built for different integrands over the same tower
+    (e.g. for a batch of integrands in ``exp(x)`` and ``log(x)``), share
+    the same variables and derivations.  Derivations of polynomials (see
+    :func:`derivation`) and other pure computations over a tower are
+    memoized with :meth:`memoize`, keyed by the variables of the tower.
+
+    Examples
+    ========
+
+    >>> from diofant import exp
+    >>> from diofant.abc import x
+    >>> from diofant.integrals.risch import DifferentialExtension, towers
+
+    >>> DE1 = DifferentialExtension(x*exp(x), x)
+    >>> DE2 = DifferentialExtension(x**2*exp(x) + exp(x), x)
+    >>> DE1.T == DE2.T and DE1.D == DE2.D
+    True
+    """
+
+    def __init__(self, maxsize=10000):
+        self.monomials = LRUCache(maxsize=maxsize)
+        self.results = LRUCache(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+        if USE_CACHE:
+            CACHE.append((self, self.monomials))
+            CACHE.append((self, self.results))
+
+    def clear(self):
+        """Clear memoized data and counters."""
+        self.monomials.clear()
+        self.results.clear()
+        self.hits = self.misses = 0
+
+    def memoize(self, key, func, *args, **kwargs):
+        """Return ``func(*args, **kwargs)``, memoized by ``key``.
+
+        ``key`` must identify the result, e.g. include variables of the
+        tower.  Exceptions are not memoized.
+        """
+        if not USE_CACHE:
+            return func(*args, **kwargs)
+        try:
+            result = self.results[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = func(*args, **kwargs)
+        self.results[key] = result
+        return result
+
+    def __str__(self):
+        return '%s(hits=%s, misses=%s)' % (self.__class__.__name__,
+                                           self.hits, self.misses)
+
+
+def _key(p):
+    # equal polynomials over different domains are different keys
+    if isinstance(p, Poly):
+        return p, p.domain
+    elif isinstance(p, tuple):
+        return tuple(_key(_) for _ in p)
+    return p
+
+
+#: Default cache of Risch towers.
+towers = TowerCache()
+
+
 class DifferentialExtension:
     """
     A container for all the information relating to a differential extension.
@@ -140,6 +220,10 @@ class DifferentialExtension:
     - d: The top level extension derivation, as defined by the current
       derivation (see level below).
     - case: The string representation of the case of self.d.
+    - key: Tuple of x and the generating functions of T[1:], as pairs
+      ('exp', arg) or ('log', arg); None, if the extension was given
+      manually or built without dummies.  Extensions with a key share
+      monomials and memoized computations, see TowerCache.
     (Note that self.T and self.D will always contain the complete extension,
     regardless of the level.  Therefore, you should ALWAYS use DE.t and DE.d
     instead of DE.T[-1] and DE.D[-1].  If you want to have a list of the
@@ -311,7 +395,7 @@ def update(seq, atoms, func):
                     # We can add a**b only if log(a) in the extension, because
                     # a**b == exp(b*log(a)).
                     basea, based = frac_in(i.base, self.t)
-                    A = is_deriv_k(basea, based, self)
+                    A = self._memoize('is_deriv_k', is_deriv_k, basea, based)
                     if A is None:
                         # Nonelementary monomial (so far)
 
@@ -402,7 +486,7 @@ def __getattr__(self, attr):
         # Avoid AttributeErrors when debugging
         if attr not in ('f', 'x', 'T', 'D', 'fa', 'fd', 'Tfuncs', 'backsubs',
                         'E_K', 'E_args', 'L_K', 'L_args', 'cases', 'case', 't',
-                        'd', 'newf', 'level', 'ts'):
+                        'd', 'newf', 'level', 'ts', 'key'):
             raise AttributeError("%s has no attribute %s" % (repr(self), repr(attr)))
         return
 
@@ -415,7 +499,9 @@ def _auto_attrs(self):
             self.T = [i.gen for i in self.D]
         if not self.x:
             self.x = self.T[0]
-        self.cases = [get_case(d, t) for d, t in zip(self.D, self.T)]
+        self.cases = [towers.memoize(('case', _key(d), t), get_case, d, t)
+                      if self.key else get_case(d, t)
+                      for d, t in zip(self.D, self.T)]
         self.level = -1
         self.t = self.T[self.level]
         self.d = self.D[self.level]
@@ -443,7 +529,8 @@ def _exp_part(self, exps, dummy=True):
             others.sort(key=lambda i: i[1])
 
             arga, argd = frac_in(arg, self.t)
-            A = is_log_deriv_k_t_radical(arga, argd, self)
+            A = self._memoize('is_log_deriv_k_t_radical',
+                              is_log_deriv_k_t_radical, arga, argd)
 
             if A is not None:
                 ans, u, n, const = A
@@ -503,23 +590,27 @@ def _exp_part(self, exps, dummy=True):
                             "algebraic extensions.")
 
             else:
-                arga, argd = frac_in(arg, self.t)
-                darga = (argd*derivation(Poly(arga, self.t), self) -
-                    arga*derivation(Poly(argd, self.t), self))
-                dargd = argd**2
-                darga, dargd = darga.cancel(dargd, include=True)
-                darg = darga.as_expr()/dargd.as_expr()
-                self.t = next(self.ts)
+                def monomial():
+                    arga, argd = frac_in(arg, self.t)
+                    darga = (argd*derivation(Poly(arga, self.t), self) -
+                        arga*derivation(Poly(argd, self.t), self))
+                    dargd = argd**2
+                    darga, dargd = darga.cancel(dargd, include=True)
+                    darg = darga.as_expr()/dargd.as_expr()
+                    if dummy:
+                        i = Dummy("i")
+                    else:
+                        i = Symbol('i')
+                    return (t, darg.as_poly(t, expand=False)*Poly(t, t,
+                            expand=False), Lambda(i, exp(arg.subs(self.x, i))))
+
+                t = next(self.ts)
+                self.t, d, tfunc = self._monomial('exp', arg, monomial)
                 self.T.append(self.t)
                 self.E_args.append(arg)
                 self.E_K.append(len(self.T) - 1)
-                self.D.append(darg.as_poly(self.t, expand=False)*Poly(self.t,
-                    self.t, expand=False))
-                if dummy:
-                    i = Dummy("i")
-                else:
-                    i = Symbol('i')
-                self.Tfuncs = self.Tfuncs + [Lambda(i, exp(arg.subs(self.x, i)))]
+                self.D.append(d)
+                self.Tfuncs = self.Tfuncs + [tfunc]
                 self.newf = self.newf.xreplace(
                     {exp(exparg): self.t**p for exparg, p in others})
                 new_extension = True
@@ -550,7 +641,7 @@ def _log_part(self, logs, dummy=True):
             # which is a polynomial, so we can just replace it with that.
             # In other words, we don't have to worry about radicals.
             arga, argd = frac_in(arg, self.t)
-            A = is_deriv_k(arga, argd, self)
+            A = self._memoize('is_deriv_k', is_deriv_k, arga, argd)
             if A is not None:
                 ans, u, const = A
                 newterm = log(const) + u
@@ -558,27 +649,55 @@ def _log_part(self, logs, dummy=True):
                 continue
 
             else:
-                arga, argd = frac_in(arg, self.t)
-                darga = (argd*derivation(Poly(arga, self.t), self) -
-                    arga*derivation(Poly(argd, self.t), self))
-                dargd = argd**2
-                darg = darga.as_expr()/dargd.as_expr()
-                self.t = next(self.ts)
+                def monomial():
+                    darga = (argd*derivation(Poly(arga, self.t), self) -
+                        arga*derivation(Poly(argd, self.t), self))
+                    dargd = argd**2
+                    darg = darga.as_expr()/dargd.as_expr()
+                    if dummy:
+                        i = Dummy("i")
+                    else:
+                        i = Symbol('i')
+                    return (t, cancel(darg.as_expr()/arg).as_poly(t,
+                            expand=False), Lambda(i, log(arg.subs(self.x, i))))
+
+                t = next(self.ts)
+                self.t, d, tfunc = self._monomial('log', arg, monomial)
                 self.T.append(self.t)
                 self.L_args.append(arg)
                 self.L_K.append(len(self.T) - 1)
-                self.D.append(cancel(darg.as_expr()/arg).as_poly(self.t,
-                    expand=False))
-                if dummy:
-                    i = Dummy("i")
-                else:
-                    i = Symbol('i')
-                self.Tfuncs = self.Tfuncs + [Lambda(i, log(arg.subs(self.x, i)))]
+                self.D.append(d)
+                self.Tfuncs = self.Tfuncs + [tfunc]
                 self.newf = self.newf.xreplace({log(arg): self.t})
                 new_extension = True
 
         return new_extension
 
+    def _monomial(self, kind, arg, build):
+        """
+        Return (t, Dt, Tfunc) of the monomial exp(arg) or log(arg) over self.
+
+        Monomials of extensions with a key are shared, see TowerCache.
+        """
+        if not self.key or not USE_CACHE:
+            return build()
+        key = self.key + ((kind, arg),)
+        try:
+            t, d, tfunc = towers.monomials[key]
+        except KeyError:
+            t, d, tfunc = towers.monomials[key] = build()
+        self.key = key
+        return t, d, tfunc
+
+    def _memoize(self, name, func, a, d):
+        """
+        Return func(a, d, self), memoized for the tower, see TowerCache.
+        """
+        if not self.key:
+            return func(a, d, self)
+        return towers.memoize((name, self.key, self.level, _key(a), _key(d)),
+                              func, a, d, self)
+
     @property
     def _important_attrs(self):
         """
@@ -610,9 +729,11 @@ def reset(self, dummy=True):
         self.L_K, self.E_K, self.L_args, self.E_args = [], [], [], []
         if dummy:
             self.ts = numbered_symbols('t', cls=Dummy)
+            self.key = (self.x,)
         else:
             # For testing
             self.ts = numbered_symbols('t')
+            self.key = None
         # For various things that we change to make things work that we need to
         # change back when we are done.
         self.backsubs = []
@@ -718,6 +839,11 @@ def frac_in(f, t, **kwargs):
     where fa and fd are either basic expressions or Polys, and f == fa/fd.
     **kwargs are applied to Poly.
     """
+    key = ('frac_in', _key(f), t) + tuple(sorted(kwargs.items()))
+    return towers.memoize(key, _frac_in, f, t, **kwargs)
+
+
+def _frac_in(f, t, **kwargs):
     cancel = kwargs.pop('cancel', False)
     if type(f) is tuple:
         fa, fd = f
@@ -800,7 +926,17 @@ def derivation(p, DE, coefficientD=False, basic=False):
 
     If basic=True, the returns a Basic expression.  Elements of D can still be
     instances of Poly.
+
+    Derivations over extensions with a key are memoized, see TowerCache.
     """
+    if DE.key:
+        T = tuple(DE.T[:len(DE.T) + DE.level + 1])
+        return towers.memoize(('derivation', T, _key(p), coefficientD, basic),
+                              _derivation, p, DE, coefficientD, basic)
+    return _derivation(p, DE, coefficientD, basic)
+
+
+def _derivation(p, DE, coefficientD, basic):
     if basic:
         r = 0
     else:
@@ -11,6 +11,7 @@
                      sympify, trigsimp, Integer, Tuple, nan, And, Eq, Ne, re,
                      im, polar_lift, meijerg, Min, Max)
 from diofant.functions.elementary.complexes import periodic_argument
+from diofant.integrals.integrals import profiler
 from diofant.integrals.risch import NonElementaryIntegral
 from diofant.utilities.randtest import verify_numerically
 
@@ -1167,3 +1168,38 @@ def test_definite_integrals_abs():
     assert integrate(e, (x, -3, 11)) == 3136
     assert integrate(e, (x, -17, -2)) == Rational(-78425, 4)
     assert integrate(e, (x, -17, 20)) == Rational(74481, 4)
+
+
+def test_StrategyProfiler():
+    profiler.reset()
+
+    e = integrate(x*exp(x), x)
+    assert e == (x - 1)*exp(x)
+    assert profiler.stats['risch'] == {'calls': 1, 'successes': 1,
+                                       'skipped': 0,
+                                       'time': profiler.stats['risch']['time']}
+
+    # cached up to renaming of the integration variable
+    assert integrate(y*exp(y), y) == e.subs(x, y)
+    assert profiler.stats['risch']['calls'] == 1
+    p = Symbol('p', positive=True)
+    assert integrate(p*exp(p), p) == e.subs(x, p)
+    assert profiler.stats['risch']['calls'] == 2
+
+    # failures are cached too
+    profiler.reset()
+    assert integrate(erf(x), x, risch=True) == Integral(erf(x), x)
+    assert integrate(erf(y), y, risch=True) == Integral(erf(y), y)
+    assert profiler.stats['risch'] == {'calls': 1, 'successes': 0,
+                                       'skipped': 0,
+                                       'time': profiler.stats['risch']['time']}
+
+    # strategies with exhausted time budgets are skipped
+    profiler.reset()
+    for strategy in ['risch', 'heurisch', 'meijerint']:
+        profiler.set_budget(strategy, 0)
+    assert integrate(x*exp(x), x) == Integral(x*exp(x), x)
+    assert profiler.stats['heurisch']['skipped'] == 1
+    for strategy in ['risch', 'heurisch', 'meijerint']:
+        profiler.set_budget(strategy, None)
+    assert integrate(x*exp(x), x) == e
@@ -15,7 +15,7 @@
                                      DifferentialExtension, risch_integrate,
                                      DecrementLevel, NonElementaryIntegral,
                                      recognize_log_derivative, recognize_derivative,
-                                     laurent_series)
+                                     laurent_series, TowerCache, towers)
 
 from diofant.abc import x, t, nu, z, a, y
 
@@ -593,6 +593,38 @@ def test_DifferentialExtension_Rothstein():
         [x, 1/(t0 + 1) - 10*x], [], [])
 
 
+def test_TowerCache():
+    towers.clear()
+    DE1 = DifferentialExtension(x*exp(x) + log(x), x)
+    DE2 = DifferentialExtension(exp(x)/x + log(x)**2, x)
+    assert DE1.key == DE2.key == (x, ('log', x), ('exp', x))
+    assert DE1.T == DE2.T and DE1.D == DE2.D
+    assert DE1.T[1:] != DifferentialExtension(exp(x) + log(x), x,
+                                              handle_first='exp').T[1:]
+    assert DifferentialExtension(exp(x), x, dummy=False).key is None
+    assert DifferentialExtension(extension={'D': [Poly(1, x)]}).key is None
+
+    p = Poly(x*DE1.t**2, DE1.t)
+    hits = towers.hits
+    assert derivation(p, DE1) == derivation(p, DE2)
+    assert towers.hits == hits + 1
+    assert str(towers).startswith('TowerCache(hits=')
+
+    # a batch of integrands over the same tower
+    for n in range(3):
+        f = x**n*exp(x)
+        assert (risch_integrate(f, x).diff(x) - f).expand() == 0
+
+    cache = TowerCache(maxsize=1)
+    assert cache.memoize('a', lambda: 1) == 1
+    assert cache.memoize('a', lambda: 2) == 1
+    assert cache.memoize('b', lambda: 3) == 3
+    assert cache.memoize('a', lambda: 4) == 4
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
 def test_DecrementLevel():
     class TestingException(Exception):
         """Dummy Exception class for testing."""
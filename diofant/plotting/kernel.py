@@ -0,0 +1,233 @@
+"""Compiled numeric kernels for plotting.
+
+Expressions are compiled to Python functions of NumPy arrays (of complex
+numbers) by traversing the (func, args) tree and creating the namespace at
+the same time.  This is done only once per expression, there are no retries
+on evaluation.
+
+Subexpressions without NumPy counterparts (e.g. ``gamma(x)`` or
+``Integral(sin(x*t), (t, 0, 1))``) are evaluated pointwise with
+:meth:`~diofant.core.evalf.EvalfMixin.evalf`, but only themselves: the rest
+of the expression is still vectorized.
+"""
+
+import mpmath
+
+from diofant.core import Add, Mul, Pow, Expr, S
+from diofant.core.function import Application, AppliedUndef, Function
+from diofant.core.numbers import Float, I
+from diofant.core.relational import Relational
+from diofant.external import import_module
+from diofant.functions import (sin, cos, tan, cot, sec, csc, asin, acos,
+                               atan, sinh, cosh, tanh, asinh, acosh, atanh,
+                               exp, log, Abs, re, im, arg, conjugate, sign,
+                               floor, ceiling, Piecewise)
+from diofant.logic.boolalg import And, Or, Not, BooleanTrue, BooleanFalse
+
+
+# Templates, where {0}, {1}, ... are names of evaluated arguments.
+_numpy_templates = {
+    sin: 'np.sin({0})', cos: 'np.cos({0})', tan: 'np.tan({0})',
+    cot: '1/np.tan({0})', sec: '1/np.cos({0})', csc: '1/np.sin({0})',
+    asin: 'np.arcsin({0})', acos: 'np.arccos({0})', atan: 'np.arctan({0})',
+    sinh: 'np.sinh({0})', cosh: 'np.cosh({0})', tanh: 'np.tanh({0})',
+    asinh: 'np.arcsinh({0})', acosh: 'np.arccosh({0})',
+    atanh: 'np.arctanh({0})', exp: 'np.exp({0})', log: 'np.log({0})',
+    Abs: 'np.abs({0})', re: '{0}.real', im: '{0}.imag',
+    arg: 'np.angle({0})', conjugate: 'np.conjugate({0})',
+    sign: 'np.where({0} == 0, 0, {0}/np.abs({0}))',
+    floor: 'np.floor({0}.real) + 1j*np.floor({0}.imag)',
+    ceiling: 'np.ceil({0}.real) + 1j*np.ceil({0}.imag)',
+}
+
+_relational_operators = {'<', '<=', '>', '>=', '==', '!='}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _to_number(value):
+    value = complex(value)
+    if value.imag:
+        return Float(value.real) + I*Float(value.imag)
+    return Float(value.real)
+
+
+def _float_function(expr):
+    """Return a function of floats, computing ``expr.func`` or None.
+
+    This is possible for implemented functions and for functions,
+    evaluated with :mod:`mpmath` by :meth:`Function._eval_evalf`.
+    """
+    if isinstance(expr, AppliedUndef):
+        return getattr(expr, '_imp_', None)
+    elif type(expr)._eval_evalf is Function._eval_evalf:
+        from diofant.utilities.lambdify import MPMATH_TRANSLATIONS
+        fname = expr.func.__name__
+        if not hasattr(mpmath, fname):
+            fname = MPMATH_TRANSLATIONS.get(fname, fname)
+        return getattr(mpmath.fp, fname, None)
+
+
+def _pointwise(func, fast=None):
+    """Return a function of complex numbers, that evaluates ``func``.
+
+    If ``fast`` is given, it's tried first on Python numbers.
+    """
+    def f(*values):
+        if fast:
+            try:
+                return complex(fast(*[v.real if not v.imag else v
+                                      for v in values]))
+            except (ArithmeticError, TypeError, ValueError):
+                pass
+        try:
+            return complex(func(*map(_to_number, values)).evalf())
+        except (ArithmeticError, TypeError, ValueError):
+            return complex('nan')
+    return f
+
+
+class Kernel:
+    """Vectorized numeric function of a Diofant expression.
+
+    Returns real parts of values (as masked arrays), values with nonzero
+    imaginary parts and infinite or undefined values are masked.
+
+    Examples
+    ========
+
+    >>> from diofant import sqrt, gamma
+    >>> from diofant.abc import x
+    >>> f = Kernel([x], sqrt(x) + gamma(x))
+    >>> print(f([-1, 1, 4]))
+    [-- 2.0 8.0]
+    >>> f.fallbacks
+    [gamma(x)]
+    """
+
+    def __init__(self, args, expr):
+        np = import_module('numpy')
+        self.args = tuple(args)
+        self.expr = expr
+
+        missing = expr.free_symbols - set(self.args)
+        if missing:
+            raise ValueError("Can't evaluate %s, free symbols %s are not "
+                             "arguments." % (expr, sorted(map(str, missing))))
+
+        self.fallbacks = []
+        self._names = {a: '_a%d' % i for i, a in enumerate(self.args)}
+        self._namespace = {'np': np}
+        self._lines = []
+        result = self._print(expr)
+
+        source = 'def _kernel(%s):\n' % ', '.join(self._names[a]
+                                                   for a in self.args)
+        source += ''.join('    %s\n' % l for l in self._lines)
+        source += '    return %s\n' % result
+        self.source = source
+        exec(source, self._namespace)
+        self._func = self._namespace['_kernel']
+
+    def _add(self, value, prefix='_c'):
+        name = '%s%d' % (prefix, len(self._namespace))
+        self._namespace[name] = value
+        return name
+
+    def _assign(self, code):
+        name = '_t%d' % len(self._lines)
+        self._lines.append('%s = %s' % (name, code))
+        return name
+
+    def _print(self, expr):
+        if expr in self._names:
+            return self._names[expr]
+        if not (expr.free_symbols & set(self.args)):
+            try:
+                value = complex(expr.evalf())
+            except (ArithmeticError, TypeError, ValueError):
+                value = complex('nan')
+            code = self._add(value)
+        elif isinstance(expr, Add):
+            code = self._assign(' + '.join(map(self._print, expr.args)))
+        elif isinstance(expr, Mul):
+            code = self._assign(' * '.join(map(self._print, expr.args)))
+        elif isinstance(expr, Pow):
+            base, e = expr.args
+            if e.is_Integer:
+                code = '%s**%d' % (self._print(base), int(e))
+            elif e is S.Half:
+                code = 'np.sqrt(%s)' % self._print(base)
+            else:
+                code = '%s**%s' % (self._print(base), self._print(e))
+            code = self._assign(code)
+        elif type(expr) in _numpy_templates:
+            code = _numpy_templates[type(expr)]
+            code = self._assign(code.format(*map(self._print, expr.args)))
+        elif isinstance(expr, Piecewise):
+            try:
+                conds = [self._print_condition(c) for _, c in expr.args]
+            except _Unsupported:
+                return self._print_fallback(expr)
+            vals = [self._print(e) for e, _ in expr.args]
+            code = self._assign("np.select([%s], [%s], default=%s)" %
+                                (', '.join(conds), ', '.join(vals),
+                                 self._add(complex('nan'))))
+        else:
+            return self._print_fallback(expr)
+        self._names[expr] = code
+        return code
+
+    def _print_condition(self, cond):
+        if isinstance(cond, BooleanTrue):
+            return 'True'
+        elif isinstance(cond, BooleanFalse):
+            return 'False'
+        elif (isinstance(cond, Relational) and
+                cond.rel_op in _relational_operators):
+            lhs, rhs = map(self._print, cond.args)
+            if cond.rel_op in ('==', '!='):
+                return '(%s %s %s)' % (lhs, cond.rel_op, rhs)
+            return '(%s.real %s %s.real)' % (lhs, cond.rel_op, rhs)
+        elif isinstance(cond, (And, Or)):
+            op = ' & ' if isinstance(cond, And) else ' | '
+            return '(%s)' % op.join(map(self._print_condition, cond.args))
+        elif isinstance(cond, Not):
+            return 'np.logical_not(%s)' % self._print_condition(cond.args[0])
+        raise _Unsupported
+
+    def _print_fallback(self, expr):
+        np = import_module('numpy')
+        self.fallbacks.append(expr)
+        if (isinstance(expr, Application) and
+                all(isinstance(a, Expr) for a in expr.args)):
+            # Vectorize arguments, only expr.func is evaluated pointwise.
+            func, fast = expr.func, _float_function(expr)
+            args = list(expr.args)
+            names = [self._print(a) for a in args]
+        else:
+            args = sorted(expr.free_symbols & set(self.args),
+                          key=self.args.index)
+            names = [self._names[a] for a in args]
+            fast = None
+
+            def func(*values, expr=expr, args=args):
+                return expr.xreplace(dict(zip(args, values)))
+        f = self._add(np.frompyfunc(_pointwise(func, fast), len(args), 1), '_f')
+        code = self._assign('np.asarray(%s(%s), dtype=complex)' %
+                            (f, ', '.join(names)))
+        self._names[expr] = code
+        return code
+
+    def __call__(self, *args):
+        np = import_module('numpy')
+        args = [np.asarray(a, dtype=complex) for a in args]
+        with np.errstate(all='ignore'):
+            result = np.asarray(self._func(*args), dtype=complex)
+            if args:
+                result = np.broadcast_to(result, np.broadcast(*args).shape)
+            mask = (~np.isfinite(result) |
+                    (np.abs(result.imag) > 1e-7*np.abs(result)))
+        return np.ma.masked_where(mask, result.real)
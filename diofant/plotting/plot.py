@@ -30,7 +30,7 @@
 from diofant.external import import_module
 from diofant.utilities.decorator import doctest_depends_on
 from diofant.utilities.iterables import is_sequence
-from .experimental_lambdify import (vectorized_lambdify, lambdify)
+from .kernel import Kernel
 
 # Global variable
 # Set to False when running tests / doctests so that the plots don't show.
@@ -320,6 +320,18 @@ class BaseSeries:
 
     def __init__(self):
         super(BaseSeries, self).__init__()
+        self._kernels = {}
+
+    def get_kernel(self, args, expr):
+        """Return a vectorized function of ``expr``.
+
+        Functions are compiled once and cached, see
+        :class:`~diofant.plotting.kernel.Kernel`.
+        """
+        key = tuple(args), expr
+        if key not in self._kernels:
+            self._kernels[key] = Kernel(args, expr)
+        return self._kernels[key]
 
     @property
     def is_3D(self):
@@ -425,57 +437,12 @@ def get_segments(self):
         if self.only_integers or not self.adaptive:
             return super(LineOver1DRangeSeries, self).get_segments()
         else:
-            f = lambdify([self.var], self.expr)
-            list_segments = []
-
-            def sample(p, q, depth):
-                """ Samples recursively if three points are almost collinear.
-                For depth < 6, points are added irrespective of whether they
-                satisfy the collinearity condition or not. The maximum depth
-                allowed is 12.
-                """
-                np = import_module('numpy')
-                # Randomly sample to avoid aliasing.
-                random = 0.45 + np.random.rand() * 0.1
-                xnew = p[0] + random * (q[0] - p[0])
-                ynew = f(xnew)
-                new_point = np.array([xnew, ynew])
-
-                # Maximum depth
-                if depth > self.depth:
-                    list_segments.append([p, q])
-
-                # Sample irrespective of whether the line is flat till the
-                # depth of 6. We are not using linspace to avoid aliasing.
-                elif depth < 6:
-                    sample(p, new_point, depth + 1)
-                    sample(new_point, q, depth + 1)
-
-                # Sample ten points if complex values are encountered
-                # at both ends. If there is a real value in between, then
-                # sample those points further.
-                elif p[1] is None and q[1] is None:
-                    xarray = np.linspace(p[0], q[0], 10)
-                    yarray = list(map(f, xarray))
-                    if any(y is not None for y in yarray):
-                        for i in range(len(yarray) - 1):
-                            if yarray[i] is not None or yarray[i + 1] is not None:
-                                sample([xarray[i], yarray[i]],
-                                    [xarray[i + 1], yarray[i + 1]], depth + 1)
-
-                # Sample further if one of the end points in None( i.e. a complex
-                # value) or the three points are not almost collinear.
-                elif (p[1] is None or q[1] is None or new_point[1] is None
-                        or not flat(p, new_point, q)):
-                    sample(p, new_point, depth + 1)
-                    sample(new_point, q, depth + 1)
-                else:
-                    list_segments.append([p, q])
+            np = import_module('numpy')
+            f = self.get_kernel([self.var], self.expr)
 
-            f_start = f(self.start)
-            f_end = f(self.end)
-            sample([self.start, f_start], [self.end, f_end], 0)
-            return list_segments
+            def points(x):
+                return np.column_stack([x, f(x).filled(np.nan)])
+            return adaptive_segments(points, self.start, self.end, self.depth)
 
     def get_points(self):
         np = import_module('numpy')
@@ -484,7 +451,7 @@ def get_points(self):
                     num=int(self.end) - int(self.start) + 1)
         else:
             list_x = np.linspace(self.start, self.end, num=self.nb_of_points)
-        f = vectorized_lambdify([self.var], self.expr)
+        f = self.get_kernel([self.var], self.expr)
         list_y = f(list_x)
         return list_x, list_y
 
@@ -519,8 +486,8 @@ def get_parameter_points(self):
 
     def get_points(self):
         param = self.get_parameter_points()
-        fx = vectorized_lambdify([self.var], self.expr_x)
-        fy = vectorized_lambdify([self.var], self.expr_y)
+        fx = self.get_kernel([self.var], self.expr_x)
+        fy = self.get_kernel([self.var], self.expr_y)
         list_x = fx(param)
         list_y = fy(param)
         return list_x, list_y
@@ -542,70 +509,14 @@ def get_segments(self):
         if not self.adaptive:
             return super(Parametric2DLineSeries, self).get_segments()
 
-        f_x = lambdify([self.var], self.expr_x)
-        f_y = lambdify([self.var], self.expr_y)
-        list_segments = []
-
-        def sample(param_p, param_q, p, q, depth):
-            """ Samples recursively if three points are almost collinear.
-            For depth < 6, points are added irrespective of whether they
-            satisfy the collinearity condition or not. The maximum depth
-            allowed is 12.
-            """
-            # Randomly sample to avoid aliasing.
-            np = import_module('numpy')
-            random = 0.45 + np.random.rand() * 0.1
-            param_new = param_p + random * (param_q - param_p)
-            xnew = f_x(param_new)
-            ynew = f_y(param_new)
-            new_point = np.array([xnew, ynew])
-
-            # Maximum depth
-            if depth > self.depth:
-                list_segments.append([p, q])
-
-            # Sample irrespective of whether the line is flat till the
-            # depth of 6. We are not using linspace to avoid aliasing.
-            elif depth < 6:
-                sample(param_p, param_new, p, new_point, depth + 1)
-                sample(param_new, param_q, new_point, q, depth + 1)
-
-            # Sample ten points if complex values are encountered
-            # at both ends. If there is a real value in between, then
-            # sample those points further.
-            elif ((p[0] is None and q[1] is None) or
-                    (p[1] is None and q[1] is None)):
-                param_array = np.linspace(param_p, param_q, 10)
-                x_array = list(map(f_x, param_array))
-                y_array = list(map(f_y, param_array))
-                if any(x is not None and y is not None
-                        for x, y in zip(x_array, y_array)):
-                    for i in range(len(y_array) - 1):
-                        if ((x_array[i] is not None and y_array[i] is not None) or
-                                (x_array[i + 1] is not None and y_array[i + 1] is not None)):
-                            point_a = [x_array[i], y_array[i]]
-                            point_b = [x_array[i + 1], y_array[i + 1]]
-                            sample(param_array[i], param_array[i], point_a,
-                                   point_b, depth + 1)
-
-            # Sample further if one of the end points in None( ie a complex
-            # value) or the three points are not almost collinear.
-            elif (p[0] is None or p[1] is None
-                    or q[1] is None or q[0] is None
-                    or not flat(p, new_point, q)):
-                sample(param_p, param_new, p, new_point, depth + 1)
-                sample(param_new, param_q, new_point, q, depth + 1)
-            else:
-                list_segments.append([p, q])
+        np = import_module('numpy')
+        f_x = self.get_kernel([self.var], self.expr_x)
+        f_y = self.get_kernel([self.var], self.expr_y)
 
-        f_start_x = f_x(self.start)
-        f_start_y = f_y(self.start)
-        start = [f_start_x, f_start_y]
-        f_end_x = f_x(self.end)
-        f_end_y = f_y(self.end)
-        end = [f_end_x, f_end_y]
-        sample(self.start, self.end, start, end, 0)
-        return list_segments
+        def points(param):
+            return np.column_stack([f_x(param).filled(np.nan),
+                                    f_y(param).filled(np.nan)])
+        return adaptive_segments(points, self.start, self.end, self.depth)
 
 
 # 3D lines
@@ -649,9 +560,9 @@ def get_parameter_points(self):
 
     def get_points(self):
         param = self.get_parameter_points()
-        fx = vectorized_lambdify([self.var], self.expr_x)
-        fy = vectorized_lambdify([self.var], self.expr_y)
-        fz = vectorized_lambdify([self.var], self.expr_z)
+        fx = self.get_kernel([self.var], self.expr_x)
+        fy = self.get_kernel([self.var], self.expr_y)
+        fz = self.get_kernel([self.var], self.expr_z)
         list_x = fx(param)
         list_y = fy(param)
         list_z = fz(param)
@@ -722,7 +633,7 @@ def get_meshes(self):
                                                  num=self.nb_of_points_x),
                                      np.linspace(self.start_y, self.end_y,
                                                  num=self.nb_of_points_y))
-        f = vectorized_lambdify((self.var_x, self.var_y), self.expr)
+        f = self.get_kernel((self.var_x, self.var_y), self.expr)
         return mesh_x, mesh_y, f(mesh_x, mesh_y)
 
 
@@ -769,9 +680,9 @@ def get_parameter_meshes(self):
 
     def get_meshes(self):
         mesh_u, mesh_v = self.get_parameter_meshes()
-        fx = vectorized_lambdify((self.var_u, self.var_v), self.expr_x)
-        fy = vectorized_lambdify((self.var_u, self.var_v), self.expr_y)
-        fz = vectorized_lambdify((self.var_u, self.var_v), self.expr_z)
+        fx = self.get_kernel((self.var_u, self.var_v), self.expr_x)
+        fy = self.get_kernel((self.var_u, self.var_v), self.expr_y)
+        fz = self.get_kernel((self.var_u, self.var_v), self.expr_z)
         return fx(mesh_u, mesh_v), fy(mesh_u, mesh_v), fz(mesh_u, mesh_v)
 
 
@@ -984,17 +895,94 @@ def centers_of_faces(array):
 
 
 def flat(x, y, z, eps=1e-3):
-    """Checks whether three points are almost collinear"""
+    """Checks whether three points are almost collinear.
+
+    Points could be also given as arrays (one point per row).
+    """
     np = import_module('numpy')
-    vector_a = x - y
-    vector_b = z - y
-    dot_product = np.dot(vector_a, vector_b)
-    vector_a_norm = np.linalg.norm(vector_a)
-    vector_b_norm = np.linalg.norm(vector_b)
+    vector_a = np.asarray(x) - y
+    vector_b = np.asarray(z) - y
+    dot_product = np.sum(vector_a * vector_b, axis=-1)
+    vector_a_norm = np.linalg.norm(vector_a, axis=-1)
+    vector_b_norm = np.linalg.norm(vector_b, axis=-1)
     cos_theta = dot_product / (vector_a_norm * vector_b_norm)
     return abs(cos_theta + 1) < eps
 
 
+def adaptive_segments(points, start, end, depth=12):
+    """Adaptively gets segments of a curve for plotting.
+
+    The curve is given by the function ``points``, that maps an array of
+    parameter values to the array of points (one per row, coordinates
+    are ``nan`` for complex values).
+
+    The adaptive sampling is done by checking if three points are almost
+    collinear.  If they are not collinear, then more points are added
+    between those points.  Up to the ``depth`` of 6, points are added
+    irrespective of whether they satisfy the collinearity condition or not.
+    If complex values are encountered at both ends, ten points are sampled
+    and intervals with real values are sampled further.
+
+    Sampling is done breadth-first: new points for all intervals of the
+    same depth are computed with one call of ``points``.
+
+    Returns a list of segments, ordered by the parameter value, with
+    complex coordinates replaced by ``None``.
+
+    References
+    ==========
+
+    [1] Adaptive polygonal approximation of parametric curves,
+        Luiz Henrique de Figueiredo.
+    """
+    np = import_module('numpy')
+    param_p, param_q = np.array([start]), np.array([end])
+    p, q = np.split(points(np.array([start, end])), 2)
+    params, segments = [], []
+    level = 0
+    while len(param_p):
+        nan_p = np.isnan(p).any(axis=1)
+        nan_q = np.isnan(q).any(axis=1)
+        ten = (nan_p & nan_q) if level >= 6 else np.zeros(len(p), bool)
+        if level > depth:
+            params.append(param_p)
+            segments.extend(zip(p, q))
+            break
+
+        # Randomly sample to avoid aliasing.
+        param_new = param_p + (0.45 + np.random.rand(len(param_p))*0.1)*(
+            param_q - param_p)
+        param_ten = np.linspace(param_p[ten], param_q[ten], 10, axis=1)
+        new, new_ten = np.split(points(np.concatenate([param_new,
+                                                       param_ten.ravel()])),
+                                [len(param_new)])
+
+        if level < 6:
+            split = np.ones(len(p), bool)
+        else:
+            split = ~ten & (nan_p | nan_q | np.isnan(new).any(axis=1) |
+                            ~flat(p, new, q))
+            done = ~ten & ~split
+            params.append(param_p[done])
+            segments.extend(zip(p[done], q[done]))
+
+        new_ten = new_ten.reshape(param_ten.shape + (p.shape[1],))
+        real = ~np.isnan(new_ten).any(axis=2)
+        real = real[:, :-1] | real[:, 1:]
+        param_p, param_q, p, q = (
+            np.concatenate([param_p[split], param_new[split],
+                            param_ten[:, :-1][real]]),
+            np.concatenate([param_new[split], param_q[split],
+                            param_ten[:, 1:][real]]),
+            np.concatenate([p[split], new[split], new_ten[:, :-1][real]]),
+            np.concatenate([new[split], q[split], new_ten[:, 1:][real]]))
+        level += 1
+
+    order = np.argsort(np.concatenate(params), kind='mergesort')
+    return [[[None if np.isnan(c) else float(c) for c in point]
+             for point in segments[i]] for i in order]
+
+
 def _matplotlib_list(interval_list):
     """
     Returns lists for matplotlib ``fill`` command from a list of bounding
@@ -0,0 +1,60 @@
+import pytest
+
+from diofant import (sin, sqrt, gamma, Integral, Piecewise, Max, floor, pi,
+                     Function, Symbol)
+from diofant.abc import x, y
+from diofant.external import import_module
+from diofant.plotting.kernel import Kernel
+from diofant.utilities.lambdify import implemented_function
+
+
+np = import_module('numpy')
+
+
+@pytest.mark.skipif(np is None, reason="no numpy")
+def test_Kernel():
+    f = Kernel([x], sin(x) + sqrt(x))
+    assert f.fallbacks == []
+    r = f([-1, 0, pi/2, 4])
+    assert list(r.mask) == [True, False, False, False]
+    assert np.allclose(r[1:], [0, 1 + np.sqrt(np.pi/2), 2 + np.sin(4)])
+
+    # only the subexpression is evaluated pointwise
+    f = Kernel([x], sin(x) + gamma(x))
+    assert f.fallbacks == [gamma(x)]
+    r = f([-1, 0.5, 3])
+    assert list(r.mask) == [True, False, False]
+    assert np.allclose(r[1:], [np.sin(0.5) + np.sqrt(np.pi), np.sin(3) + 2])
+
+    e = Integral(sin(x*y), (y, 0, 1))
+    f = Kernel([x], e)
+    assert f.fallbacks == [e]
+    assert np.allclose(f([0, 1]), [0, 1 - np.cos(1)])
+
+    f = Kernel([x], Max(x, 1))
+    assert f.fallbacks == [Max(x, 1)]
+    assert np.allclose(f([0, 2]), [1, 2])
+
+    g = implemented_function(Function('g'), lambda t: t + 1)
+    f = Kernel([x], g(x)**2)
+    assert np.allclose(f([1, 2]), [4, 9])
+
+    f = Kernel([x], Piecewise((x, x < 0), (x**2, True)))
+    assert f.fallbacks == []
+    assert np.allclose(f([-1, 2]), [-1, 4])
+
+    assert np.allclose(Kernel([x], floor(x))([-1.5, 1.5]), [-2, 1])
+
+    # broadcasting
+    f = Kernel([x, y], x*y + 2)
+    assert np.allclose(f(np.arange(3), 2), [2, 4, 6])
+    assert np.allclose(Kernel([x], pi)([1, 2]), [np.pi, np.pi])
+
+    r = Kernel([x], 1/x)([0, 1])
+    assert list(r.mask) == [True, False]
+
+    # arbitrary symbol names
+    z = Symbol('z-3')
+    assert np.allclose(Kernel([z], z + 1)([1]), [2])
+
+    pytest.raises(ValueError, lambda: Kernel([x], x + y))
@@ -10,13 +10,15 @@
                      oo, LambertW, I, meijerg, exp_polar, Max)
 from diofant.plotting import (plot, plot_parametric, plot3d_parametric_line,
                               plot3d, plot3d_parametric_surface)
-from diofant.plotting.plot import unset_show
+from diofant.plotting.plot import (unset_show, LineOver1DRangeSeries,
+                                   Parametric2DLineSeries)
 from diofant.plotting.experimental_lambdify import lambdify
 from diofant.external import import_module
 
 
 matplotlib = import_module('matplotlib', min_module_version='1.1.0',
                            catch=(RuntimeError,))
+np = import_module('numpy')
 
 
 class MockPrint:
@@ -308,3 +310,33 @@ def test_append_issue_7140():
 
     with pytest.raises(TypeError):
         p1.append(p2._series)
+
+
+@pytest.mark.skipif(np is None, reason="no numpy")
+def test_adaptive_segments():
+    x = Symbol('x')
+
+    s = LineOver1DRangeSeries(sin(x), (x, -5, 5))
+    segments = s.get_segments()
+    assert segments[0][0] == [-5, np.sin(-5)]
+    assert segments[-1][1] == [5, np.sin(5)]
+    for a, b in zip(segments[:-1], segments[1:]):
+        assert a[1] == b[0]
+    assert all(abs(np.sin(p[0]) - p[1]) < 1e-12
+               for p, _ in segments)
+    # kernels are compiled once
+    assert s.get_kernel([x], sin(x)) is s.get_kernel([x], sin(x))
+
+    # complex values at both ends
+    segments = LineOver1DRangeSeries(sqrt(1 - x**2),
+                                     (x, -3, 3)).get_segments()
+    points = [p for s in segments for p in s if p[1] is not None]
+    assert points
+    assert all(-1 <= p[0] <= 1 for p in points)
+
+    s = Parametric2DLineSeries(cos(x), sin(x), (x, 0, 2*pi))
+    segments = s.get_segments()
+    assert all(abs(p[0]**2 + p[1]**2 - 1) < 1e-12
+               for s in segments for p in s)
+    for a, b in zip(segments[:-1], segments[1:]):
+        assert a[1] == b[0]
@@ -63,6 +63,7 @@
 from diofant.polys.polyconfig import query
 from diofant.polys.polyerrors import (
     ExtraneousFactors, DomainError, CoercionFailed, EvaluationFailed)
+from diofant.core.deadline import check_deadline
 from diofant.ntheory import nextprime, isprime, factorint
 from diofant.utilities import subsets
 
@@ -942,6 +943,9 @@ def dmp_zz_wang(f, u, K, mod=None, seed=None):
 
     while len(configs) < eez_num_configs:
         for _ in range(eez_num_tries):
+            check_deadline('dmp_zz_wang', configs=len(configs),
+                           tries=len(history), mod=mod)
+
             A = [ K(randint(-mod, mod)) for _ in range(u) ]
 
             if tuple(A) not in history:
@@ -6,6 +6,7 @@
 from diofant.polys.polyerrors import DomainError
 from diofant.polys.polyconfig import query
 from diofant.core.symbol import Dummy
+from diofant.core.deadline import check_deadline
 
 
 def groebner(seq, ring, method=None):
@@ -228,6 +229,9 @@ def lcm_divides(ip):
     reductions_to_zero = 0
 
     while CP:
+        check_deadline('_buchberger', basis=len(G), pairs=len(CP),
+                       reductions_to_zero=reductions_to_zero)
+
         ig1, ig2 = select(CP)
         CP.remove((ig1, ig2))
 
@@ -633,6 +637,9 @@ def _f5b(F, ring):
     reductions_to_zero = 0
 
     while len(CP):
+        check_deadline('_f5b', basis=len(B), pairs=len(CP),
+                       reductions_to_zero=reductions_to_zero)
+
         cp = CP.pop()
 
         # discard redundant critical pairs:
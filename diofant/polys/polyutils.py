@@ -6,7 +6,9 @@
 from diofant.polys.polyerrors import PolynomialError, GeneratorsNeeded, GeneratorsError
 from diofant.polys.polyoptions import build_options
 from diofant.core.exprtools import decompose_power
-from diofant.core import S, Add, Mul, Pow, expand_mul, expand_multinomial
+from diofant.core import (S, Add, Mul, Pow, expand_mul, expand_multinomial,
+                          sympify)
+from diofant.core.compatibility import default_sort_key
 
 _gens_order = {
     'a': 301, 'b': 302, 'c': 303, 'd': 304,
@@ -375,17 +377,29 @@ def _is_expandable_pow(expr):
 
 def expr_from_dict(rep, *gens):
     """Convert a multinomial form into an expression. """
-    result = []
+    result, gens = [], [sympify(g) for g in gens]
+
+    # Powers of distinct symbols can't be combined, skip Mul.flatten().
+    raw = all(g.is_Rational or g.is_Symbol and g.is_commutative
+              for g in gens)
 
     for monom, coeff in rep.items():
-        term = [coeff]
+        term = []
         for g, m in zip(gens, monom):
-            if m:
+            if not m:
+                continue
+            elif raw and g.is_Rational:
+                coeff *= g**m
+            else:
                 term.append(Pow(g, m))
+        if raw:
+            term.sort(key=default_sort_key)
+            term = Mul._from_args(term)
+        else:
+            term = Mul(*term)
+        result.append((term, coeff))
 
-        result.append(Mul(*term))
-
-    return Add(*result)
+    return Add.from_terms(result)
 
 parallel_dict_from_basic = parallel_dict_from_expr
 dict_from_basic = dict_from_expr
@@ -5,9 +5,10 @@
 from mpmath.libmp.libintmath import ifac, giant_steps
 
 from diofant.polys.domains import QQ
-from diofant.polys.rings import PolyElement
+from diofant.polys.rings import PolyElement, ring
 from diofant.polys.monomials import monomial_min, monomial_mul
-from diofant.core.numbers import Rational
+from diofant.core.numbers import Rational, igcd, ilcm
+from diofant.core.symbol import Dummy
 from diofant.core.compatibility import as_int
 
 
@@ -193,8 +194,8 @@ def rs_pow(p1, n, x, prec):
     """
     R = p1.ring
     p = R.zero
-    if isinstance(n, Rational):
-        raise NotImplementedError('to be implemented')
+    if isinstance(n, Rational) and not n.is_Integer:
+        return _pow_rational(p1, n, x, prec)
 
     n = as_int(n)
     if n == 0:
@@ -224,6 +225,26 @@ def rs_pow(p1, n, x, prec):
     return p
 
 
+def _pow_rational(p, n, x, prec):
+    """
+    helper function for ``rs_pow``, ``p**n`` for rational ``n``
+
+    ``p**n = c**n*exp(n*log(p/c))``, where ``c`` is the constant term.
+    """
+    R = p.ring
+    zm = R.zero_monom
+    c = p.get(zm, R.domain.zero)
+    if not c:
+        raise NotImplementedError('no constant term in series')
+    if _has_constant_term(p - c, x):
+        raise NotImplementedError('p - p[0] must not have a constant term in the series variables')
+    cn = R.domain.to_diofant(c)**n
+    if not cn.is_Rational:
+        raise NotImplementedError('%s is not a rational number' % cn)
+    q = rs_log(p/c, x, prec)*R.domain.convert(n)
+    return rs_exp(q, x, prec)*R.domain.convert(cn)
+
+
 def _has_constant_term(p, x):
     """
     test if ``p`` has a constant term in ``x``
@@ -503,6 +524,319 @@ def rs_exp(p, x, prec):
     return r
 
 
+def _coefficients(p, x, prec):
+    """
+    helper function, check that ``p`` has no constant term in ``x``
+    and return ``ring(1)`` for coefficients of Taylor series
+    """
+    if _has_constant_term(p, x):
+        raise NotImplementedError('p must not have a constant term in the series variables')
+    return p.ring(1)
+
+
+def rs_sin(p, x, prec):
+    """
+    sine of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_sin(x, x, 6)
+    1/120*x**5 - 1/6*x**3 + x
+    """
+    one = _coefficients(p, x, prec)
+    if len(p) > 20:
+        # sin(p) = 2*t/(1 + t**2), where t = tan(p/2)
+        t = rs_tan(p/2, x, prec)
+        t1 = rs_series_inversion(1 + rs_square(t, x, prec), x, prec)
+        return rs_mul(2*t, t1, x, prec)
+    c = [0]*prec
+    n = 1
+    for k in range(1, prec, 2):
+        c[k] = one/n if k % 4 == 1 else -one/n
+        n *= (k + 1)*(k + 2)
+    return rs_series_from_list(p, c, x, prec)
+
+
+def rs_cos(p, x, prec):
+    """
+    cosine of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_cos(x, x, 6)
+    1/24*x**4 - 1/2*x**2 + 1
+    """
+    one = _coefficients(p, x, prec)
+    if len(p) > 20:
+        # cos(p) = (1 - t**2)/(1 + t**2), where t = tan(p/2)
+        t2 = rs_square(rs_tan(p/2, x, prec), x, prec)
+        t1 = rs_series_inversion(1 + t2, x, prec)
+        return rs_mul(1 - t2, t1, x, prec)
+    c = [0]*prec
+    n = 1
+    for k in range(0, prec, 2):
+        c[k] = one/n if k % 4 == 0 else -one/n
+        n *= (k + 1)*(k + 2)
+    return rs_series_from_list(p, c, x, prec)
+
+
+def rs_atan(p, x, prec):
+    """
+    arctangent of a series modulo ``O(x**prec)``
+
+    Notes
+    =====
+
+    truncation of ``integral dx p**-1*d p/dx`` is used.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_atan(x, x, 8)
+    -1/7*x**7 + 1/5*x**5 - 1/3*x**3 + x
+    """
+    one = _coefficients(p, x, prec)
+    dp = p.diff(x)
+    q = rs_series_inversion(one + rs_square(p, x, prec - 1), x, prec - 1)
+    return rs_integrate(rs_mul(dp, q, x, prec - 1), x)
+
+
+def rs_atanh(p, x, prec):
+    """
+    hyperbolic arctangent of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_atanh(x, x, 8)
+    1/7*x**7 + 1/5*x**5 + 1/3*x**3 + x
+    """
+    one = _coefficients(p, x, prec)
+    dp = p.diff(x)
+    q = rs_series_inversion(one - rs_square(p, x, prec - 1), x, prec - 1)
+    return rs_integrate(rs_mul(dp, q, x, prec - 1), x)
+
+
+def rs_asin(p, x, prec):
+    """
+    arcsine of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_asin(x, x, 8)
+    5/112*x**7 + 3/40*x**5 + 1/6*x**3 + x
+    """
+    one = _coefficients(p, x, prec)
+    dp = p.diff(x)
+    q = rs_pow(one - rs_square(p, x, prec - 1), Rational(-1, 2), x, prec - 1)
+    return rs_integrate(rs_mul(dp, q, x, prec - 1), x)
+
+
+def rs_tan(p, x, prec):
+    """
+    tangent of a series modulo ``O(x**prec)``
+
+    Notes
+    =====
+
+    The Newton method is used to solve ``atan(t) = p``.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_tan(x, x, 8)
+    17/315*x**7 + 2/15*x**5 + 1/3*x**3 + x
+    """
+    one = _coefficients(p, x, prec)
+    t = p.ring.zero
+    for precx in _giant_steps(prec):
+        tmp = p - rs_atan(t, x, precx)
+        t += rs_mul(tmp, one + rs_square(t, x, precx), x, precx)
+    return rs_trunc(t, x, prec)
+
+
+def rs_tanh(p, x, prec):
+    """
+    hyperbolic tangent of a series modulo ``O(x**prec)``
+
+    Notes
+    =====
+
+    The Newton method is used to solve ``atanh(t) = p``.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_tanh(x, x, 8)
+    -17/315*x**7 + 2/15*x**5 - 1/3*x**3 + x
+    """
+    one = _coefficients(p, x, prec)
+    t = p.ring.zero
+    for precx in _giant_steps(prec):
+        tmp = p - rs_atanh(t, x, precx)
+        t += rs_mul(tmp, one - rs_square(t, x, precx), x, precx)
+    return rs_trunc(t, x, prec)
+
+
+def rs_sinh(p, x, prec):
+    """
+    hyperbolic sine of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_sinh(x, x, 8)
+    1/5040*x**7 + 1/120*x**5 + 1/6*x**3 + x
+    """
+    e = rs_exp(p, x, prec)
+    return (e - rs_series_inversion(e, x, prec))/2
+
+
+def rs_cosh(p, x, prec):
+    """
+    hyperbolic cosine of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_cosh(x, x, 8)
+    1/720*x**6 + 1/24*x**4 + 1/2*x**2 + 1
+    """
+    e = rs_exp(p, x, prec)
+    return (e + rs_series_inversion(e, x, prec))/2
+
+
+def rs_nth_root(p, n, x, prec):
+    """
+    ``n``-th root of a series modulo ``O(x**prec)``
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_nth_root(1 + x, 2, x, 4)
+    1/16*x**3 - 1/8*x**2 + 1/2*x + 1
+    >>> rs_nth_root(4 + x, 2, x, 3)
+    -1/64*x**2 + 1/4*x + 2
+    """
+    return rs_pow(p, Rational(1, as_int(n)), x, prec)
+
+
+def rs_compose(p1, p2, x, prec):
+    """
+    composition ``p1(p2)`` of series modulo ``O(x**prec)``
+
+    ``p1`` is a series in ``x``, ``p2`` must not have a constant term
+    in ``x``.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_compose(1 + x + x**2, x + x**2, x, 4)
+    2*x**3 + 2*x**2 + x + 1
+    """
+    ring = p1.ring
+    if _has_constant_term(p2, x):
+        raise NotImplementedError('p2 must not have a constant term in the series variables')
+    iv = ring.gens.index(x)
+    c = [ring.zero for i in range(prec)]
+    for expv, v in p1.items():
+        k = expv[iv]
+        if k < prec:
+            expv = list(expv)
+            expv[iv] = 0
+            c[k] += ring({tuple(expv): v})
+    return rs_series_from_list(p2, c, x, prec)
+
+
+def rs_reversion(p, x, prec):
+    """
+    compositional inverse of a series modulo ``O(x**prec)``
+
+    Returns the series ``q``, such that ``p(q) = x``.  The series ``p``
+    must not have a constant term and its coefficient of ``x`` must be
+    a nonzero number.
+
+    Notes
+    =====
+
+    The Newton method is used.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.rings import ring
+
+    >>> R, x = ring('x', QQ)
+    >>> rs_reversion(x + x**2, x, 5)
+    -5*x**4 + 2*x**3 - x**2 + x
+    """
+    ring = p.ring
+    if _has_constant_term(p, x):
+        raise NotImplementedError('p must not have a constant term in the series variables')
+    iv = ring.gens.index(x)
+    X = ring.gens[iv]
+    linear = [(expv, v) for expv, v in p.items() if expv[iv] == 1]
+    if len(linear) != 1 or linear[0][0] != ring.monomial_basis(iv):
+        raise NotImplementedError('the coefficient of x must be a nonzero number')
+    a = linear[0][1]
+    dp = p.diff(x)
+    q = X/a
+    for precx in _giant_steps(prec):
+        tmp = rs_compose(p, q, x, precx) - X
+        tmp = rs_mul(tmp, rs_series_inversion(rs_compose(dp, q, x, precx),
+                                              x, precx), x, precx)
+        q -= tmp
+    return rs_trunc(q, x, prec)
+
+
 def rs_newton(p, x, prec):
     """
     compute the truncated Newton sum of the polynomial ``p``
@@ -606,3 +940,194 @@ def rs_compose_add(p1, p2):
     if dp:
         q = q*x**dp
     return q
+
+
+def _shift(p, m):
+    """
+    helper function, multiply ``p`` by the monomial ``m``
+    (exponents may be negative)
+    """
+    return p.ring({monomial_mul(expv, m): v for expv, v in p.items()})
+
+
+def _series_denominator(expr, xs):
+    """
+    helper function for ``rs_series``, return a common denominator
+    of (possibly nested) exponents of ``xs`` in ``expr``
+    """
+    if not expr.has(*xs):
+        return 1
+    elif expr.is_Pow and expr.exp.is_Rational:
+        return expr.exp.q*_series_denominator(expr.base, xs)
+    return ilcm(1, 1, *[_series_denominator(a, xs) for a in expr.args])
+
+
+_t = Dummy('t')
+
+
+def rs_series(expr, x, prec):
+    """
+    truncated power series of the expression ``expr`` in ``x``
+    modulo ``O(x**prec)``
+
+    ``x`` may be a sequence of symbols, then the series is truncated by
+    the total degree ``prec`` or, if ``prec`` is a sequence, by the degree
+    in every variable.
+
+    ``expr`` must be built from rational numbers, symbols and elementary
+    functions with arguments, that have no constant term in ``x``
+    (logarithms --- with the constant term 1).  Series with negative
+    and fractional (Puiseux series) exponents of ``x`` are supported,
+    ``NotImplementedError`` is raised for unsupported expressions.
+
+    The series is returned as an element of the ring of polynomials
+    over ``QQ``, generated by ``x**(1/q)`` (``x``, if ``q = 1``) and
+    other symbols of ``expr``.
+
+    Notes
+    =====
+
+    The series is computed in the ring with an additional generator
+    ``t``, where every series variable ``x`` is replaced by
+    ``(t*x**(1/q))**q``, with truncation by ``t``.  The working precision
+    is increased, if terms with negative exponents reduce the accuracy
+    of the result.
+
+    Examples
+    ========
+
+    >>> from diofant import exp, sin, sqrt
+    >>> from diofant.abc import x, y
+
+    >>> rs_series(sin(x)*exp(x), x, 5)
+    1/3*x**3 + x**2 + x
+    >>> rs_series(exp(x + y), [x, y], 3)
+    1/2*x**2 + x*y + x + 1/2*y**2 + y + 1
+    >>> rs_series(exp(x + y), [x, y], [2, 2])
+    x*y + x + y + 1
+    >>> rs_series(sin(x)/x**2, x, 3)
+    -1/6*x + x**-1
+    >>> rs_series(sqrt(x)*exp(x), x, 2).as_expr()
+    x**(3/2) + sqrt(x)
+    """
+    from diofant.core import S
+    from diofant.core.compatibility import default_sort_key, is_sequence
+    from diofant.functions import (asin, atan, atanh, cos, cosh, exp, log,
+                                   sin, sinh, tan, tanh)
+
+    functions = {exp: rs_exp, log: rs_log, sin: rs_sin, cos: rs_cos,
+                 tan: rs_tan, atan: rs_atan, asin: rs_asin, sinh: rs_sinh,
+                 cosh: rs_cosh, tanh: rs_tanh, atanh: rs_atanh}
+
+    xs = tuple(x) if is_sequence(x) else (x,)
+    k = len(xs)
+    params = sorted(expr.free_symbols - set(xs), key=default_sort_key)
+    if not all(s.is_commutative for s in xs + tuple(params)):
+        raise NotImplementedError('non-commutative symbols')
+
+    q = _series_denominator(expr, xs)
+    if is_sequence(prec):
+        if len(prec) != k:
+            raise ValueError('expected %d precisions, got %d' % (k, len(prec)))
+        precs = [as_int(n)*q for n in prec]
+        target = sum(precs) - k + 1
+    else:
+        precs = None
+        target = as_int(prec)*q
+
+    us = [s if q == 1 else s**Rational(1, q) for s in xs]
+    R, T, *gens = ring([_t] + us + params, QQ)
+    images = {s: (T*g)**q for s, g in zip(xs, gens)}
+    images.update(zip(params, gens[k:]))
+
+    INF = float('inf')
+
+    def valuation(p, a):
+        return min(expv[0] for expv in p) if p else a
+
+    def _series(e, prec):
+        if e in cache:
+            return cache[e]
+        if e.is_Rational:
+            r, a = R.ground_new(e), INF
+        elif e in images:
+            r, a = images[e], INF
+        elif e.is_Add:
+            r, a = R.zero, INF
+            for arg in e.args:
+                p, pa = _series(arg, prec)
+                r, a = r + p, min(a, pa)
+        elif e.is_Mul:
+            r, a = R.one, INF
+            for arg in e.args:
+                p, pa = _series(arg, prec)
+                if a == -INF or pa == -INF:
+                    a = -INF
+                else:
+                    a = min(a + valuation(p, pa), pa + valuation(r, a), prec)
+                r = rs_mul(r, p, T, prec)
+        elif (e.is_Pow and e.base is S.Exp1 or
+              e.func in functions and len(e.args) == 1):
+            func, arg = (exp, e.exp) if e.is_Pow else (e.func, e.args[0])
+            p, a = _series(arg, prec)
+            p0 = R({expv: c for expv, c in p.items() if expv[0] <= 0})
+            if a == -INF:
+                r = R.zero
+            elif p0 != (R.one if func is log else R.zero):
+                raise NotImplementedError('unsupported constant term '
+                                          'in argument of %s' % e)
+            else:
+                r, a = functions[func](p, T, prec), min(a, prec)
+        elif e.is_Pow and e.exp.is_Rational:
+            n = e.exp
+            p, a = _series(e.base, prec)
+            v = valuation(p, a)
+            if n.is_Integer and n > 0 and v >= 0:
+                r = rs_pow(p, n, T, prec)
+                a = min(a + (n - 1)*v, prec)
+            elif not p:
+                # not enough terms to find the leading one
+                r, a = R.zero, -INF
+            else:
+                # p = c*m*(1 + O(t)), where m is a monomial
+                lead = [(expv, c) for expv, c in p.items() if expv[0] == v]
+                if len(lead) != 1 or any(lead[0][0][k + 1:]):
+                    raise NotImplementedError('leading term of %s must '
+                                              'be a monomial' % e.base)
+                m, c = lead[0]
+                mn = [i*n for i in m]
+                cn = QQ.to_diofant(c)**n
+                if not all(i.is_Integer for i in mn) or not cn.is_Rational:
+                    raise NotImplementedError('%s is not a Puiseux series' % e)
+                mn = [int(i) for i in mn]
+                p = _shift(p, [-i for i in m])/c
+                r = rs_pow(p, n, T, prec - mn[0])
+                r = rs_trunc(_shift(r, mn), T, prec)*QQ.convert(cn)
+                a = min(a - v + mn[0], prec)
+        else:
+            raise NotImplementedError('unsupported expression %s' % e)
+        cache[e] = r, a
+        return r, a
+
+    prec = target
+    while True:
+        cache = {}
+        r, a = _series(expr, prec)
+        if a >= target:
+            break
+        if prec > 10*target + 10:
+            raise NotImplementedError('precision loss in %s' % expr)
+        prec += target - a if a > -INF else prec
+
+    r = {expv[1:]: c for expv, c in rs_trunc(r, T, target).items()
+         if precs is None or all(i < n for i, n in zip(expv[1:], precs))}
+
+    # use the smallest denominator of exponents
+    g = igcd(q, *[i for expv in r for i in expv[:k]])
+    if g > 1:
+        q //= g
+        us = [s if q == 1 else s**Rational(1, q) for s in xs]
+        r = {tuple(i//g for i in expv[:k]) + expv[k:]: c
+             for expv, c in r.items()}
+
+    return ring(us + params, QQ)[0](r)
@@ -19,28 +19,180 @@ def eqs_to_matrix(eqs, ring):
     return m
 
 
+def eqs_to_rows(eqs, ring):
+    """Transform from equations to sparse rows.
+
+    Every row is a dictionary, which maps indices of generators of
+    ``ring`` to nonzero coefficients, the right-hand side has the index
+    ``len(ring.gens)``.  Nonlinear terms are ignored.
+    """
+    n = len(ring.gens)
+    rows = []
+
+    for e_j in eqs:
+        row = {}
+        for monom, coeff in e_j.terms():
+            if not any(monom):
+                row[n] = -coeff
+            elif sum(monom) == 1:
+                row[monom.index(1)] = coeff
+        if row:
+            rows.append(row)
+
+    return rows
+
+
+def _pivot_row(rows, col):
+    """Return the index of the shortest row with nonzero ``col`` entry. """
+    best = None
+    for i, row in enumerate(rows):
+        if col in row and (best is None or len(row) < len(rows[best])):
+            best = i
+    return best
+
+
+def sparse_rref(rows, ncols, domain):
+    """Reduced row echelon form of a sparse matrix.
+
+    ``rows`` are dictionaries, mapping column indices (less than
+    ``ncols``) to nonzero elements of the field ``domain``.  Returns the
+    list of pairs ``(pivot, row)`` in the order of pivot columns.  The
+    pivot row is chosen with the least number of entries, only rows with
+    a nonzero entry in the pivot column are updated, so the elimination
+    doesn't densify rows without need.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.solvers import sparse_rref
+    >>> sparse_rref([{0: QQ(2), 1: QQ(4)}, {1: QQ(1), 2: QQ(3)}], 3, QQ)
+    [(0, {0: 1, 2: -6}), (1, {1: 1, 2: 3})]
+    """
+    zero = domain.zero
+    pending = [dict(row) for row in rows]
+    echelon = []
+
+    for col in range(ncols):
+        i = _pivot_row(pending, col)
+        if i is None:
+            continue
+        row = pending.pop(i)
+        inv = domain.quo(domain.one, row[col])
+        row = {j: c*inv for j, c in row.items()}
+
+        for other in pending + [r for _, r in echelon]:
+            c = other.get(col)
+            if c is None:
+                continue
+            for j, v in row.items():
+                w = other.get(j, zero) - c*v
+                if w:
+                    other[j] = w
+                else:
+                    del other[j]
+
+        echelon.append((col, row))
+        pending = [r for r in pending if r]
+
+    return echelon
+
+
+def lin_sys_consistent_mod(rows, ncols, domain, p):
+    """Check consistency of a sparse linear system modulo the prime ``p``.
+
+    ``rows`` are returned by :func:`eqs_to_rows`, the last of ``ncols``
+    columns is the right-hand side.  Coefficients must be in the rational
+    field ``domain``.
+
+    Returns False if the system has no solutions modulo ``p``, i.e. (for
+    a large prime ``p``) it has no rational solutions with high
+    probability, True if it's consistent and None if some coefficient has
+    a denominator, divisible by ``p``.
+
+    Examples
+    ========
+
+    >>> from diofant.polys.domains import QQ
+    >>> from diofant.polys.solvers import lin_sys_consistent_mod
+    >>> lin_sys_consistent_mod([{0: QQ(1), 1: QQ(1)}, {0: QQ(2), 1: QQ(2),
+    ...                         2: QQ(1)}], 3, QQ, 2147483647)
+    False
+    """
+    modular = []
+    for row in rows:
+        r = {}
+        for j, c in row.items():
+            num, den = int(domain.numer(c)), int(domain.denom(c))
+            if not den % p:
+                return
+            c = num*pow(den, p - 2, p) % p
+            if c:
+                r[j] = c
+        if r:
+            modular.append(r)
+
+    rhs = ncols - 1
+    for col in range(rhs):
+        i = _pivot_row(modular, col)
+        if i is None:
+            continue
+        row = modular.pop(i)
+        inv = pow(row[col], p - 2, p)
+        row = {j: c*inv % p for j, c in row.items()}
+
+        for other in modular:
+            c = other.get(col)
+            if c is None:
+                continue
+            for j, v in row.items():
+                w = (other.get(j, 0) - c*v) % p
+                if w:
+                    other[j] = w
+                else:
+                    del other[j]
+
+        modular = [r for r in modular if r]
+
+    # remaining rows have only the right-hand side
+    return not modular
+
+
 def solve_lin_sys(eqs, ring):
-    """Solve a system of linear equations. """
+    """Solve a system of linear equations.
+
+    The system is solved with sparse Gauss-Jordan elimination, see
+    :func:`sparse_rref`.
+    """
+    return solve_sparse_lin_sys(eqs_to_rows(eqs, ring), ring)
 
-    assert ring.domain.has_Field
 
-    # transform from equations to matrix form
-    matrix = eqs_to_matrix(eqs, ring)
+def solve_sparse_lin_sys(rows, ring):
+    """Solve a system of linear equations, given by sparse rows.
+
+    See :func:`eqs_to_rows` for the format of ``rows``.
+    """
+
+    assert ring.domain.has_Field
 
-    # solve by row-reduction
-    echelon, pivots = matrix.rref(iszerofunc=lambda x: not x)
+    n = len(ring.gens)
+    echelon = sparse_rref(rows, n + 1, ring.domain)
+    pivots = [p for p, _ in echelon]
 
     if not pivots:
         return {}
-    elif pivots[-1] == len(ring.gens):
+    elif pivots[-1] == n:
         return
-    elif len(pivots) == len(ring.gens):
-        sol = [ring.ground_new(s) for s in echelon[:, -1]]
-        return dict(zip(ring.gens, sol))
+    elif len(pivots) == n:
+        return {ring.gens[p]: ring.ground_new(row.get(n, ring.domain.zero))
+                for p, row in echelon}
     else:
         sols = {}
-        for i, p in enumerate(pivots):
-            vect = RawMatrix([[-x] for x in ring.gens[p+1:]] + [[ring.one]])
-            sols[ring.gens[p]] = (echelon[i, p + 1:]*vect)[0]
+        for p, row in echelon:
+            sol = ring.ground_new(row.get(n, ring.domain.zero))
+            for j, c in row.items():
+                if j != p and j != n:
+                    sol -= ring.gens[j]*c
+            sols[ring.gens[p]] = sol
 
         return sols
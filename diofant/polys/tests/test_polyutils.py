@@ -11,7 +11,8 @@
     _analyze_gens,
     _sort_factors,
     parallel_dict_from_expr,
-    dict_from_expr)
+    dict_from_expr,
+    expr_from_dict)
 from diofant.polys.polyerrors import (
     GeneratorsNeeded,
     PolynomialError)
@@ -312,3 +313,11 @@ def test_sympyissue_10161():
     h = (2*x*(-2*x + Abs(x))*(x**2 - 1)/Abs(x**2 - 1)
          + (x/Abs(x) - 2)*Abs(x**2 - 1))
     assert (h - factor(h)).simplify() == 0
+
+
+def test_expr_from_dict():
+    assert (expr_from_dict({(2, 0): 1, (1, 1): 2, (0, 0): 3}, x, y) ==
+            x**2 + 2*x*y + 3)
+    assert expr_from_dict({(1, 2): 3, (0, 1): 1}, x, Integer(2)) == 12*x + 2
+    assert expr_from_dict({(1, 1): y}, x, sin(x)) == x*y*sin(x)
+    assert expr_from_dict({(1, 1): 1}, x, sqrt(x)) == x**Q(3, 2)
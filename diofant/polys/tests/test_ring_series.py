@@ -6,7 +6,12 @@
     _invert_monoms, rs_integrate,
     rs_trunc, rs_mul, rs_square, rs_pow, _has_constant_term,
     rs_series_inversion, rs_series_from_list, rs_exp, rs_log, rs_newton,
-    rs_hadamard_exp, rs_compose_add)
+    rs_hadamard_exp, rs_compose_add, rs_sin, rs_cos, rs_tan, rs_atan,
+    rs_atanh, rs_asin, rs_sinh, rs_cosh, rs_tanh, rs_nth_root, rs_compose,
+    rs_reversion, rs_series)
+from diofant.core import Rational, Symbol, symbols
+from diofant.functions import (asin, atan, cos, cosh, exp, factorial, log,
+                               sin, sinh, sqrt, tan, tanh)
 
 
 def test_ring_series1():
@@ -184,3 +189,125 @@ def test_compose_add():
     p1 = x**3 - 1
     p2 = x**2 - 2
     assert rs_compose_add(p1, p2) == x**6 - 6*x**4 - 2*x**3 + 12*x**2 - 12*x - 7
+
+
+def test_trig():
+    R, x = ring('x', QQ)
+    assert rs_sin(x, x, 6) == x**5/120 - x**3/6 + x
+    assert rs_cos(x, x, 6) == x**4/24 - x**2/2 + 1
+    assert rs_tan(x, x, 8) == 17*x**7/315 + 2*x**5/15 + x**3/3 + x
+    assert rs_atan(x, x, 8) == -x**7/7 + x**5/5 - x**3/3 + x
+    assert rs_asin(x, x, 8) == 5*x**7/112 + 3*x**5/40 + x**3/6 + x
+    assert rs_atan(rs_tan(x + x**2, x, 10), x, 10) == x + x**2
+
+    p = x + x**2/3 - x**5
+    s, c = rs_sin(p, x, 12), rs_cos(p, x, 12)
+    assert rs_trunc(rs_square(s, x, 12) + rs_square(c, x, 12), x, 12) == 1
+    assert rs_mul(rs_tan(p, x, 12), c, x, 12) == s
+
+    # large series use half-angle formulas
+    p = sum(x**i/i for i in range(1, 25))
+    s, c = rs_sin(p, x, 30), rs_cos(p, x, 30)
+    assert rs_trunc(rs_square(s, x, 30) + rs_square(c, x, 30), x, 30) == 1
+
+    pytest.raises(NotImplementedError, lambda: rs_sin(x + 1, x, 5))
+
+    R, x, y = ring('x, y', QQ)
+    assert rs_sin(x*y, x, 4) == -x**3*y**3/6 + x*y
+
+
+def test_hyperbolic():
+    R, x = ring('x', QQ)
+    assert rs_sinh(x, x, 8) == x**7/5040 + x**5/120 + x**3/6 + x
+    assert rs_cosh(x, x, 8) == x**6/720 + x**4/24 + x**2/2 + 1
+    assert rs_tanh(x, x, 8) == -17*x**7/315 + 2*x**5/15 - x**3/3 + x
+    assert rs_atanh(x, x, 8) == x**7/7 + x**5/5 + x**3/3 + x
+    assert rs_atanh(rs_tanh(x - x**3, x, 10), x, 10) == x - x**3
+
+
+def test_nth_root():
+    R, x = ring('x', QQ)
+    assert rs_nth_root(1 + x, 2, x, 4) == x**3/16 - x**2/8 + x/2 + 1
+    assert rs_nth_root(4 + x, 2, x, 3) == -x**2/64 + x/4 + 2
+    p = 1 + x + x**3/2
+    assert rs_pow(rs_nth_root(p, 3, x, 10), 3, x, 10) == p
+    assert rs_pow(p, Rational(-2, 3), x, 10) == \
+        rs_series_inversion(rs_pow(rs_nth_root(p, 3, x, 10), 2, x, 10), x, 10)
+    pytest.raises(NotImplementedError, lambda: rs_nth_root(2 + x, 2, x, 4))
+    pytest.raises(NotImplementedError, lambda: rs_nth_root(x, 2, x, 4))
+
+
+def test_compose_reversion():
+    R, x = ring('x', QQ)
+    assert rs_compose(1 + x + x**2, x + x**2, x, 4) == 2*x**3 + 2*x**2 + x + 1
+    assert rs_compose(rs_exp(x, x, 8), rs_sin(x, x, 8), x, 8) == \
+        rs_exp(rs_sin(x, x, 8), x, 8)
+    assert rs_reversion(x + x**2, x, 5) == -5*x**4 + 2*x**3 - x**2 + x
+    assert rs_reversion(rs_sin(x, x, 10), x, 10) == rs_asin(x, x, 10)
+    assert rs_reversion(2*x, x, 3) == x/2
+    pytest.raises(NotImplementedError, lambda: rs_reversion(x**2, x, 4))
+    pytest.raises(NotImplementedError, lambda: rs_compose(x, x + 1, x, 4))
+
+
+def test_rs_series():
+    x, y = symbols('x y')
+    R, X, Y = ring('x, y', QQ)
+    assert rs_series(sin(x)*exp(x), x, 5).as_expr() == x**3/3 + x**2 + x
+    assert rs_series(sin(x*y), x, 4) == -X**3*Y**3/6 + X*Y
+
+    def taylor(e, n):
+        return sum(e.diff(x, k).subs(x, 0)*x**k/factorial(k)
+                   for k in range(n)).expand()
+
+    e = sqrt(1 + x)/cos(x) + log(1 + tan(x))
+    assert rs_series(e, x, 6).as_expr() == taylor(e, 6)
+    for f in [asin, atan, cosh, sinh, tanh]:
+        e = f(x**2 + x)
+        assert rs_series(e, x, 6).as_expr() == taylor(e, 6)
+
+    pytest.raises(NotImplementedError, lambda: rs_series(cos(1 + x), x, 4))
+    pytest.raises(NotImplementedError, lambda: rs_series(log(x), x, 4))
+    pytest.raises(NotImplementedError, lambda: rs_series(1/(x + y), x, 4))
+    pytest.raises(NotImplementedError, lambda: rs_series(exp(1/x), x, 4))
+    pytest.raises(NotImplementedError,
+                  lambda: rs_series(Symbol('z', commutative=False)*x, x, 4))
+
+
+def test_rs_series_multivariate():
+    x, y, z = symbols('x y z')
+    R, X, Y = ring('x, y', QQ)
+
+    e = exp(x + y)*cos(x - y)
+    assert rs_series(e, [x, y], 3) == 1 + X + Y + 2*X*Y
+    r = rs_series(e, [x, y], [2, 3])
+    assert r == rs_trunc(rs_trunc(rs_series(e, [x, y], 4), X, 2), Y, 3)
+    assert all(m[0] < 2 and m[1] < 3 for m in r)
+
+    # coefficients may depend on other symbols
+    R, X, Y, Z = ring('x, y, z', QQ)
+    assert rs_series(sin(z*x + y), [x, y], 2) == Z*X + Y
+
+    pytest.raises(ValueError, lambda: rs_series(e, [x, y], [2]))
+    pytest.raises(NotImplementedError, lambda: rs_series(exp(x/y), [x, y], 3))
+
+
+def test_rs_series_puiseux():
+    x, y = symbols('x y')
+
+    assert rs_series(1/x, x, 4).as_expr() == 1/x
+    assert rs_series(sin(x)/x**2, x, 4).as_expr() == 1/x - x/6 + x**3/120
+    assert rs_series((sin(x) - x)/x**3, x, 3).as_expr() == -Rational(1, 6) + x**2/120
+    assert rs_series(1/x**10, x, 4).as_expr() == x**-10
+    assert rs_series(1/sin(x), x, 3).as_expr() == 1/x + x/6
+
+    r = rs_series(sqrt(x)*exp(x), x, 2)
+    assert r.ring.symbols == (sqrt(x),)
+    assert r.as_expr() == sqrt(x) + x**Rational(3, 2)
+    assert rs_series(sqrt(sin(x)), x, 3).as_expr() == sqrt(x) - x**Rational(5, 2)/12
+    assert (rs_series(sqrt(sqrt(x) + x), x, 1).as_expr() ==
+            x**Rational(1, 4) + x**Rational(3, 4)/2)
+    assert rs_series(sqrt(1 + x), x, 3).ring.symbols == (x,)
+
+    r = rs_series(exp(sqrt(x) + y), [x, y], 2)
+    assert r.as_expr() == (1 + sqrt(x) + y + x/2 + sqrt(x)*y +
+                           x**Rational(3, 2)/6)
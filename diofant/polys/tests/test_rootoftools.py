@@ -393,6 +393,8 @@ def test_RootSum_subs():
 
     assert RootSum(f, g).subs(y, 1) == RootSum(f, g)
     assert RootSum(f, g).subs(x, y) == RootSum(F, G)
+    assert RootSum(f, g).xreplace({x: y}) == RootSum(F, G)
+    assert RootSum(f, g).has(x) and not RootSum(f, g).has(y)
 
 
 def test_RootSum_rational():
@@ -3,7 +3,8 @@
 from diofant.polys.rings import ring
 from diofant.polys.fields import field
 from diofant.polys.domains import ZZ, QQ
-from diofant.polys.solvers import solve_lin_sys
+from diofant.polys.solvers import (solve_lin_sys, eqs_to_rows, sparse_rref,
+                                   lin_sys_consistent_mod)
 
 
 def test_solve_lin_sys_2x2_one():
@@ -108,3 +109,36 @@ def test_solve_lin_sys_6x6_2():
     }
 
     assert solve_lin_sys(eqs, domain) == sol
+
+
+def test_eqs_to_rows():
+    domain,  x1, x2 = ring("x1,x2", QQ)
+    assert eqs_to_rows([x1 + 2*x2 - 5, 3*x2, x1*x2 + x1,
+                        domain.zero], domain) == [{0: 1, 1: 2, 2: 5},
+                                                  {1: 3}, {0: 1}]
+
+
+def test_sparse_rref():
+    rows = [{0: QQ(2), 1: QQ(4)}, {1: QQ(1), 2: QQ(3)}, {2: QQ(1)},
+            {0: QQ(1), 1: QQ(2)}]
+    assert sparse_rref(rows, 3, QQ) == [(0, {0: 1}), (1, {1: 1}),
+                                         (2, {2: 1})]
+    assert rows[0] == {0: QQ(2), 1: QQ(4)}  # input rows are not modified
+    assert sparse_rref([], 3, QQ) == []
+
+    # the shortest row is chosen as a pivot
+    rows = [{0: QQ(1), 1: QQ(1), 2: QQ(1)}, {0: QQ(1), 3: QQ(1)},
+            {1: QQ(1), 2: QQ(1)}]
+    assert sparse_rref(rows, 4, QQ) == [(0, {0: 1}), (1, {1: 1, 2: 1}),
+                                         (3, {3: 1})]
+
+
+def test_lin_sys_consistent_mod():
+    p = 2147483647
+    domain,  x1, x2 = ring("x1,x2", QQ)
+    eqs = [x1 + x2 - 1, 2*x1 + 2*x2 - 2]
+    assert lin_sys_consistent_mod(eqs_to_rows(eqs, domain), 3, QQ, p) is True
+    eqs = [x1 + x2 - 1, 2*x1 + 2*x2 - 3]
+    assert lin_sys_consistent_mod(eqs_to_rows(eqs, domain), 3, QQ, p) is False
+    eqs = [x1/p + x2 - 1]
+    assert lin_sys_consistent_mod(eqs_to_rows(eqs, domain), 3, QQ, p) is None
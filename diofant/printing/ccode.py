@@ -88,6 +88,7 @@ class CCodePrinter(CodePrinter):
         'user_functions': {},
         'human': True,
         'contract': True,
+        'tile': None,
         'dereference': set(),
         'error_on_reserved': False,
         'reserved_word_suffix': '_',
@@ -133,6 +134,21 @@ def _get_loop_opening_ending(self, indices):
             close_lines.append("}")
         return open_lines, close_lines
 
+    def _get_tiled_loop_opening_ending(self, indices, tile):
+        open_lines = []
+        tilestart = ("for (int %(tvar)s=%(start)s; %(tvar)s<%(end)s; "
+                     "%(tvar)s+=%(tile)s){")
+        loopstart = ("for (int %(var)s=%(tvar)s; %(var)s<%(end)s && "
+                     "%(var)s<%(tvar)s + %(tile)s; %(var)s++){")
+        for loop in (tilestart, loopstart):
+            for i in indices:
+                var = self._print(i.label)
+                open_lines.append(loop % {
+                    'var': var, 'tvar': var + '_tile', 'tile': tile,
+                    'start': self._print(i.lower),
+                    'end': self._print(i.upper + 1)})
+        return open_lines, ["}"]*len(open_lines)
+
     def _print_Pow(self, expr):
         if "Pow" in self.known_functions:
             return self._print_Function(expr)
@@ -293,6 +309,9 @@ def ccode(expr, assign_to=None, **settings):
         Setting contract=False will not generate loops, instead the user is
         responsible to provide values for the indices in the code.
         [default=True].
+    tile : integer, optional
+        If given, loops over indices of terms with summations are tiled by
+        blocks of ``tile`` iterations (for better cache locality).
 
     Examples
     ========
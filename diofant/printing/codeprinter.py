@@ -1,4 +1,4 @@
-from diofant.core import Add, Mul, Pow, S
+from diofant.core import Add, Mul, Pow, S, Tuple
 from diofant.core.basic import Basic
 from diofant.core.compatibility import default_sort_key
 from diofant.core.function import Lambda
@@ -109,8 +109,9 @@ def doprint(self, expr, assign_to=None):
 
         Parameters
         ----------
-        expr : Expression
-            The expression to be printed.
+        expr : Expression or list of Assignments
+            The expression to be printed.  Loops for a list of assignments
+            are fused, see :meth:`_print_assignments`.
 
         assign_to : Symbol, MatrixSymbol, or string (optional)
             If provided, the printed code will set the expression to a
@@ -118,27 +119,32 @@ def doprint(self, expr, assign_to=None):
         """
         from diofant.matrices.expressions.matexpr import MatrixSymbol
 
-        if isinstance(assign_to, str):
-            if expr.is_Matrix:
-                assign_to = MatrixSymbol(assign_to, *expr.shape)
-            else:
-                assign_to = Symbol(assign_to)
-        elif not isinstance(assign_to, (Basic, type(None))):
-            raise TypeError("{0} cannot assign to object of type {1}".format(
-                type(self).__name__, type(assign_to)))
-
-        if assign_to:
-            expr = Assignment(assign_to, expr)
-        else:
-            # _sympify is not enough b/c it errors on iterables
-            expr = sympify(expr)
-
         # keep a set of expressions that are not strictly translatable to Code
         # and number constants that must be declared and initialized
         self._not_supported = set()
         self._number_symbols = set()
 
-        lines = self._print(expr).splitlines()
+        if (isinstance(expr, (list, tuple)) and expr and assign_to is None and
+                all(isinstance(e, Assignment) for e in expr)):
+            lines = self._print_assignments(expr)
+        else:
+            if isinstance(assign_to, str):
+                if expr.is_Matrix:
+                    assign_to = MatrixSymbol(assign_to, *expr.shape)
+                else:
+                    assign_to = Symbol(assign_to)
+            elif not isinstance(assign_to, (Basic, type(None))):
+                raise TypeError("{0} cannot assign to object of type "
+                                "{1}".format(type(self).__name__,
+                                             type(assign_to)))
+
+            if assign_to:
+                expr = Assignment(assign_to, expr)
+            else:
+                # _sympify is not enough b/c it errors on iterables
+                expr = sympify(expr)
+
+            lines = self._print(expr).splitlines()
 
         # format the output
         if self._settings["human"]:
@@ -203,43 +209,159 @@ def _doprint_loops(self, expr, assign_to=None):
                     indices)
 
                 for term in dummies[d]:
-                    if term in dummies and not ([list(f.keys()) for f in dummies[term]]
-                            == [[None] for f in dummies[term]]):
-                        # If one factor in the term has it's own internal
-                        # contractions, those must be computed first.
-                        # (temporary variables?)
-                        raise NotImplementedError(
-                            "FIXME: no support for contractions in factor yet")
-                    else:
+                    self._check_accumulated_term(term, dummies, assign_to)
 
-                        # We need the lhs expression as an accumulator for
-                        # the loops, i.e
-                        #
-                        # for (int d=0; d < dim; d++){
-                        #    lhs[] = lhs[] + term[][d]
-                        # }           ^.................. the accumulator
-                        #
-                        # We check if the expression already contains the
-                        # lhs, and raise an exception if it does, as that
-                        # syntax is currently undefined.  FIXME: What would be
-                        # a good interpretation?
-                        if assign_to is None:
-                            raise AssignmentError(
-                                "need assignment variable for loops")
-                        if term.has(assign_to):
-                            raise ValueError("FIXME: lhs present in rhs,\
-                                this is undefined in CodePrinter")
-
-                        lines.extend(openloop)
-                        lines.extend(openloop_d)
-                        text = "%s = %s" % (lhs_printed, StrPrinter.doprint(
-                            self, assign_to + term))
-                        lines.append(self._get_statement(text))
-                        lines.extend(closeloop_d)
-                        lines.extend(closeloop)
+                    lines.extend(openloop)
+                    lines.extend(openloop_d)
+                    text = "%s = %s" % (lhs_printed, StrPrinter.doprint(
+                        self, assign_to + term))
+                    lines.append(self._get_statement(text))
+                    lines.extend(closeloop_d)
+                    lines.extend(closeloop)
 
         return "\n".join(lines)
 
+    def _check_accumulated_term(self, term, dummies, assign_to):
+        if term in dummies and not ([list(f.keys()) for f in dummies[term]]
+                                    == [[None] for f in dummies[term]]):
+            # If one factor in the term has it's own internal
+            # contractions, those must be computed first.
+            # (temporary variables?)
+            raise NotImplementedError(
+                "FIXME: no support for contractions in factor yet")
+
+        # We need the lhs expression as an accumulator for
+        # the loops, i.e
+        #
+        # for (int d=0; d < dim; d++){
+        #    lhs[] = lhs[] + term[][d]
+        # }           ^.................. the accumulator
+        #
+        # We check if the expression already contains the
+        # lhs, and raise an exception if it does, as that
+        # syntax is currently undefined.  FIXME: What would be
+        # a good interpretation?
+        if assign_to is None:
+            raise AssignmentError("need assignment variable for loops")
+        if term.has(assign_to):
+            raise ValueError("FIXME: lhs present in rhs,\
+                this is undefined in CodePrinter")
+
+    def _is_loop_assignment(self, expr):
+        from diofant.functions.elementary.piecewise import Piecewise
+        from diofant.tensor.indexed import IndexedBase
+        return (self._settings["contract"] and
+                not isinstance(expr.rhs, Piecewise) and
+                (expr.lhs.has(IndexedBase) or expr.rhs.has(IndexedBase)))
+
+    def _print_assignments(self, assignments):
+        """Print a list of assignments, returns a list of code lines.
+
+        Consecutive assignments to ``Indexed`` objects with the same
+        (non-dummy) indices are computed in a common loop nest, unless
+        some of them access an array, assigned in the nest, with other
+        indices.  If the ``tile`` setting is given, loops for terms with
+        summations are tiled by blocks of ``tile`` iterations.
+        """
+        lines = []
+        group, group_indices = [], None
+        for expr in assignments:
+            if self._is_loop_assignment(expr):
+                indices = self._get_expression_indices(expr.rhs, expr.lhs)
+                if (indices and set(indices) == group_indices and
+                        self._can_fuse(group + [expr])):
+                    group.append(expr)
+                    continue
+            else:
+                indices = None
+            if group:
+                lines.extend(self._print_loop_nest(group))
+            if indices is None:
+                group, group_indices = [], None
+                lines.extend(self._print(expr).splitlines())
+            else:
+                group, group_indices = [expr], set(indices)
+        if group:
+            lines.extend(self._print_loop_nest(group))
+        return lines
+
+    @staticmethod
+    def _can_fuse(assignments):
+        from diofant.tensor.indexed import Indexed
+
+        writes = {}
+        for expr in assignments:
+            if writes.setdefault(expr.lhs.base,
+                                 expr.lhs.indices) != expr.lhs.indices:
+                return False
+        for expr in assignments:
+            for array in expr.rhs.atoms(Indexed):
+                if writes.get(array.base, array.indices) != array.indices:
+                    return False
+        return True
+
+    def _print_loop_nest(self, assignments):
+        """Print assignments (with the same non-dummy indices) in a common
+        loop nest.  Returns a list of code lines."""
+        from diofant.tensor import get_contraction_structure
+
+        expr = assignments[0]
+        indices = self._get_expression_indices(expr.rhs, expr.lhs)
+        indices = self._sort_optimized(indices, Tuple(*assignments))
+        openloop, closeloop = self._get_loop_opening_ending(indices)
+        tile = self._settings.get('tile')
+
+        lines = []
+        body = []
+        for expr in assignments:
+            assign_to = expr.lhs
+            lhs_printed = self._print(assign_to)
+            dummies = get_contraction_structure(expr.rhs)
+
+            # terms with no summations first
+            if None in dummies:
+                text = StrPrinter.doprint(self, Add(*dummies[None]))
+            else:
+                # If all terms have summations we must initialize array to Zero
+                text = StrPrinter.doprint(self, 0)
+
+            # skip redundant assignments (where lhs == rhs)
+            if text != lhs_printed:
+                body.append(self._get_statement("%s = %s" % (lhs_printed,
+                                                             text)))
+
+            # then terms with summations, accumulated in assign_to
+            for d in dummies:
+                if not isinstance(d, tuple):
+                    continue
+                indices_d = self._sort_optimized(d, expr.rhs)
+                for term in dummies[d]:
+                    self._check_accumulated_term(term, dummies, assign_to)
+                    text = "%s = %s" % (lhs_printed, StrPrinter.doprint(
+                        self, assign_to + term))
+                    text = self._get_statement(text)
+                    if tile:
+                        # Tiled loops can't be nested in the common loop nest.
+                        if body:
+                            lines.extend(openloop + body + closeloop)
+                            body = []
+                        # Order of accumulation is arbitrary here, so all
+                        # loops are sorted for better memory access.
+                        indices_t = self._sort_optimized(
+                            indices + indices_d, Tuple(assign_to, term))
+                        openloop_t, closeloop_t = \
+                            self._get_tiled_loop_opening_ending(indices_t,
+                                                                tile)
+                        lines.extend(openloop_t + [text] + closeloop_t)
+                    else:
+                        openloop_d, closeloop_d = \
+                            self._get_loop_opening_ending(indices_d)
+                        body.extend(openloop_d + [text] + closeloop_d)
+
+        if body:
+            lines.extend(openloop + body + closeloop)
+        return lines
+
     def _get_expression_indices(self, expr, assign_to):
         from diofant.tensor import get_indices
         rinds, junk = get_indices(expr)
@@ -314,6 +436,12 @@ def _get_loop_opening_ending(self, indices):
         raise NotImplementedError("This function must be implemented by "
                                   "subclass of CodePrinter.")
 
+    def _get_tiled_loop_opening_ending(self, indices, tile):
+        """Returns a tuple (open_lines, close_lines) containing lists
+        of codelines for loops, tiled by blocks of ``tile`` iterations"""
+        raise NotImplementedError("This function must be implemented by "
+                                  "subclass of CodePrinter.")
+
     def _print_Assignment(self, expr):
         from diofant.functions.elementary.piecewise import Piecewise
         from diofant.matrices.expressions.matexpr import MatrixSymbol
@@ -344,6 +472,8 @@ def _print_Assignment(self, expr):
                 rhs.has(IndexedBase)):
             # Here we check if there is looping to be done, and if so
             # print the required loops.
+            if self._settings.get('tile'):
+                return "\n".join(self._print_loop_nest([expr]))
             return self._doprint_loops(rhs, lhs)
         else:
             lhs_code = self._print(lhs)
@@ -57,6 +57,7 @@ class FCodePrinter(CodePrinter):
         'human': True,
         'source_format': 'fixed',
         'contract': True,
+        'tile': None,
         'standard': 77
     }
 
@@ -124,6 +125,19 @@ def _get_loop_opening_ending(self, indices):
             close_lines.append("end do")
         return open_lines, close_lines
 
+    def _get_tiled_loop_opening_ending(self, indices, tile):
+        open_lines = []
+        for i in indices:
+            var, start, stop = map(self._print,
+                    [i.label, i.lower + 1, i.upper + 1])
+            open_lines.append("do %s_tile = %s, %s, %s" % (var, start,
+                                                           stop, tile))
+        for i in indices:
+            var, stop = map(self._print, [i.label, i.upper + 1])
+            open_lines.append("do %s = %s_tile, min(%s, %s_tile + %s)" % (
+                var, var, stop, var, tile - 1))
+        return open_lines, ["end do"]*len(open_lines)
+
     def _print_Piecewise(self, expr):
         if expr.args[-1].cond != S.true:
             # We need the last conditional to be a True, otherwise the resulting
@@ -432,6 +446,9 @@ def fcode(expr, assign_to=None, **settings):
         Setting contract=False will not generate loops, instead the user is
         responsible to provide values for the indices in the code.
         [default=True].
+    tile : integer, optional
+        If given, loops over indices of terms with summations are tiled by
+        blocks of ``tile`` iterations (for better cache locality).
     source_format : optional
         The source format can be either 'fixed' or 'free'. [default='fixed']
     standard : integer, optional
@@ -1,3 +1,6 @@
+import mpmath.libmp as mlib
+from mpmath.libmp import repr_dps
+
 from .str import StrPrinter
 from diofant.utilities import default_sort_key
 
@@ -76,6 +79,19 @@ def _print_ITE(self, expr):
         return ''.join(result)
 
 
+class MpmathPrinter(LambdaPrinter):
+    """
+    Mpmath printer, which keeps precision of rational and floating-point
+    numbers.
+    """
+
+    def _print_Rational(self, expr):
+        return "mpf(%s)/mpf(%s)" % (expr.p, expr.q)
+
+    def _print_Float(self, expr):
+        return "mpf('%s')" % mlib.to_str(expr._mpf_, repr_dps(expr._prec))
+
+
 class NumPyPrinter(LambdaPrinter):
     """
     Numpy printer which handles vectorized piecewise functions,
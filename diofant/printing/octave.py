@@ -53,6 +53,7 @@ class OctaveCodePrinter(CodePrinter):
         'user_functions': {},
         'human': True,
         'contract': True,
+        'tile': None,
         'inline': True,
     }
     # Note: contract is for expressing tensors as loops (if True), or just
@@ -92,6 +93,19 @@ def _get_loop_opening_ending(self, indices):
             close_lines.append("end")
         return open_lines, close_lines
 
+    def _get_tiled_loop_opening_ending(self, indices, tile):
+        open_lines = []
+        for i in indices:
+            var, start, stop = map(self._print,
+                    [i.label, i.lower + 1, i.upper + 1])
+            open_lines.append("for %s_tile = %s:%s:%s" % (var, start,
+                                                          tile, stop))
+        for i in indices:
+            var, stop = map(self._print, [i.label, i.upper + 1])
+            open_lines.append("for %s = %s_tile:min(%s, %s_tile + %s)" % (
+                var, var, stop, var, tile - 1))
+        return open_lines, ["end"]*len(open_lines)
+
     def _print_Mul(self, expr):
         # print complex numbers nicely in Octave
         if (expr.is_number and expr.is_imaginary and
@@ -223,6 +237,8 @@ def _print_Assignment(self, expr):
                 rhs.has(IndexedBase)):
             # Here we check if there is looping to be done, and if so
             # print the required loops.
+            if self._settings["tile"]:
+                return "\n".join(self._print_loop_nest([expr]))
             return self._doprint_loops(rhs, lhs)
         else:
             lhs_code = self._print(lhs)
@@ -456,6 +472,9 @@ def octave_code(expr, assign_to=None, **settings):
         Setting contract=False will not generate loops, instead the user is
         responsible to provide values for the indices in the code.
         [default=True].
+    tile : integer, optional
+        If given, loops over indices of terms with summations are tiled by
+        blocks of ``tile`` iterations (for better cache locality).
     inline: bool, optional
         If True, we try to create single-statement code instead of multiple
         statements.  [default=True].
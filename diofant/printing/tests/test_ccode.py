@@ -6,6 +6,7 @@
                                gamma, sign)
 from diofant.logic import ITE
 from diofant.printing.ccode import CCodePrinter
+from diofant.printing.codeprinter import Assignment
 from diofant.utilities.lambdify import implemented_function
 from diofant.tensor import IndexedBase, Idx
 from diofant.matrices import Matrix, MatrixSymbol
@@ -476,3 +477,71 @@ def test_ccode_sign():
 
     expr = sign(cos(x))
     assert ccode(expr) == '(((cos(x)) > 0) - ((cos(x)) < 0))'
+
+
+def test_ccode_loops_fused():
+    n, m = symbols('n m', integer=True)
+    A = IndexedBase('A')
+    x = IndexedBase('x')
+    y = IndexedBase('y')
+    w = IndexedBase('w')
+    i = Idx('i', m)
+    j = Idx('j', n)
+
+    s = (
+        'for (int i=0; i<m; i++){\n'
+        '   y[i] = 0;\n'
+        '   for (int j=0; j<n; j++){\n'
+        '      y[i] = x[j]*A[%s] + y[i];\n' % (i*n + j) +
+        '   }\n'
+        '   w[i] = x[i] + y[i];\n'
+        '}\n'
+        'z = 1;\n'
+        'for (int j=0; j<n; j++){\n'
+        '   x[j] = 2*x[j];\n'
+        '}'
+    )
+    c = ccode([Assignment(y[i], A[i, j]*x[j]), Assignment(w[i], x[i] + y[i]),
+               Assignment(z, 1), Assignment(x[j], 2*x[j])])
+    assert c == s
+
+    # x is accessed with other indices
+    s = (
+        'for (int i=0; i<m; i++){\n'
+        '   x[i] = 2*x[i];\n'
+        '}\n'
+        'for (int i=0; i<m; i++){\n'
+        '   w[i] = 0;\n'
+        '   for (int j=0; j<n; j++){\n'
+        '      w[i] = w[i] + x[j]*A[%s];\n' % (i*n + j) +
+        '   }\n'
+        '}'
+    )
+    c = ccode([Assignment(x[i], 2*x[i]), Assignment(w[i], A[i, j]*x[j])])
+    assert c == s
+
+
+def test_ccode_loops_tiled():
+    n, m = symbols('n m', integer=True)
+    A = IndexedBase('A')
+    x = IndexedBase('x')
+    y = IndexedBase('y')
+    i = Idx('i', m)
+    j = Idx('j', n)
+
+    s = (
+        'for (int i=0; i<m; i++){\n'
+        '   y[i] = x[i];\n'
+        '}\n'
+        'for (int i_tile=0; i_tile<m; i_tile+=16){\n'
+        '   for (int j_tile=0; j_tile<n; j_tile+=16){\n'
+        '      for (int i=i_tile; i<m && i<i_tile + 16; i++){\n'
+        '         for (int j=j_tile; j<n && j<j_tile + 16; j++){\n'
+        '            y[i] = x[j]*A[%s] + y[i];\n' % (i*n + j) +
+        '         }\n'
+        '      }\n'
+        '   }\n'
+        '}'
+    )
+    c = ccode(A[i, j]*x[j] + x[i], assign_to=y[i], tile=16)
+    assert c == s
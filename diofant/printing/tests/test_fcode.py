@@ -6,6 +6,7 @@
                      Catalan, EulerGamma, E, GoldenRatio, I, pi)
 from diofant.core.relational import Relational
 from diofant.logic.boolalg import And, Or, Not, Equivalent, Xor
+from diofant.printing.codeprinter import Assignment
 from diofant.printing.fcode import fcode, FCodePrinter
 from diofant.tensor import IndexedBase, Idx
 from diofant.utilities.lambdify import implemented_function
@@ -666,3 +667,32 @@ def test_Matrix_printing():
         "      M(1, 3) = cos(q(3, 1))\n"
         "      M(2, 3) = 5\n"
         "      M(3, 3) = 0")
+
+
+def test_loops_fused_tiled():
+    n, m = symbols('n m', integer=True)
+    A = IndexedBase('A')
+    x = IndexedBase('x')
+    y = IndexedBase('y')
+    w = IndexedBase('w')
+    i = Idx('i', m)
+    j = Idx('j', n)
+
+    expected = (
+        'do i = 1, m\n'
+        '   w(i) = 2*x(i)\n'
+        '   y(i) = 0\n'
+        'end do\n'
+        'do j_tile = 1, n, 8\n'
+        '   do i_tile = 1, m, 8\n'
+        '      do j = j_tile, min(n, j_tile + 7)\n'
+        '         do i = i_tile, min(m, i_tile + 7)\n'
+        '            y(i) = x(j)*A(i, j) + y(i)\n'
+        '         end do\n'
+        '      end do\n'
+        '   end do\n'
+        'end do'
+    )
+    code = fcode([Assignment(w[i], 2*x[i]), Assignment(y[i], A[i, j]*x[j])],
+                 source_format='free', tile=8)
+    assert code == expected
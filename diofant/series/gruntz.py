@@ -65,14 +65,59 @@
 .. [1] `Gruntz Thesis <http://www.cybertester.com/data/gruntz.pdf>`_
 """
 
+import functools
+import threading
 from functools import reduce
 
 from diofant.core import S, Dummy, Mul, Add, evaluate, Float
 from diofant.core.compatibility import ordered
 from diofant.functions import log, exp, sign as sgn
 from diofant.core.cache import cacheit
+from diofant.core.deadline import check_deadline
 
 
+class _Memo(threading.local):
+    tables = None
+
+
+_memo = _Memo()
+_missing = object()
+
+
+def _memoize(func):
+    """Memoize ``func`` for the duration of the outermost call.
+
+    The Gruntz algorithm computes MRV sets, comparability classes, signs
+    and leading terms of the same subexpressions many times, while it
+    recurses through :func:`limitinf`.  Memoized functions of this module
+    share tables, which are created by the outermost call (e.g. for one
+    limit) and dropped, once it's finished.  Unlike :func:`cacheit`, this
+    works with the global cache disabled and doesn't keep results of
+    intermediate computations after the limit was computed.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        tables = _memo.tables
+        outermost = tables is None
+        if outermost:
+            tables = _memo.tables = {}
+        try:
+            table = tables.setdefault(name, {})
+            # func is called outside of an except clause, so recursive
+            # calls don't chain exceptions
+            result = table.get(args, _missing)
+            if result is _missing:
+                result = table[args] = func(*args)
+            return result
+        finally:
+            if outermost:
+                _memo.tables = None
+    return wrapper
+
+
+@_memoize
 def compare(a, b, x):
     r"""
     Determine order relation between two functons.
@@ -107,13 +152,16 @@ def compare(a, b, x):
 
     c = limitinf(la/lb, x)
     if c.is_zero:
-        return -1
+        c = -1
     elif c.is_infinite:
-        return 1
+        c = 1
     else:
-        return 0
+        c = 0
+    _memo.tables['compare'][(b, a, x)] = -c
+    return c
 
 
+@_memoize
 def mrv(e, x):
     """
     Calculate the MRV set of expression.
@@ -168,7 +216,7 @@ def mrv_max(f, g, x):
         return f | g
 
 
-@cacheit
+@_memoize
 def sign(e, x):
     r"""
     Determine a sign of an expression at infinity.
@@ -200,6 +248,7 @@ def sign(e, x):
 
 
 @cacheit
+@_memoize
 def limitinf(e, x):
     """
     Compute limit of the expression at the infinity.
@@ -219,6 +268,8 @@ def limitinf(e, x):
     assert x.is_real and x.is_positive
     assert not e.has(Float)
 
+    check_deadline('limitinf')
+
     # Rewrite e in terms of tractable functions only:
     e = e.rewrite('tractable', deep=True)
 
@@ -244,6 +295,7 @@ def limitinf(e, x):
 
 
 @cacheit
+@_memoize
 def mrv_leadterm(e, x):
     """
     Compute the leading term of the series.
@@ -278,9 +330,21 @@ def mrv_leadterm(e, x):
     # The positive dummy, w, is used here so log(w*2) etc. will expand.
     # TODO: For limits of complex functions, the algorithm would have to
     # be improved, or just find limits of Re and Im components separately.
-    w = Dummy("w", real=True, positive=True)
+    # The same w is used at all levels of recursion (unless it's a
+    # parameter of e), so series of rewritten expressions and limits of
+    # their subexpressions are reused.
+    w = Dummy("w", real=True, positive=True) if e.has(_w) else _w
     e, logw = rewrite(e, x, w)
 
+    return _leadterm(e, w, logw)
+
+
+_w = Dummy("w", real=True, positive=True)
+
+
+@_memoize
+def _leadterm(e, w, logw):
+    """Return the leading term of the series of ``e`` in ``w``."""
     lt = e.compute_leading_term(w, logx=logw)
     return lt.as_coeff_exponent(w)
 
@@ -13,7 +13,7 @@
                      airybi, coth, sinh, tanh, digamma, Integer, Ei, EulerGamma,
                      Mul, Pow, Add, li, Li, tan, acosh, factorial, binomial,
                      root, fibonacci, GoldenRatio, Limit)
-from diofant.series.gruntz import (compare, mrv, rewrite,
+from diofant.series.gruntz import (compare, mrv, rewrite, _memo, _memoize,
                                    mrv_leadterm, limitinf as gruntz, sign)
 
 x = Symbol('x', real=True, positive=True)
@@ -478,3 +478,24 @@ def test_sympyissue_8241():
 
 def test_sympyissue_10976():
     assert gruntz(erf(m/x)/erf(1/x), x) == m
+
+
+def test_memoize():
+    calls = []
+
+    @_memoize
+    def fib(n):
+        calls.append(n)
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(20) == 6765
+    assert len(calls) == 21
+    assert _memo.tables is None
+
+    # tables are created by the outermost call
+    assert fib(3) == 2
+    assert len(calls) == 25
+
+    e = x/log(x)**(log(x)/(m*log(log(x))))
+    pytest.raises(NotImplementedError, lambda: gruntz(e, x))
+    assert _memo.tables is None
@@ -197,3 +197,11 @@ def test_sympyissue_11722():
 def test_sympyissue_11884():
     assert O(x).subs(x, x - 1) + 1 == 1 + O(x - 1, (x, 1))
     assert cos(x).series(x, x0=1, n=1) == cos(1) + O(x - 1, (x, 1))
+
+
+def test_ring_series():
+    # expansions in QQ[x] with truncated power series
+    assert (exp(sin(x)).series(x, n=6) ==
+            1 + x + x**2/2 - x**4/8 - x**5/15 + O(x**6))
+    assert (sqrt(1 + x)/cos(x)).series(x, n=3) == 1 + x/2 + 3*x**2/8 + O(x**3)
+    assert log(1 + x).series(x, n=1) == O(x)
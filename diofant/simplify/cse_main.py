@@ -1,12 +1,15 @@
 """ Tools for doing common subexpression elimination."""
 
+import bisect
+import collections
+
 from diofant.core import Basic, Mul, Add, Pow, sympify, Symbol, Tuple
 from diofant.core.singleton import S
 from diofant.core.function import _coeff_isneg
 from diofant.core.exprtools import factor_terms
 from diofant.core.compatibility import iterable
-from diofant.utilities.iterables import (filter_symbols, numbered_symbols,
-                                         sift, topological_sort, ordered)
+from diofant.utilities.iterables import (numbered_symbols, sift,
+                                         topological_sort, ordered)
 from . import cse_opts
 
 # (preprocessor, postprocessor) pairs which are commonly useful. They should
@@ -133,6 +136,109 @@ def postprocess_for_cse(expr, optimizations):
     return expr
 
 
+class _FuncArgTracker:
+    """Inverted index of arguments of ``funcs`` (Adds or commutative Muls).
+
+    Arguments are numbered in order of appearance and, for each argument,
+    the set of indices of functions, containing it, is maintained.  Thus,
+    functions sharing arguments with the given one are found without
+    comparing it to every other function.
+    """
+
+    def __init__(self, funcs):
+        self.value_numbers = {}
+        self.values = []
+        self.arg_to_funcs = []
+        self.func_to_args = []
+        for i, func in enumerate(funcs):
+            args = {self.number(a) for a in func.args}
+            for a in args:
+                self.arg_to_funcs[a].add(i)
+            self.func_to_args.append(args)
+
+    def number(self, value):
+        """Return the number of ``value``, adding it if necessary."""
+        n = self.value_numbers.setdefault(value, len(self.values))
+        if n == len(self.values):
+            self.values.append(value)
+            self.arg_to_funcs.append(set())
+        return n
+
+    def args(self, argset):
+        """Return values for ``argset``, ordered by their numbers."""
+        return [self.values[n] for n in sorted(argset)]
+
+    def common_arg_candidates(self, i):
+        """Return sorted indices of functions, sharing two or more
+        arguments with the ``i``-th one."""
+        funcsets = [self.arg_to_funcs[a] for a in self.func_to_args[i]]
+        if not funcsets:
+            return []
+        # The largest set is handled separately, to avoid iteration over it.
+        largest = max(funcsets, key=len)
+        counts = collections.defaultdict(int)
+        for funcs in funcsets:
+            if funcs is not largest:
+                for j in funcs:
+                    counts[j] += 1
+        for j in counts:
+            if j in largest:
+                counts[j] += 1
+        return sorted(j for j, c in counts.items() if c > 1 and j != i)
+
+    def funcs_with(self, argset):
+        """Return indices of functions, containing all of ``argset``."""
+        return set.intersection(*[self.arg_to_funcs[a] for a in argset])
+
+    def update(self, i, args):
+        """Replace arguments of the ``i``-th function with ``args``."""
+        old = self.func_to_args[i]
+        for a in old - args:
+            self.arg_to_funcs[a].discard(i)
+        for a in args - old:
+            self.arg_to_funcs[a].add(i)
+        self.func_to_args[i] = args
+
+
+def _match_common_args(Func, funcs, opt_subs, order):
+    """Extract common arguments of ``funcs`` into new functions.
+
+    For every pair of functions, sharing more than one argument, common
+    arguments are replaced (in all functions, containing them) by the
+    function over them, which allows recursive matches.  The rewritten
+    functions are stored in ``opt_subs``.
+    """
+    if order != 'none':
+        funcs = list(ordered(funcs))
+    else:
+        funcs = sorted(funcs, key=lambda x: len(x.args))
+
+    tracker = _FuncArgTracker(funcs)
+    changed = set()
+    for i in range(len(funcs)):
+        candidates = tracker.common_arg_candidates(i)
+        while candidates:
+            j = candidates.pop(0)
+            com_args = tracker.func_to_args[i] & tracker.func_to_args[j]
+            if len(com_args) <= 1:
+                continue
+            com_func = tracker.number(Func(*tracker.args(com_args)))
+
+            for k in tracker.funcs_with(com_args):
+                tracker.update(k, tracker.func_to_args[k] - com_args |
+                               {com_func})
+                if k != i or tracker.func_to_args[i] != {com_func}:
+                    changed.add(k)
+                if k > j and k not in candidates:
+                    bisect.insort(candidates, k)
+
+        if i in changed:
+            opt_subs[funcs[i]] = Func(*tracker.args(tracker.func_to_args[i]),
+                                      evaluate=False)
+        # i-th function is final, exclude it from further matches
+        tracker.update(i, set())
+
+
 def opt_cse(exprs, order='canonical'):
     """Find optimization opportunities in Adds, Muls, Pows and negative
     coefficient Muls
@@ -203,172 +309,292 @@ def _find_opts(expr):
         if isinstance(e, Basic):
             _find_opts(e)
 
-    # Process Adds and commutative Muls
-
-    def _match_common_args(Func, funcs):
-        if order != 'none':
-            funcs = list(ordered(funcs))
-        else:
-            funcs = sorted(funcs, key=lambda x: len(x.args))
-
-        func_args = [set(e.args) for e in funcs]
-        for i in range(len(func_args)):
-            for j in range(i + 1, len(func_args)):
-                com_args = func_args[i].intersection(func_args[j])
-                if len(com_args) > 1:
-                    com_func = Func(*com_args)
-
-                    # for all sets, replace the common symbols by the function
-                    # over them, to allow recursive matches
-
-                    diff_i = func_args[i].difference(com_args)
-                    func_args[i] = diff_i | {com_func}
-                    if diff_i:
-                        opt_subs[funcs[i]] = Func(Func(*diff_i), com_func,
-                                                  evaluate=False)
-
-                    diff_j = func_args[j].difference(com_args)
-                    func_args[j] = diff_j | {com_func}
-                    opt_subs[funcs[j]] = Func(Func(*diff_j), com_func,
-                                              evaluate=False)
-
-                    for k in range(j + 1, len(func_args)):
-                        if not com_args.difference(func_args[k]):
-                            diff_k = func_args[k].difference(com_args)
-                            func_args[k] = diff_k | {com_func}
-                            opt_subs[funcs[k]] = Func(Func(*diff_k), com_func,
-                                                      evaluate=False)
-
     # split muls into commutative
     comutative_muls = set()
     for m in muls:
         c, nc = m.args_cnc(cset=True)
         if c:
-            c_mul = Mul(*c)
             if nc:
+                c_mul = Mul(*c)
                 opt_subs[m] = Mul(c_mul, Mul(*nc), evaluate=False)
+            else:
+                c_mul = m
             if len(c) > 1:
                 comutative_muls.add(c_mul)
 
-    _match_common_args(Add, adds)
-    _match_common_args(Mul, comutative_muls)
+    _match_common_args(Add, adds, opt_subs, order)
+    _match_common_args(Mul, comutative_muls, opt_subs, order)
 
     return opt_subs
 
 
-def tree_cse(exprs, symbols, opt_subs=None, order='canonical'):
-    """Perform raw CSE on expression tree, taking opt_subs into account.
+class CSEContext:
+    """Context for incremental common subexpression elimination.
+
+    Expressions could be added to the context in several batches.  All
+    subexpressions, seen so far, are kept, so a subexpression of new
+    expressions is replaced by the symbol of an earlier replacement or,
+    if it was already seen (but not eliminated), it's eliminated now.
 
     Parameters
     ==========
 
-    exprs : list of diofant expressions
-        The expressions to reduce.
-    symbols : infinite iterator yielding unique Symbols
-        The symbols used to label the common subexpressions which are pulled
-        out.
-    opt_subs : dictionary of expression substitutions
-        The expressions to be substituted before any CSE action is performed.
-    order : string, 'none' or 'canonical'
-        The order by which Mul and Add arguments are processed. For large
-        expressions where speed is a concern, use the setting order='none'.
-    """
-    if opt_subs is None:
-        opt_subs = dict()
+    symbols, optimizations, order
+        Same as for :func:`cse`.
 
-    # Find repeated sub-expressions
+    Attributes
+    ==========
 
-    to_eliminate = set()
+    replacements : list of (Symbol, expression) pairs
+        All of the common subexpressions that were replaced so far.
 
-    seen_subexp = set()
+    Notes
+    =====
 
-    def _find_repeated(expr):
-        if expr.is_Atom or expr.is_Order:
-            return
+    Symbols of earlier replacements could be used in new expressions to
+    refer to the corresponding subexpressions.
 
-        if iterable(expr):
-            args = expr
+    Examples
+    ========
+
+    >>> from diofant import cos, sin
+    >>> from diofant.abc import x, y
+    >>> from diofant.simplify.cse_main import CSEContext
+    >>> ctx = CSEContext()
+    >>> ctx.add([(x + y)*sin(x + y), cos(x)])
+    ([(x0, x + y)], [x0*sin(x0), cos(x)])
+    >>> ctx.add([cos(x) + sin(x + y)/(x + y)])
+    ([(x1, cos(x)), (x2, sin(x0))], [x1 + x2/x0])
+    >>> ctx.replacements
+    [(x0, x + y), (x1, cos(x)), (x2, sin(x0))]
+    """
 
+    def __init__(self, symbols=None, optimizations=None, order='canonical'):
+        if symbols is None:
+            symbols = numbered_symbols()
         else:
-            if expr in seen_subexp:
-                to_eliminate.add(expr)
+            # In case we get passed an iterable with an __iter__ method
+            # instead of an actual iterator.
+            symbols = iter(symbols)
+        self._symbols = symbols
+
+        if optimizations is None:
+            optimizations = list()
+        elif optimizations == 'basic':
+            optimizations = basic_optimizations
+        self.optimizations = optimizations
+
+        self.order = order
+        self.replacements = []
+
+        # Symbols, that could't be used for replacements.
+        self._excluded = set()
+        # Expression substitutions, collected by opt_cse().
+        self._opt_subs = {}
+        # All (non-atomic) subexpressions, seen so far.
+        self._seen = set()
+        # Eliminated subexpressions and their symbols.
+        self._subs = {}
+
+    def _next_symbol(self):
+        for sym in self._symbols:
+            if sym not in self._excluded:
+                return sym
+        raise ValueError("Symbols iterator ran out of symbols.")
+
+    def _tree_cse(self, exprs, opt_subs):
+        seen = self._seen
+        subs = self._subs
+        order = self.order
+
+        # Find repeated sub-expressions
+
+        to_eliminate = set()
+
+        def _find_repeated(expr):
+            if expr.is_Atom or expr.is_Order:
                 return
 
-            seen_subexp.add(expr)
+            if iterable(expr):
+                args = expr
 
-            if expr in opt_subs:
-                expr = opt_subs[expr]
+            else:
+                if expr in seen:
+                    to_eliminate.add(expr)
+                    return
 
-            args = expr.args
+                seen.add(expr)
 
-        list(map(_find_repeated, args))
+                if expr in opt_subs:
+                    expr = opt_subs[expr]
 
-    for e in exprs:
-        if isinstance(e, Basic):
-            _find_repeated(e)
+                args = expr.args
 
-    # Rebuild tree
+            list(map(_find_repeated, args))
 
-    replacements = []
+        for e in exprs:
+            if isinstance(e, Basic):
+                _find_repeated(e)
 
-    subs = dict()
+        # Rebuild tree
 
-    def _rebuild(expr):
+        replacements = []
 
-        if not expr.args:
-            return expr
+        def _rebuild(expr):
 
-        if iterable(expr):
-            new_args = [_rebuild(arg) for arg in expr]
-            return expr.func(*new_args)
-
-        if expr in subs:
-            return subs[expr]
-
-        orig_expr = expr
-        if expr in opt_subs:
-            expr = opt_subs[expr]
-
-        # If enabled, parse Muls and Adds arguments by order to ensure
-        # replacement order independent from hashes
-        if order != 'none':
-            if expr.is_Mul:
-                c, nc = expr.args_cnc()
-                args = list(ordered(c)) + nc
-            elif expr.is_Add:
-                args = list(ordered(expr.args))
+            if not expr.args:
+                return expr
+
+            if iterable(expr):
+                new_args = [_rebuild(arg) for arg in expr]
+                return expr.func(*new_args)
+
+            if expr in subs:
+                return subs[expr]
+
+            orig_expr = expr
+            if expr in opt_subs:
+                expr = opt_subs[expr]
+
+            # If enabled, parse Muls and Adds arguments by order to ensure
+            # replacement order independent from hashes
+            if order != 'none':
+                if expr.is_Mul:
+                    c, nc = expr.args_cnc()
+                    args = list(ordered(c)) + nc
+                elif expr.is_Add:
+                    args = list(ordered(expr.args))
+                else:
+                    args = expr.args
             else:
                 args = expr.args
-        else:
-            args = expr.args
 
-        new_args = list(map(_rebuild, args))
-        if new_args != args:
-            new_expr = expr.func(*new_args)
-        else:
-            new_expr = expr
+            new_args = list(map(_rebuild, args))
+            if new_args != args:
+                new_expr = expr.func(*new_args)
+            else:
+                new_expr = expr
 
-        if orig_expr in to_eliminate:
-            try:
-                sym = next(symbols)
-            except StopIteration:
-                raise ValueError("Symbols iterator ran out of symbols.")
-            subs[orig_expr] = sym
-            replacements.append((sym, new_expr))
-            return sym
+            if orig_expr in to_eliminate:
+                sym = self._next_symbol()
+                subs[orig_expr] = sym
+                replacements.append((sym, new_expr))
+                return sym
 
-        else:
-            return new_expr
+            else:
+                return new_expr
 
-    reduced_exprs = []
-    for e in exprs:
-        if isinstance(e, Basic):
-            reduced_e = _rebuild(e)
-        else:
-            reduced_e = e
-        reduced_exprs.append(reduced_e)
+        reduced_exprs = []
+        for e in exprs:
+            if isinstance(e, Basic):
+                reduced_e = _rebuild(e)
+            else:
+                reduced_e = e
+            reduced_exprs.append(reduced_e)
+
+        return replacements, reduced_exprs
+
+    def add(self, exprs):
+        """Perform common subexpression elimination on new expressions.
+
+        Parameters
+        ==========
+
+        exprs : list of diofant expressions, or a single diofant expression
+            The expressions to reduce.
+
+        Returns
+        =======
+
+        replacements : list of (Symbol, expression) pairs
+            New common subexpressions, see :func:`cse`.
+        reduced_exprs : list of diofant expressions
+            The reduced expressions with all of the replacements so far.
+        """
+        from diofant.matrices import (MatrixBase, Matrix, ImmutableMatrix,
+                                      SparseMatrix, ImmutableSparseMatrix)
+
+        # Handle the case if just one expression was passed.
+        if isinstance(exprs, (Basic, MatrixBase)):
+            exprs = [exprs]
+
+        copy = exprs
+        temp = []
+        for e in exprs:
+            if isinstance(e, (Matrix, ImmutableMatrix)):
+                temp.append(Tuple(*e._mat))
+            elif isinstance(e, (SparseMatrix, ImmutableSparseMatrix)):
+                temp.append(Tuple(*e._smat.items()))
+            else:
+                temp.append(e)
+        exprs = temp
+        del temp
+
+        optimizations = self.optimizations
+
+        # Preprocess the expressions to give us better optimization
+        # opportunities.
+        reduced_exprs = [preprocess_for_cse(e, optimizations) for e in exprs]
+
+        self._excluded.update(*[expr.atoms(Symbol) for expr in reduced_exprs])
+
+        # Find other optimization opportunities.  Substitutions for
+        # expressions, seen earlier, are kept for consistency.
+        for k, v in opt_cse(reduced_exprs, self.order).items():
+            self._opt_subs.setdefault(k, v)
+
+        # Main CSE algorithm.
+        replacements, reduced_exprs = self._tree_cse(reduced_exprs,
+                                                     self._opt_subs)
+
+        # Postprocess the expressions to return the expressions to
+        # canonical form.
+        exprs = copy
+        for i, (sym, subtree) in enumerate(replacements):
+            subtree = postprocess_for_cse(subtree, optimizations)
+            replacements[i] = (sym, subtree)
+        reduced_exprs = [postprocess_for_cse(e, optimizations)
+                         for e in reduced_exprs]
+        self.replacements.extend(replacements)
+
+        # Get the matrices back
+        for i, e in enumerate(exprs):
+            if isinstance(e, (Matrix, ImmutableMatrix)):
+                reduced_exprs[i] = Matrix(e.rows, e.cols, reduced_exprs[i])
+                if isinstance(e, ImmutableMatrix):
+                    reduced_exprs[i] = reduced_exprs[i].as_immutable()
+            elif isinstance(e, (SparseMatrix, ImmutableSparseMatrix)):
+                m = SparseMatrix(e.rows, e.cols, {})
+                for k, v in reduced_exprs[i]:
+                    m[k] = v
+                if isinstance(e, ImmutableSparseMatrix):
+                    m = m.as_immutable()
+                reduced_exprs[i] = m
+
+        return replacements, reduced_exprs
 
-    return replacements, reduced_exprs
+
+def tree_cse(exprs, symbols, opt_subs=None, order='canonical'):
+    """Perform raw CSE on expression tree, taking opt_subs into account.
+
+    Parameters
+    ==========
+
+    exprs : list of diofant expressions
+        The expressions to reduce.
+    symbols : infinite iterator yielding unique Symbols
+        The symbols used to label the common subexpressions which are pulled
+        out.
+    opt_subs : dictionary of expression substitutions
+        The expressions to be substituted before any CSE action is performed.
+    order : string, 'none' or 'canonical'
+        The order by which Mul and Add arguments are processed. For large
+        expressions where speed is a concern, use the setting order='none'.
+    """
+    if opt_subs is None:
+        opt_subs = dict()
+
+    return CSEContext(symbols, order=order)._tree_cse(exprs, opt_subs)
 
 
 def cse(exprs, symbols=None, optimizations=None, postprocess=None,
@@ -438,73 +664,8 @@ def cse(exprs, symbols=None, optimizations=None, postprocess=None,
     >>> isinstance(_[1][-1], SparseMatrix)
     True
     """
-    from diofant.matrices import (MatrixBase, Matrix, ImmutableMatrix,
-                                SparseMatrix, ImmutableSparseMatrix)
-
-    # Handle the case if just one expression was passed.
-    if isinstance(exprs, (Basic, MatrixBase)):
-        exprs = [exprs]
-
-    copy = exprs
-    temp = []
-    for e in exprs:
-        if isinstance(e, (Matrix, ImmutableMatrix)):
-            temp.append(Tuple(*e._mat))
-        elif isinstance(e, (SparseMatrix, ImmutableSparseMatrix)):
-            temp.append(Tuple(*e._smat.items()))
-        else:
-            temp.append(e)
-    exprs = temp
-    del temp
-
-    if optimizations is None:
-        optimizations = list()
-    elif optimizations == 'basic':
-        optimizations = basic_optimizations
-
-    # Preprocess the expressions to give us better optimization opportunities.
-    reduced_exprs = [preprocess_for_cse(e, optimizations) for e in exprs]
-
-    excluded_symbols = set().union(*[expr.atoms(Symbol)
-                                   for expr in reduced_exprs])
-
-    if symbols is None:
-        symbols = numbered_symbols()
-    else:
-        # In case we get passed an iterable with an __iter__ method instead of
-        # an actual iterator.
-        symbols = iter(symbols)
-
-    symbols = filter_symbols(symbols, excluded_symbols)
-
-    # Find other optimization opportunities.
-    opt_subs = opt_cse(reduced_exprs, order)
-
-    # Main CSE algorithm.
-    replacements, reduced_exprs = tree_cse(reduced_exprs, symbols, opt_subs,
-                                           order)
-
-    # Postprocess the expressions to return the expressions to canonical form.
-    exprs = copy
-    for i, (sym, subtree) in enumerate(replacements):
-        subtree = postprocess_for_cse(subtree, optimizations)
-        replacements[i] = (sym, subtree)
-    reduced_exprs = [postprocess_for_cse(e, optimizations)
-                     for e in reduced_exprs]
-
-    # Get the matrices back
-    for i, e in enumerate(exprs):
-        if isinstance(e, (Matrix, ImmutableMatrix)):
-            reduced_exprs[i] = Matrix(e.rows, e.cols, reduced_exprs[i])
-            if isinstance(e, ImmutableMatrix):
-                reduced_exprs[i] = reduced_exprs[i].as_immutable()
-        elif isinstance(e, (SparseMatrix, ImmutableSparseMatrix)):
-            m = SparseMatrix(e.rows, e.cols, {})
-            for k, v in reduced_exprs[i]:
-                m[k] = v
-            if isinstance(e, ImmutableSparseMatrix):
-                m = m.as_immutable()
-            reduced_exprs[i] = m
+    ctx = CSEContext(symbols, optimizations, order)
+    replacements, reduced_exprs = ctx.add(exprs)
 
     if postprocess is None:
         return replacements, reduced_exprs
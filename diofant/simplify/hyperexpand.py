@@ -57,6 +57,7 @@
 #   this reason, we use hand-built routines to match and instantiate formulas.
 #
 
+import sys
 from collections import defaultdict
 from itertools import product, chain
 
@@ -66,7 +67,9 @@
                           Expr, Integer, Rational)
 from diofant.core.mod import Mod
 from diofant.core.compatibility import default_sort_key
+from diofant.core.deadline import check_deadline
 from diofant.utilities.iterables import sift
+from diofant.utilities.tables import cached_table
 from diofant.functions import (exp, sqrt, root, log, lowergamma, cos, besseli,
                                gamma, uppergamma, expint, erf, sin, besselj, Ei,
                                Ci, Si, Shi, sinh, cosh, Chi, fresnels, fresnelc,
@@ -799,24 +802,40 @@ def find_instantiations(self, func):
 class FormulaCollection:
     """ A collection of formulae to use as origins. """
 
-    def __init__(self):
+    def __init__(self, table=None):
         """ Doing this globally at module init time is a pain ... """
-        self.symbolic_formulae = {}
-        self.concrete_formulae = {}
-        self.formulae = []
-
-        add_formulae(self.formulae)
-
-        # Now process the formulae into a helpful form.
-        # These dicts are indexed by (p, q).
-
-        for f in self.formulae:
-            sizes = f.func.sizes
+        if table is None:
+            self._formulae = []
+            add_formulae(self._formulae)
+            table = self.create_table(self._formulae)
+        else:
+            self._formulae = None
+
+        # The table is indexed by (p, q), entries are pairs of the list
+        # of symbolic formulae and of the dict of concrete formulae,
+        # indexed by invariants.
+        self.table = table
+
+    @staticmethod
+    def create_table(formulae):
+        """ Process the formulae into a helpful form. """
+        table = {}
+        for f in formulae:
+            symbolic, concrete = table.setdefault(f.func.sizes, ([], {}))
             if len(f.symbols) > 0:
-                self.symbolic_formulae.setdefault(sizes, []).append(f)
+                symbolic.append(f)
             else:
-                inv = f.func.build_invariants()
-                self.concrete_formulae.setdefault(sizes, {})[inv] = f
+                concrete[f.func.build_invariants()] = f
+        return table
+
+    @property
+    def formulae(self):
+        if self._formulae is None:
+            self._formulae = []
+            for symbolic, concrete in self.table.values():
+                self._formulae.extend(symbolic)
+                self._formulae.extend(concrete.values())
+        return self._formulae
 
     def lookup_origin(self, func):
         """
@@ -838,16 +857,17 @@ def lookup_origin(self, func):
         """
         inv = func.build_invariants()
         sizes = func.sizes
-        if sizes in self.concrete_formulae and \
-                inv in self.concrete_formulae[sizes]:
-            return self.concrete_formulae[sizes][inv]
-
-        # We don't have a concrete formula. Try to instantiate.
-        if sizes not in self.symbolic_formulae:
+        if sizes not in self.table:
             return  # Too bad...
+        symbolic, concrete = self.table[sizes]
+        if inv in concrete:
+            return concrete[inv]
 
+        # We don't have a concrete formula. Try to instantiate.
         possible = []
-        for f in self.symbolic_formulae[sizes]:
+        for f in symbolic:
+            check_deadline('hyperexpand', sizes=sizes, origins=len(possible))
+
             repls = f.find_instantiations(func)
             for repl in repls:
                 func2 = f.func.xreplace(repl)
@@ -1593,6 +1613,8 @@ def do_shifts_b(nal, nbk, bk, aother, bother):
                          lambda p, i: ShiftB(p[i]))
 
     for r in sorted(chain(abuckets.keys(), bbuckets.keys()), key=default_sort_key):
+        check_deadline('hyperexpand', operators=len(ops))
+
         al = ()
         nal = ()
         bk = ()
@@ -1957,6 +1979,30 @@ def hyperexpand_special(ap, bq, z):
 _collection = None
 
 
+def _encode_formula(f):
+    from diofant.matrices import ImmutableMatrix
+    return (f.func, f.z, Tuple(*f.symbols), ImmutableMatrix(f.B),
+            ImmutableMatrix(f.C), ImmutableMatrix(f.M))
+
+
+def _decode_formula(args):
+    from diofant.matrices import Matrix
+    func, z, symbols, B, C, M = args
+    return Formula(func, z, None, symbols, Matrix(B), Matrix(C), Matrix(M))
+
+
+def _encode_entry(entry):
+    symbolic, concrete = entry
+    return ([_encode_formula(f) for f in symbolic],
+            {inv: _encode_formula(f) for inv, f in concrete.items()})
+
+
+def _decode_entry(entry):
+    symbolic, concrete = entry
+    return ([_decode_formula(f) for f in symbolic],
+            {inv: _decode_formula(f) for inv, f in concrete.items()})
+
+
 def _hyperexpand(func, z, ops0=[], z0=Dummy('z0'), premult=1, prem=0,
                  rewrite='default'):
     """
@@ -2004,7 +2050,10 @@ def carryout_plan(f, ops):
 
     global _collection
     if _collection is None:
-        _collection = FormulaCollection()
+        table = cached_table('hyperexpand', lambda: FormulaCollection().table,
+                             [sys.modules[__name__]], encode=_encode_entry,
+                             decode=_decode_entry)
+        _collection = FormulaCollection(table)
 
     debug('Trying to expand hypergeometric function ', func)
 
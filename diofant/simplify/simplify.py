@@ -11,6 +11,7 @@
 from diofant.core.function import expand_log, count_ops, _mexpand
 from diofant.core.rules import Transform
 from diofant.core.evaluate import global_evaluate
+from diofant.core.deadline import check_deadline
 from diofant.functions import (gamma, exp, sqrt, log, exp_polar,
                                piecewise_fold)
 from diofant.functions.elementary.hyperbolic import HyperbolicFunction
@@ -20,6 +21,7 @@
 from diofant.functions.combinatorial.factorials import CombinatorialFunction
 from diofant.functions.special.bessel import besselj, besseli, besselk, jn, bessely
 from diofant.utilities.iterables import has_variety
+from diofant.utilities.racing import get_racing, race
 from diofant.simplify.radsimp import radsimp, fraction
 from diofant.simplify.trigsimp import trigsimp, exptrigsimp
 from diofant.simplify.powsimp import powsimp
@@ -581,6 +583,12 @@ def simplify(expr, ratio=1.7, measure=count_ops, fu=False):
     simplification strategies and then compares them using the measure
     function, we get a completely different result that is still different
     from the input expression by doing this.
+
+    With racing enabled (see :mod:`~diofant.utilities.racing`), the
+    complete sequence of simplification passes and single passes (e.g.
+    :func:`~diofant.simplify.trigsimp.trigsimp` or
+    :func:`~diofant.simplify.powsimp.powsimp`) are run concurrently in
+    worker processes and the best result (by ``measure``) is kept.
     """
     expr = sympify(expr)
 
@@ -602,6 +610,30 @@ def simplify(expr, ratio=1.7, measure=count_ops, fu=False):
         return expr.func(*[simplify(x, ratio=ratio, measure=measure, fu=fu)
                          for x in expr.args])
 
+    if get_racing():
+        # the complete sequence of passes competes with single passes
+        tasks = [('simplify', simplify, (expr,),
+                  {'ratio': ratio, 'measure': measure, 'fu': fu}),
+                 ('cancel', cancel, (expr,), {}),
+                 ('factor', factor, (expr,), {}),
+                 ('together', together, (expr,), {'deep': True}),
+                 ('powsimp', powsimp, (expr,),
+                  {'combine': 'exp', 'deep': True}),
+                 ('radsimp', radsimp, (expr,), {}),
+                 ('hyperexpand', hyperexpand, (expr,), {})]
+        if expr.has(TrigonometricFunction, HyperbolicFunction):
+            tasks.append(('trigsimp', trigsimp, (expr,), {'deep': True}))
+        if expr.has(CombinatorialFunction, gamma):
+            tasks.append(('combsimp', combsimp, (expr,), {}))
+        if expr.has(BesselBase):
+            tasks.append(('besselsimp', besselsimp, (expr,), {}))
+        r = race(tasks, measure=measure)
+        if r is not None:
+            expr = r[1]
+            if measure(expr) <= ratio*measure(original_expr):
+                return expr
+        return original_expr
+
     # TODO: Apply different strategies, considering expression pattern:
     # is it a purely rational function? Is there any trigonometric function?...
     # See also https://github.com/sympy/sympy/pull/185.
@@ -628,6 +660,8 @@ def shorter(*choices):
 
     expr = factor_terms(expr, sign=False)
 
+    check_deadline('simplify', step='hyperexpand')
+
     # hyperexpand automatically only works on hypergeometric terms
     expr = hyperexpand(expr)
 
@@ -638,12 +672,14 @@ def shorter(*choices):
 
     if expr.has(TrigonometricFunction) and not fu or expr.has(
             HyperbolicFunction):
+        check_deadline('simplify', step='trigsimp')
         expr = trigsimp(expr, deep=True)
 
     if expr.has(log):
         expr = shorter(expand_log(expr, deep=True), logcombine(expr))
 
     if expr.has(CombinatorialFunction, gamma):
+        check_deadline('simplify', step='combsimp')
         expr = combsimp(expr)
 
     if expr.has(Sum):
@@ -652,6 +688,8 @@ def shorter(*choices):
     if expr.has(Product):
         expr = product_simplify(expr)
 
+    check_deadline('simplify', step='powsimp')
+
     short = shorter(powsimp(expr, combine='exp', deep=True), powsimp(expr), expr)
     short = shorter(short, factor_terms(short), expand_power_exp(expand_mul(short)))
     if (short.has(TrigonometricFunction, HyperbolicFunction, exp_polar) or
@@ -669,6 +707,8 @@ def shorter(*choices):
         x.is_commutative)
     expr = short.xreplace(hollow_mul)
 
+    check_deadline('simplify', step='radsimp')
+
     numer, denom = expr.as_numer_denom()
     if denom.is_Add:
         n, d = fraction(radsimp(1/denom, symbolic=False, max_terms=1))
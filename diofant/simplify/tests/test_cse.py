@@ -383,3 +383,33 @@ def test_sympyissue_8891():
         ans = ([(x0, x + y)], [x0, cls([[x0, 0], [0, 0]])])
         assert res == ans
         assert isinstance(res[1][-1], cls)
+
+
+def test_CSEContext():
+    ctx = cse_main.CSEContext()
+    assert ctx.add((x + y)*sin(x + y)) == ([(x0, x + y)], [x0*sin(x0)])
+    # already eliminated subexpressions and symbols are reused
+    assert ctx.add([cos(x + y), x0 + 1]) == ([], [cos(x0), x0 + 1])
+    # cos(x0) was seen in the previous batch
+    assert ctx.add([z*cos(x + y)]) == ([(x1, cos(x0))], [x1*z])
+    # symbols of new expressions are excluded
+    assert ctx.add([x2*exp(w + x) + exp(w + x)]) == ([(x3, exp(w + x))],
+                                                     [x2*x3 + x3])
+    assert ctx.replacements == [(x0, x + y), (x1, cos(x0)), (x3, exp(w + x))]
+
+    ctx = cse_main.CSEContext(optimizations='basic')
+    assert ctx.add([exp(-x - y), exp(x + y)]) == ([(x0, exp(x + y))],
+                                                  [1/x0, x0])
+
+
+def test_match_common_args():
+    # all pairs of Adds share arguments
+    eqs = [Add(*[s for s in symbols('y:10') if s != t])
+           for t in symbols('y:10')]
+    r, e = cse(eqs)
+    assert [_.subs(list(reversed(r))) for _ in e] == eqs
+    assert all(len(_.args) <= 3 for _ in e)
+
+    # common arguments are matched in all functions
+    assert cse([w + x + y, w + x + z, w + x]) == ([(x0, w + x)],
+                                                  [x0 + y, x0 + z, x0])
@@ -9,7 +9,7 @@
     [-1]
 """
 from .solvers import (solve, solve_undetermined_coeffs,
-                      solve_linear, checksol)
+                      solve_linear, checksol, nsolve)
 
 from .recurr import rsolve, rsolve_poly, rsolve_ratio, rsolve_hyper
 
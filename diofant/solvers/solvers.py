@@ -1970,6 +1970,268 @@ def solve_undetermined_coeffs(equ, coeffs, sym, **flags):
         return  # no solutions
 
 
+# Residuals and the Jacobian, compiled in worker processes of nsolve()
+_nsolve_func = None
+
+
+def _nsolve_compile(symbols, exprs, dps, complex=False):
+    """Return the mpmath context and a function, which computes
+    residuals and the Jacobian of ``exprs`` at a point.
+
+    With ``complex``, functions of the compiled code in machine precision
+    accept complex numbers.
+    """
+    import mpmath
+    from diofant.printing.lambdarepr import MpmathPrinter
+
+    m, n = len(exprs), len(symbols)
+    jac = [e.diff(s) for e in exprs for s in symbols]
+    if dps is None:
+        ctx = mpmath.fp
+        if complex:
+            # functions of the math module don't accept complex numbers
+            modules = [{k: getattr(ctx, k) for k in dir(ctx)
+                        if not k.startswith('_')}, 'mpmath', 'diofant']
+        else:
+            modules = ['math', 'mpmath', 'diofant']
+        f = lambdify(symbols, exprs + jac, modules, cse=True)
+    else:
+        ctx = mpmath.mp
+        f = lambdify(symbols, exprs + jac, ['mpmath', 'diofant'],
+                     printer=MpmathPrinter, cse=True)
+
+    def func(x):
+        v = f(*x)
+        F = ctx.matrix(v[:m])
+        J = ctx.matrix(m, n)
+        for i in range(m):
+            for j in range(n):
+                J[i, j] = v[m + i*n + j]
+        return F, J
+    return ctx, func
+
+
+def _nsolve_eval(func, x):
+    try:
+        return func(x)
+    except (ArithmeticError, ValueError):
+        return None, None
+
+
+def _nsolve_root(ctx, func, x0, method, tol, maxsteps):
+    """Find a root, starting from ``x0``, return None on failure."""
+    x = ctx.matrix([ctx.convert(v) for v in x0])
+    F, J = _nsolve_eval(func, x)
+    if F is None:
+        return
+    n = J.cols
+    mu, nu = None, 2
+
+    for _ in range(maxsteps):
+        fnorm = ctx.norm(F)
+        if not fnorm:
+            break
+        A, g = J.H*J, J.H*F
+
+        if method == 'newton':
+            # Damped Newton step, singular or underdetermined systems
+            # are regularized as in the Levenberg-Marquardt method.
+            try:
+                h = ctx.lu_solve(J, -F)
+            except (ZeroDivisionError, ValueError):
+                h = ctx.lu_solve(A + fnorm*ctx.eye(n), -g)
+            t = 1
+            while t > ctx.eps:
+                xn = x + t*h
+                Fn, Jn = _nsolve_eval(func, xn)
+                if Fn is not None and ctx.norm(Fn) < fnorm:
+                    break
+                t /= 2
+            else:
+                break
+        else:
+            # Levenberg-Marquardt step, with the damping parameter
+            # updated as proposed by Nielsen.
+            if mu is None:
+                mu = 1e-3*max(abs(A[i, i]) for i in range(n)) or 1e-3
+            try:
+                h = ctx.lu_solve(A + mu*ctx.eye(n), -g)
+            except ZeroDivisionError:
+                break
+            xn = x + h
+            Fn, Jn = _nsolve_eval(func, xn)
+            gain = (fnorm**2 - ctx.norm(Fn)**2 if Fn is not None else -1)
+            gain /= ctx.re((h.H*(mu*h - g))[0]) or 1
+            if gain <= 0:
+                mu, nu = mu*nu, 2*nu
+                if ctx.norm(h) > ctx.eps*(1 + ctx.norm(x)):
+                    continue
+                break
+            mu, nu = mu*max(ctx.one/3, 1 - (2*gain - 1)**3), 2
+
+        converged = ctx.norm(xn - x) <= 4*ctx.eps*(1 + ctx.norm(x))
+        x, F, J = xn, Fn, Jn
+        if converged:
+            break
+
+    if ctx.norm(F)**2 <= tol:
+        return list(x)
+
+
+def _nsolve_init(symbols, exprs, dps, complex):
+    global _nsolve_func
+    _nsolve_func = _nsolve_compile(symbols, exprs, dps, complex)
+
+
+def _nsolve_start(args):
+    import mpmath
+
+    x0, method, tol, maxsteps, prec = args
+    with mpmath.workprec(prec):
+        return _nsolve_root(*_nsolve_func, x0, method, tol, maxsteps)
+
+
+def nsolve(f, symbols, x0, dps=None, method='newton', tol=None,
+           maxsteps=50, processes=None):
+    """
+    Find a numerical solution of a system of equations.
+
+    The Jacobian of the system is computed symbolically once and compiled
+    together with residuals by :func:`~diofant.utilities.lambdify.lambdify`
+    (with common subexpression elimination).
+
+    Parameters
+    ==========
+
+    f : Expr, Equality or sequence of them
+        Equations.  Systems with more equations than unknowns are solved
+        in the least squares sense.
+    symbols : Symbol or sequence of Symbol
+        Unknowns, ``f`` must not depend on other symbols.
+    x0 : number, sequence of numbers or sequence of sequences
+        The initial point (a number for one unknown).  A sequence of
+        initial points (each is a sequence, even for one unknown) turns
+        on the multi-start mode.
+    dps : int or None, optional
+        If None (default), computations are done with machine floats.
+        Otherwise, mpmath is used with ``dps`` decimal digits of precision.
+    method : {'newton', 'lm'}, optional
+        Damped Newton method with backtracking (default) or the
+        Levenberg-Marquardt method.
+    tol : number or None, optional
+        A root is accepted, if the squared norm of residuals is less than
+        ``tol``.  Default is the machine epsilon (of the working
+        precision), multiplied by `2^{10}`.
+    maxsteps : int, optional
+        Maximal number of iterations.
+    processes : int or None, optional
+        If given, initial points of the multi-start mode are distributed
+        over a pool of worker processes.
+
+    Returns
+    =======
+
+    A dictionary, which maps ``symbols`` to values of the root.  In the
+    multi-start mode, a list of distinct roots in order of the initial
+    points, which converged.
+
+    Raises
+    ======
+
+    ValueError
+        If the iteration, started from ``x0``, did not converge to a root
+        (not in the multi-start mode).
+
+    Examples
+    ========
+
+    >>> from diofant import sin, Eq
+    >>> from diofant.abc import x, y
+
+    >>> nsolve(sin(x), x, 3)
+    {x: 3.14159265358979}
+    >>> nsolve(sin(x), x, 3, dps=30)
+    {x: 3.14159265358979323846264338328}
+    >>> nsolve([x**2 + y**2 - 1, Eq(x, y**2)], [x, y], [1, 1])
+    {x: 0.618033988749895, y: 0.786151377757423}
+
+    In the multi-start mode, every root is found once:
+
+    >>> nsolve(x**3 - x, x, [[-3], [-0.2], [0.3], [2], [5]])
+    [{x: -1.0}, {x: 0}, {x: 1.0}]
+
+    See Also
+    ========
+
+    diofant.polys.polytools.Poly.nroots
+    """
+    import mpmath
+
+    if method not in ('newton', 'lm'):
+        raise ValueError("method should be 'newton' or 'lm', got %s" % method)
+
+    exprs = list(f) if iterable(f) else [f]
+    exprs = [sympify(e) for e in exprs]
+    exprs = [e.lhs - e.rhs if isinstance(e, Equality) else e for e in exprs]
+    symbols = list(symbols) if iterable(symbols) else [symbols]
+
+    extra = set().union(*[e.free_symbols for e in exprs]) - set(symbols)
+    if extra:
+        raise ValueError('equations depend on other symbols: %s' %
+                         ', '.join(map(str, ordered(extra))))
+
+    multistart = iterable(x0) and all(iterable(p) for p in x0)
+    starts = [list(p) for p in x0] if multistart else [x0]
+    prec = 53 if dps is None else mpmath.libmp.dps_to_prec(dps)
+    for i, p in enumerate(starts):
+        p = list(p) if iterable(p) else [p]
+        if len(p) != len(symbols):
+            raise ValueError('expected %s coordinates of the initial '
+                             'point, got %s' % (len(symbols), len(p)))
+        starts[i] = [sympify(v).evalf(dps or 15)._to_mpmath(prec) for v in p]
+
+    complex = any(isinstance(v, mpmath.mpc) for p in starts for v in p)
+
+    ctx = mpmath.fp if dps is None else mpmath.mp
+    with mpmath.workprec(prec):
+        if tol is None:
+            tol = ctx.eps*2**10
+
+        if processes is None or not multistart:
+            compiled = _nsolve_compile(symbols, exprs, dps, complex)
+            roots = [_nsolve_root(*compiled, p, method, tol, maxsteps)
+                     for p in starts]
+        else:
+            import multiprocessing
+            pool = multiprocessing.Pool(processes, _nsolve_init,
+                                        (symbols, exprs, dps, complex))
+            try:
+                roots = pool.map(_nsolve_start, [(p, method, tol, maxsteps,
+                                                  prec) for p in starts])
+            finally:
+                pool.terminate()
+
+        def convert(r):
+            return {s: Expr._from_mpmath(mpmath.mpmathify(v), prec)
+                    for s, v in zip(symbols, r)}
+
+        if not multistart:
+            if roots[0] is None:
+                raise ValueError('could not find a root within given '
+                                 'tolerance, try another initial point')
+            return convert(roots[0])
+
+        distinct = []
+        for r in roots:
+            if r is None:
+                continue
+            r = ctx.matrix(r)
+            if all(ctx.norm(r - d) > ctx.sqrt(tol)*(1 + ctx.norm(d))
+                   for d in distinct):
+                distinct.append(r)
+        return [convert(r) for r in distinct]
+
+
 # these are functions that have multiple inverse values per period
 multi_inverses = {
     sin: lambda x: (asin(x), S.Pi - asin(x)),
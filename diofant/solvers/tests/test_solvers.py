@@ -5,13 +5,13 @@
 from diofant import (
     Abs, And, Derivative, Dummy, Eq, Float, Function, Gt, I, Integral,
     LambertW, Lt, Matrix, Or, Piecewise, Poly, Rational, S, Symbol,
-    Wild, acos, asin, atan, atanh, cos, cosh, diff, erf, erfinv, erfc,
-    erfcinv, exp, im, log, pi, re, sec, sin, Integer, Pow, expand_log,
-    sinh, solve, solve_linear, sqrt, sstr, symbols, sympify, tan, tanh,
-    root, simplify, atan2, arg, SparseMatrix, Tuple, oo)
+    Wild, acos, acosh, asin, atan, atanh, cos, cosh, diff, erf, erfinv,
+    erfc, erfcinv, exp, im, log, pi, re, sec, sin, Integer, Pow,
+    expand_log, sinh, solve, solve_linear, sqrt, sstr, symbols, sympify,
+    tan, tanh, root, simplify, atan2, arg, SparseMatrix, Tuple, oo)
 from diofant.core.function import nfloat
 from diofant.solvers import solve_linear_system, solve_undetermined_coeffs
-from diofant.solvers.solvers import _invert, checksol, posify
+from diofant.solvers.solvers import _invert, checksol, posify, nsolve
 from diofant.polys.rootoftools import RootOf
 from diofant.utilities.randtest import verify_numerically as tn
 
@@ -1381,3 +1381,48 @@ def test_sympyissue_8828():
 
 def test_sympyissue_10391():
     assert solve((2*x + 8)*exp(-6*x), x) == [-4]
+
+
+def test_nsolve():
+    r = nsolve(sin(x), x, 3)
+    assert list(r) == [x] and abs(r[x] - pi) < 1e-15
+    r = nsolve(sin(x), x, 3, dps=50)
+    assert abs(r[x] - pi) < Float('1e-49', 50)
+    assert r[x]._prec == Float(1, 50)._prec
+
+    system = [x**2 + y**2 - 1, Eq(x, y**2)]
+    exact = {x: (sqrt(5) - 1)/2, y: sqrt((sqrt(5) - 1)/2)}
+    for method in ('newton', 'lm'):
+        r = nsolve(system, [x, y], [1, 1], method=method)
+        assert all(abs(r[s] - exact[s]) < 1e-14 for s in (x, y))
+
+    # singular Jacobian at the initial point
+    assert nsolve([x + y**2 - 2, x - y], [x, y], [1, -0.5]) == {x: 1, y: 1}
+
+    # overdetermined systems
+    r = nsolve([x**2 + y**2 - 1, x - y, x + y - sqrt(2)], [x, y], [1, 0])
+    assert abs(r[x] - sqrt(2)/2) < 1e-14 and abs(r[y] - sqrt(2)/2) < 1e-14
+    pytest.raises(ValueError, lambda: nsolve([x - 1, x - 2], x, 0))
+
+    assert abs(nsolve(x**2 + 1, x, I)[x] - I) < 1e-15
+    assert abs(nsolve(x**2 + 1, x, I, dps=30)[x] - I) < 1e-29
+    root = (pi/2 + I*acosh(2)).evalf(30)
+    assert abs(nsolve(sin(x) - 2, x, 1 + I)[x] - root) < 1e-14
+    assert abs(nsolve(sin(x) - 2, x, 1 + I, dps=20)[x] - root) < 1e-19
+    assert abs(nsolve(exp(x) + 1, x, [[3*I]])[0][x] - pi.evalf()*I) < 1e-14
+
+    pytest.raises(ValueError, lambda: nsolve(x**2 + 1, x, 1))
+    pytest.raises(ValueError, lambda: nsolve(x + y, x, 1))
+    pytest.raises(ValueError, lambda: nsolve(x + y, [x, y], [1]))
+    pytest.raises(ValueError, lambda: nsolve(x, x, 1, method='spam'))
+
+    # multi-start
+    roots = nsolve(x**3 - x, x, [[-3], [-0.2], [0.3], [2], [5]])
+    assert [r[x] for r in roots] == [-1, 0, 1]
+    assert nsolve(x**2 + 1, x, [[1], [2]]) == []
+    starts = [[i, j] for i in (-2, 2) for j in (-2, 2)]
+    system = [x**2 - 1, y**2 - 4]
+    roots = nsolve(system, [x, y], starts, dps=20)
+    assert roots == nsolve(system, [x, y], starts, dps=20, processes=2)
+    assert [(r[x], r[y]) for r in roots] == [(-1, -2), (-1, 2),
+                                             (1, -2), (1, 2)]
@@ -67,14 +67,19 @@
 
 _doctest_depends_on = {'exe': ('f2py', 'gfortran', 'gcc'), 'modules': ('numpy',)}
 
+import importlib.machinery
+import itertools
+import importlib.util
 import sys
 import os
 import shutil
+import sysconfig
 import tempfile
 from subprocess import STDOUT, CalledProcessError, check_output
 from string import Template
 
 from diofant.core.cache import cacheit
+from diofant.core.containers import Tuple
 from diofant.core.function import Lambda
 from diofant.core.relational import Eq
 from diofant.core.symbol import Dummy, Symbol
@@ -85,6 +90,8 @@
                                        ResultBase, CCodeGen)
 from diofant.utilities.lambdify import implemented_function
 from diofant.utilities.decorator import doctest_depends_on
+from diofant.utilities.iterables import numbered_symbols
+from diofant.utilities.diskcache import disk_cache_key, get_disk_cache
 
 
 class CodeWrapError(Exception):
@@ -99,11 +106,17 @@ class CodeWrapper:
 
     @property
     def filename(self):
-        return "%s_%s" % (self._filename, CodeWrapper._module_counter)
+        return "%s_%s" % (self._filename, self._module_tag)
 
     @property
     def module_name(self):
-        return "%s_%s" % (self._module_basename, CodeWrapper._module_counter)
+        return "%s_%s" % (self._module_basename, self._module_tag)
+
+    @property
+    def _module_tag(self):
+        if self._cache_tag is not None:
+            return self._cache_tag
+        return CodeWrapper._module_counter
 
     def __init__(self, generator, filepath=None, flags=[], verbose=False):
         """
@@ -113,6 +126,7 @@ def __init__(self, generator, filepath=None, flags=[], verbose=False):
         self.filepath = filepath
         self.flags = flags
         self.quiet = not verbose
+        self._cache_tag = None
 
     @property
     def include_header(self):
@@ -135,15 +149,32 @@ def wrap_code(self, routine, helpers=[]):
             os.mkdir(workdir)
         oldwork = os.getcwd()
         os.chdir(workdir)
+        cache = get_disk_cache()
         try:
             sys.path.append(workdir)
-            self._generate_code(routine, helpers)
+            if cache is not None:
+                key = self._cache_key(routine, helpers)
+                # Name module after the key, so cached binaries are
+                # importable in other processes.
+                self._cache_tag = key[:16]
+                path = cache.get(key)
+                if path is not None:
+                    try:
+                        mod = self._load_module(path)
+                        return self._get_wrapped_function(mod, routine.name)
+                    except (OSError, ImportError, ValueError):
+                        pass
+            self._generate_code(routine, list(helpers))
             self._prepare_files(routine)
             self._process_files(routine)
             mod = __import__(self.module_name)
+            if cache is not None:
+                cache.put(key, {f: os.path.join(workdir, f)
+                                for f in self._module_files(workdir)})
         finally:
             sys.path.remove(workdir)
             CodeWrapper._module_counter += 1
+            self._cache_tag = None
             os.chdir(oldwork)
             if not self.filepath:
                 try:
@@ -154,6 +185,46 @@ def wrap_code(self, routine, helpers=[]):
 
         return self._get_wrapped_function(mod, routine.name)
 
+    def _cache_key(self, routine, helpers):
+        """Return the disk cache key for the generated code.
+
+        The key is computed from sources (generated with a fixed module
+        name), the build command and flags.
+        """
+        self._cache_tag = 'diofant'
+        self._generate_code(routine, list(helpers))
+        self._prepare_files(routine)
+        sources = {}
+        for f in os.listdir('.'):
+            if f == 'setup.py' or f.startswith((self.filename,
+                                                self.module_name)):
+                with open(f, 'rb') as fd:
+                    sources[f] = fd.read()
+                if f != 'setup.py':
+                    os.remove(f)
+        return disk_cache_key('autowrap', self.__class__, sources,
+                              getattr(self, 'command', None),
+                              list(self.flags))
+
+    def _module_files(self, workdir):
+        """Return names of files, which constitute the wrapped module."""
+        suffixes = tuple(importlib.machinery.EXTENSION_SUFFIXES) + ('.py',)
+        return [f for f in os.listdir(workdir)
+                if f.startswith(self.module_name) and f.endswith(suffixes)
+                and f[len(self.module_name):].split('.')[0] == '']
+
+    def _load_module(self, path):
+        """Import the wrapped module from the disk cache entry ``path``."""
+        if self.module_name in sys.modules:
+            return sys.modules[self.module_name]
+        filename, = self._module_files(path)
+        spec = importlib.util.spec_from_file_location(self.module_name,
+                                                      os.path.join(path, filename))
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        sys.modules[self.module_name] = mod
+        return mod
+
     def _process_files(self, routine):
         command = self.command
         command.extend(self.flags)
@@ -578,9 +649,16 @@ def binary_function(symfunc, expr, **kwargs):
     npy_intp n = dimensions[0];
     ${declare_args}
     ${declare_steps}
-    for (i = 0; i < n; i++) {
-        *((double *)out1) = ${funcname}(${call_args});
-        ${step_increments}
+    if (${contiguous}) {
+        ${declare_arrays}
+${parallel}        for (i = 0; i < n; i++) {
+            ${contiguous_call};
+        }
+    }
+    else {
+${parallel}        for (i = 0; i < n; i++) {
+            ${strided_call};
+        }
     }
 }
 PyUFuncGenericFunction ${funcname}_funcs[1] = {&${funcname}_ufunc};
@@ -638,29 +716,33 @@ def binary_function(symfunc, expr, **kwargs):
     PyDict_SetItemString(d, "${funcname}", ufunc${ind});
     Py_DECREF(ufunc${ind});""")
 
-_ufunc_setup = Template("""\
-def configuration(parent_package='', top_path=None):
-    import numpy
-    from numpy.distutils.misc_util import Configuration
+# Minimal length of arrays to run the ufunc loop in parallel (with OpenMP)
+_ufunc_omp_threshold = 1000
 
-    config = Configuration('',
-                           parent_package,
-                           top_path)
-    config.add_extension('${module}', sources=['${module}.c', '${filename}.c'])
 
-    return config
-
-if __name__ == "__main__":
-    from numpy.distutils.core import setup
-    setup(configuration=configuration)""")
+class UfuncifyCodeWrapper(CodeWrapper):
+    """Wrapper for Ufuncify
 
+    The generated C module is compiled directly with the C compiler
+    (``gcc``, unless overridden by the ``CC`` environment variable).
+    If ``openmp`` is True, the ufunc loop is parallelized with OpenMP.
+    """
 
-class UfuncifyCodeWrapper(CodeWrapper):
-    """Wrapper for Ufuncify"""
+    def __init__(self, *args, openmp=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.openmp = openmp
 
     @property
     def command(self):
-        command = [sys.executable, "setup.py", "build_ext", "--inplace"]
+        import numpy
+        command = [os.getenv('CC', 'gcc'), '-shared', '-fPIC', '-O3', '-flto',
+                   '-I' + sysconfig.get_paths()['include'],
+                   '-I' + numpy.get_include(),
+                   self.module_name + '.c', self.filename + '.c',
+                   '-o', self.module_name + sysconfig.get_config_var('EXT_SUFFIX'),
+                   '-lm']
+        if self.openmp:
+            command.append('-fopenmp')
         return command
 
     def _prepare_files(self, routine):
@@ -670,19 +752,10 @@ def _prepare_files(self, routine):
         with open(codefilename, 'w') as f:
             self.dump_c([routine], f, self.filename)
 
-        # setup.py
-        with open('setup.py', 'w') as f:
-            self.dump_setup(f)
-
     @classmethod
     def _get_wrapped_function(cls, mod, name):
         return getattr(mod, name)
 
-    def dump_setup(self, f):
-        setup = _ufunc_setup.substitute(module=self.module_name,
-                                        filename=self.filename)
-        f.write(setup)
-
     def dump_c(self, routines, f, prefix):
         """Write a C file with python wrappers
 
@@ -711,29 +784,59 @@ def dump_c(self, routines, f, prefix):
             # Partition the C function arguments into categories
             py_in, py_out = self._partition_args(routine.arguments)
             n_in = len(py_in)
-            n_out = 1
+            n_out = len(py_out) or 1
 
             # Declare Args
             form = "char *{0}{1} = args[{2}];"
             arg_decs = [form.format('in', i, i) for i in range(n_in)]
-            arg_decs.append(form.format('out', 1, n_in))
+            arg_decs.extend([form.format('out', i + 1, n_in + i)
+                             for i in range(n_out)])
             declare_args = '\n    '.join(arg_decs)
 
             # Declare Steps
             form = "npy_intp {0}{1}_step = steps[{2}];"
             step_decs = [form.format('in', i, i) for i in range(n_in)]
-            step_decs.append(form.format('out', 1, n_in))
+            step_decs.extend([form.format('out', i + 1, n_in + i)
+                              for i in range(n_out)])
             declare_steps = '\n    '.join(step_decs)
 
-            # Call Args
-            form = "*(double *)in{0}"
-            call_args = ', '.join([form.format(a) for a in range(n_in)])
-
-            # Step Increments
-            form = "{0}{1} += {0}{1}_step;"
-            step_incs = [form.format('in', i) for i in range(n_in)]
-            step_incs.append(form.format('out', 1))
-            step_increments = '\n        '.join(step_incs)
+            ins = ['in%d' % i for i in range(n_in)]
+            outs = ['out%d' % (i + 1) for i in range(n_out)]
+
+            # Test for contiguous arrays
+            form = "{0}_step == sizeof(double)"
+            contiguous = ' && '.join([form.format(a) for a in ins + outs])
+
+            # Declare contiguous arrays
+            form = "{0}double *restrict {1}_array = ({0}double *){1};"
+            array_decs = [form.format('const ', a) for a in ins]
+            array_decs.extend([form.format('', a) for a in outs])
+            declare_arrays = '\n        '.join(array_decs)
+
+            # Calls
+            contiguous_args = ['{0}_array[i]'.format(a) for a in ins]
+            strided_args = ['*(double *)({0} + i*{0}_step)'.format(a)
+                            for a in ins]
+            if py_out:
+                contiguous_args.extend(['&{0}_array[i]'.format(a)
+                                        for a in outs])
+                strided_args.extend(['(double *)({0} + i*{0}_step)'.format(a)
+                                     for a in outs])
+                contiguous_call = '{0}({1})'.format(name,
+                                                    ', '.join(contiguous_args))
+                strided_call = '{0}({1})'.format(name, ', '.join(strided_args))
+            else:
+                contiguous_call = 'out1_array[i] = {0}({1})'.format(
+                    name, ', '.join(contiguous_args))
+                strided_call = '*(double *)(out1 + i*out1_step) = {0}({1})'.format(
+                    name, ', '.join(strided_args))
+
+            # OpenMP
+            if self.openmp:
+                parallel = ("#pragma omp parallel for if (n > %d)\n" %
+                            _ufunc_omp_threshold)
+            else:
+                parallel = ''
 
             # Types
             n_types = n_in + n_out
@@ -756,8 +859,11 @@ def dump_c(self, routines, f, prefix):
             body = _ufunc_body.substitute(module=module, funcname=name,
                                           declare_args=declare_args,
                                           declare_steps=declare_steps,
-                                          call_args=call_args,
-                                          step_increments=step_increments,
+                                          contiguous=contiguous,
+                                          declare_arrays=declare_arrays,
+                                          contiguous_call=contiguous_call,
+                                          strided_call=strided_call,
+                                          parallel=parallel,
                                           n_types=n_types, types=types)
             functions.append(body)
 
@@ -776,8 +882,8 @@ def _partition_args(self, args):
         py_out = []
         for arg in args:
             if isinstance(arg, OutputArgument):
-                if py_out:
-                    msg = "Ufuncify doesn't support multiple OutputArguments"
+                if arg.dimensions:
+                    msg = "Ufuncify doesn't support array OutputArguments"
                     raise ValueError(msg)
                 py_out.append(arg)
             elif isinstance(arg, InOutArgument):
@@ -790,7 +896,7 @@ def _partition_args(self, args):
 @cacheit
 @doctest_depends_on(exe=('f2py', 'gfortran', 'gcc'), modules=('numpy',))
 def ufuncify(args, expr, language=None, backend='numpy', tempdir=None,
-             flags=None, verbose=False, helpers=None):
+             flags=None, verbose=False, helpers=None, openmp=False):
     """
     Generates a binary function that supports broadcasting on numpy arrays.
 
@@ -801,7 +907,9 @@ def ufuncify(args, expr, language=None, backend='numpy', tempdir=None,
         Either a Symbol or an iterable of symbols. Specifies the argument
         sequence for the function.
     expr
-        A Diofant expression that defines the element wise operation.
+        A Diofant expression that defines the element wise operation.  For
+        the 'numpy' backend, it could be a tuple of expressions, which define
+        outputs of the ufunc.  Common subexpressions are computed only once.
     language : string, optional
         If supplied, (options: 'C' or 'F95'), specifies the language of the
         generated code. If ``None`` [default], the language is inferred based
@@ -825,6 +933,9 @@ def ufuncify(args, expr, language=None, backend='numpy', tempdir=None,
         compiled main expression can link to the helper routine. Items should
         be tuples with (<funtion_name>, <diofant_expression>, <arguments>). It
         is mandatory to supply an argument sequence to helper routines.
+    openmp : bool, optional
+        If True, the loop over array elements is parallelized with OpenMP.
+        Only for the 'numpy' backend.
 
     Notes
     -----
@@ -835,6 +946,11 @@ def ufuncify(args, expr, language=None, backend='numpy', tempdir=None,
     function, which requires equal length 1-dimensional arrays for all
     arguments, and will not perform any type conversions.
 
+    The 'numpy' backend doesn't require f2py or Cython, the generated code
+    is compiled directly with the C compiler (``gcc`` by default, could be
+    changed with the ``CC`` environment variable).  Additional compiler
+    options could be provided with ``flags``.
+
     References
     ----------
 
@@ -854,6 +970,13 @@ def ufuncify(args, expr, language=None, backend='numpy', tempdir=None,
     >>> f(np.arange(5), 3)
     array([ 3.,  4.,  7.,  12.,  19.])
 
+    Several outputs could be computed at once:
+
+    >>> from diofant import sin, cos
+    >>> g = ufuncify((x, y), (sin(x + y), cos(x + y)), openmp=True)
+    >>> g([0, 1], 0)
+    (array([ 0.,  0.84147098]), array([ 1.,  0.54030231]))
+
     For the F2Py and Cython backends, inputs are required to be equal length
     1-dimensional arrays. The F2Py backend will perform type conversion, but
     the Cython backend will error if the inputs are not of the expected type.
@@ -886,13 +1009,26 @@ def ufuncify(args, expr, language=None, backend='numpy', tempdir=None,
     flags = flags if flags else ()
 
     if backend.upper() == 'NUMPY':
-        routine = make_routine('autofunc', expr, args)
+        if isinstance(expr, tuple):
+            taken = {str(a) for a in Tuple(*(args + expr)).free_symbols}
+            outs = (s for s in numbered_symbols('out')
+                    if str(s) not in taken)
+            outs = list(itertools.islice(outs, len(expr)))
+            routine = make_routine('autofunc',
+                                   [Eq(o, e) for o, e in zip(outs, expr)],
+                                   args + tuple(outs))
+        else:
+            routine = make_routine('autofunc', expr, args)
         helps = []
         for name, expr, args in helpers:
             helps.append(make_routine(name, expr, args))
-        code_wrapper = UfuncifyCodeWrapper(CCodeGen("ufuncify"), tempdir,
-                                           flags, verbose)
+        code_wrapper = UfuncifyCodeWrapper(CCodeGen("ufuncify", cse=True),
+                                           tempdir, flags, verbose,
+                                           openmp=openmp)
         return code_wrapper.wrap_code(routine, helpers=helps)
+    elif isinstance(expr, tuple) or openmp:
+        raise ValueError("Multiple outputs and OpenMP are supported only "
+                         "by the numpy backend.")
     else:
         # Dummies are used for all added expressions to prevent name clashes
         # within the original expression.
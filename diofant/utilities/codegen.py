@@ -55,8 +55,10 @@
 + Isolate constants and evaluate them beforehand in double precision
 + Fortran 90
 + Octave/Matlab
++ Common Subexpression Elimination (C only)
++ Loop fusion, hoisting of loop invariants and loop tiling for arrays (C and
+  Fortran 90)
 
-- Common Subexpression Elimination
 - User defined comments in the generated code
 - Optional extra include lines for libraries/objects that can eval special
   functions
@@ -76,6 +78,7 @@
 
 """
 
+import copy
 from io import StringIO
 import os
 import textwrap
@@ -83,13 +86,14 @@
 from diofant import __version__ as diofant_version
 from diofant.core import Dummy, Symbol, S, Expr, Tuple, Equality, Function
 from diofant.core.compatibility import is_sequence
-from diofant.printing.codeprinter import AssignmentError
+from diofant.printing.codeprinter import Assignment, AssignmentError
 from diofant.printing.ccode import ccode, CCodePrinter
 from diofant.printing.fcode import fcode, FCodePrinter
 from diofant.printing.octave import octave_code, OctaveCodePrinter
 from diofant.tensor import Idx, Indexed, IndexedBase
 from diofant.matrices import (MatrixSymbol, ImmutableMatrix, MatrixBase,
                               MatrixExpr, MatrixSlice)
+from diofant.utilities.iterables import numbered_symbols
 
 
 __all__ = (
@@ -468,6 +472,70 @@ def __init__(self, project="project"):
         """
         self.project = project
 
+    def _local_symbols(self, routine):
+        """Returns an iterator of symbols for new local variables."""
+        taken = {str(v).lower() for v in routine.variables}
+        for r in routine.result_variables:
+            taken.update(str(s).lower() for s in r.expr.free_symbols)
+        return (s for s in numbered_symbols() if str(s).lower() not in taken)
+
+    def _loop_groups(self, results):
+        """Group consecutive array results to be computed in common loops.
+
+        Returns a list of results and lists (groups) of array results.
+        """
+        groups = []
+        for r in results:
+            if (isinstance(r, (OutputArgument, InOutArgument)) and
+                    isinstance(r.result_var, Indexed)):
+                if groups and isinstance(groups[-1], list):
+                    groups[-1].append(r)
+                else:
+                    groups.append([r])
+            else:
+                groups.append(r)
+        return groups
+
+    def _hoist_invariants(self, routine, results, symbols):
+        """Pull loop invariant subexpressions out of array results.
+
+        Returns the list of (symbol, expression) pairs for invariant
+        subexpressions and the list of results with reduced expressions.
+        Invariant arguments of Adds and Muls are collected together.
+        """
+        labels = routine.local_vars
+        invariants = {}
+        replacements = []
+
+        def is_variant(expr):
+            return expr.has(Indexed, *labels)
+
+        def hoist(expr):
+            if expr.is_Atom or isinstance(expr, (Indexed, Idx)):
+                return expr
+            elif not is_variant(expr):
+                coeff, rest = expr.as_coeff_Mul()
+                if coeff is not S.One:
+                    return coeff*hoist(rest)
+                if expr not in invariants:
+                    invariants[expr] = next(symbols)
+                    replacements.append((invariants[expr], expr))
+                return invariants[expr]
+            args = expr.args
+            if (expr.is_Add or expr.is_Mul) and expr.is_commutative:
+                inv = [a for a in args if not is_variant(a)]
+                if len(inv) > 1:
+                    args = [expr.func(*inv)] + [a for a in args
+                                                if is_variant(a)]
+            return expr.func(*[hoist(a) for a in args])
+
+        new_results = []
+        for r in results:
+            r = copy.copy(r)
+            r.expr = hoist(r.expr)
+            new_results.append(r)
+        return replacements, new_results
+
     def routine(self, name, expr, argument_sequence, global_vars):
         """Creates an Routine object that is appropriate for this language.
 
@@ -714,6 +782,25 @@ class CCodeGen(CodeGen):
     code_extension = "c"
     interface_extension = "h"
 
+    def __init__(self, project="project", cse=False, fuse_loops=False,
+                 tile=None):
+        """Initialize a C code generator.
+
+        If ``cse`` is True, common subexpressions of scalar results are
+        computed once, as local constants of the routine.
+
+        If ``fuse_loops`` is True, consecutive array results with the same
+        indices are computed in common loops and their loop invariant
+        subexpressions are computed once, before loops.  If ``tile`` is
+        given, loops for terms with summations (e.g. matrix products) are
+        tiled by blocks of ``tile`` iterations.
+
+        """
+        super().__init__(project)
+        self.cse = cse
+        self.fuse_loops = fuse_loops
+        self.tile = tile
+
     def _get_header(self):
         """Writes a common header for the generated files."""
         code_lines = []
@@ -784,9 +871,28 @@ def _call_printer(self, routine):
             if isinstance(arg, ResultBase) and not arg.dimensions:
                 dereference.append(arg.name)
 
+        results = routine.result_variables
+        symbols = self._local_symbols(routine)
+        if self.cse:
+            code_lines, results = self._cse_results(results, dereference,
+                                                    symbols)
+        if self.fuse_loops:
+            results = self._loop_groups(results)
+
         return_val = None
-        for result in routine.result_variables:
-            if isinstance(result, Result):
+        for result in results:
+            if isinstance(result, list):
+                hoisted, result = self._hoist_invariants(routine, result,
+                                                         symbols)
+                for sym, expr in hoisted:
+                    t = get_default_datatype(expr).cname
+                    code_lines.append("const %s %s = %s;\n" % (t, sym,
+                                      ccode(expr, dereference=dereference)))
+                assignments = [Assignment(r.result_var, r.expr)
+                               for r in result]
+                constants, not_c, c_expr = ccode(assignments, human=False,
+                        dereference=dereference, tile=self.tile)
+            elif isinstance(result, Result):
                 assign_to = routine.name + "_result"
                 t = result.get_datatype('c')
                 code_lines.append("{0} {1};\n".format(t, str(assign_to)))
@@ -794,15 +900,18 @@ def _call_printer(self, routine):
             else:
                 assign_to = result.result_var
 
-            try:
-                constants, not_c, c_expr = ccode(result.expr, human=False,
-                        assign_to=assign_to, dereference=dereference)
-            except AssignmentError:
-                assign_to = result.result_var
-                code_lines.append(
-                    "%s %s;\n" % (result.get_datatype('c'), str(assign_to)))
-                constants, not_c, c_expr = ccode(result.expr, human=False,
-                        assign_to=assign_to, dereference=dereference)
+            if not isinstance(result, list):
+                try:
+                    constants, not_c, c_expr = ccode(result.expr, human=False,
+                            assign_to=assign_to, dereference=dereference,
+                            tile=self.tile)
+                except AssignmentError:
+                    assign_to = result.result_var
+                    code_lines.append("%s %s;\n" % (result.get_datatype('c'),
+                                                    str(assign_to)))
+                    constants, not_c, c_expr = ccode(result.expr, human=False,
+                            assign_to=assign_to, dereference=dereference,
+                            tile=self.tile)
 
             for name, value in sorted(constants, key=str):
                 code_lines.append("double const %s = %s;\n" % (name, value))
@@ -812,6 +921,34 @@ def _call_printer(self, routine):
             code_lines.append("   return %s;\n" % return_val)
         return code_lines
 
+    def _cse_results(self, results, dereference, symbols):
+        """Eliminate common subexpressions in scalar results.
+
+        Returns code lines, declaring common subexpressions, and the list
+        of results with reduced expressions.
+        """
+        from diofant.simplify.cse_main import cse
+
+        scalar = [r for r in results if not r.expr.has(Indexed, Idx)]
+
+        replacements, reduced = cse([r.expr for r in scalar], symbols=symbols)
+
+        code_lines = []
+        for sym, expr in replacements:
+            t = get_default_datatype(expr).cname
+            code_lines.append("const %s %s = %s;\n" % (t, sym,
+                              ccode(expr, dereference=dereference)))
+
+        reduced = dict(zip(map(id, scalar), reduced))
+        new_results = []
+        for r in results:
+            if id(r) in reduced:
+                expr = reduced[id(r)]
+                r = copy.copy(r)
+                r.expr = expr
+            new_results.append(r)
+        return code_lines, new_results
+
     def _indent_code(self, codelines):
         p = CCodePrinter()
         return p.indent_code(codelines)
@@ -890,8 +1027,15 @@ class FCodeGen(CodeGen):
     code_extension = "f90"
     interface_extension = "h"
 
-    def __init__(self, project='project'):
+    def __init__(self, project='project', fuse_loops=False, tile=None):
+        """Initialize a Fortran code generator.
+
+        See :class:`CCodeGen` for ``fuse_loops`` and ``tile`` options.
+
+        """
         CodeGen.__init__(self, project)
+        self.fuse_loops = fuse_loops
+        self.tile = tile
 
     def _get_symbol(self, s):
         """Returns the symbol as fcode prints it."""
@@ -983,8 +1127,28 @@ def _declare_locals(self, routine):
             typeinfo = get_default_datatype(var)
             code_list.append("%s :: %s\n" % (
                 typeinfo.fname, self._get_symbol(var)))
+        if self.tile:
+            for var in sorted(self._tiled_vars(routine), key=str):
+                typeinfo = get_default_datatype(var)
+                code_list.append("%s :: %s_tile\n" % (
+                    typeinfo.fname, self._get_symbol(var)))
         return code_list
 
+    def _tiled_vars(self, routine):
+        """Returns labels of indices of tiled loops."""
+        from diofant.tensor import get_contraction_structure, get_indices
+
+        labels = set()
+        for r in routine.result_variables:
+            if not r.expr.has(Indexed):
+                continue
+            for d in get_contraction_structure(r.expr):
+                if isinstance(d, tuple):
+                    labels.update(i.label for i in d)
+                    labels.update(i.label
+                                  for i in get_indices(r.result_var)[0])
+        return labels
+
     def _get_routine_ending(self, routine):
         """Returns the closing statements of the fortran routine."""
         if len(routine.results) == 1:
@@ -1013,14 +1177,32 @@ def get_interface(self, routine):
     def _call_printer(self, routine):
         declarations = []
         code_lines = []
-        for result in routine.result_variables:
-            if isinstance(result, Result):
-                assign_to = routine.name
-            elif isinstance(result, (OutputArgument, InOutArgument)):
-                assign_to = result.result_var
-
-            constants, not_fortran, f_expr = fcode(result.expr,
-                assign_to=assign_to, source_format='free', human=False)
+        results = routine.result_variables
+        if self.fuse_loops:
+            symbols = self._local_symbols(routine)
+            results = self._loop_groups(results)
+        for result in results:
+            if isinstance(result, list):
+                hoisted, result = self._hoist_invariants(routine, result,
+                                                         symbols)
+                for sym, expr in hoisted:
+                    t = get_default_datatype(expr)
+                    declarations.append("%s :: %s\n" % (t.fname, sym))
+                assignments = [Assignment(sym, expr)
+                               for sym, expr in hoisted]
+                assignments.extend(Assignment(r.result_var, r.expr)
+                                   for r in result)
+                constants, not_fortran, f_expr = fcode(assignments,
+                    source_format='free', human=False, tile=self.tile)
+            else:
+                if isinstance(result, Result):
+                    assign_to = routine.name
+                elif isinstance(result, (OutputArgument, InOutArgument)):
+                    assign_to = result.result_var
+
+                constants, not_fortran, f_expr = fcode(result.expr,
+                    assign_to=assign_to, source_format='free', human=False,
+                    tile=self.tile)
 
             for obj, v in sorted(constants, key=str):
                 t = get_default_datatype(obj)
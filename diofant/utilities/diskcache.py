@@ -0,0 +1,227 @@
+"""Persistent on-disk cache for generated code.
+
+Generating code (e.g. with :func:`~diofant.utilities.lambdify.lambdify`)
+and, especially, compiling it (e.g. with
+:func:`~diofant.utilities.autowrap.autowrap`) is expensive.  With the disk
+cache enabled, results are stored in a directory, shared between processes,
+with keys computed from a stable serialization of inputs.
+
+The cache is disabled by default.  To enable it, either set the
+``DIOFANT_DISK_CACHE`` environment variable to a directory (and optionally
+``DIOFANT_DISK_CACHE_SIZE`` to the size limit in bytes) or call
+:func:`set_disk_cache`.
+
+Each entry is a directory, named by the key, with one or more files.  Entries
+are created atomically (by renaming a complete temporary directory), so
+concurrent processes never see incomplete entries.  When the total size
+exceeds the limit, least recently used entries are removed.
+
+.. warning::
+
+   Entries contain generated and compiled code and serialized objects
+   (see :mod:`~diofant.utilities.tables`), which are executed or
+   unpickled when loaded.  Use only a trusted directory for the cache,
+   i.e. one, that is writable only by users, whose code you would run.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from diofant.printing.repr import ReprPrinter
+
+
+class DiskCache:
+    """Content-addressed cache of files in ``directory``.
+
+    Parameters
+    ==========
+
+    directory : str
+        Path to the cache directory, created if missing.
+    max_size : int, optional
+        Maximal total size of entries (in bytes), default is 1GB.
+
+    Examples
+    ========
+
+    >>> import os, tempfile
+    >>> from diofant.utilities.diskcache import DiskCache
+    >>> cache = DiskCache(tempfile.mkdtemp())
+    >>> cache.get('spam') is None
+    True
+    >>> path = cache.put('spam', {'eggs.txt': b'ham'})
+    >>> sorted(os.listdir(cache.get('spam')))
+    ['eggs.txt']
+    >>> cache.clear()
+    """
+
+    def __init__(self, directory, max_size=2**30):
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """Return path to the entry directory for ``key`` or None."""
+        path = self._path(key)
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            return
+        return path
+
+    def put(self, key, files):
+        """Store an entry for ``key`` and return path to it.
+
+        ``files`` is a mapping of file names to either :class:`bytes`
+        (content) or :class:`str` (a path to a file, which will be copied).
+        If the entry already exists (e.g. created by a concurrent process),
+        it is kept intact.
+        """
+        tmp = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        try:
+            for name, data in files.items():
+                dest = os.path.join(tmp, name)
+                if isinstance(data, bytes):
+                    with open(dest, 'wb') as f:
+                        f.write(data)
+                else:
+                    shutil.copy2(data, dest)
+            os.rename(tmp, self._path(key))
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+        return self.get(key)
+
+    def _remove(self, path):
+        # Rename first, so concurrent readers see either complete
+        # entry or nothing.
+        trash = tempfile.mkdtemp(prefix='.del-', dir=self.directory)
+        try:
+            os.rename(path, os.path.join(trash, 'entry'))
+        except OSError:
+            pass
+        shutil.rmtree(trash, ignore_errors=True)
+
+    def evict(self):
+        """Remove least recently used entries to fit the size limit."""
+        entries = []
+        total = 0
+        now = time.time()
+        for name in os.listdir(self.directory):
+            path = self._path(name)
+            try:
+                mtime = os.stat(path).st_mtime
+                if name.startswith('.'):
+                    # leftovers of killed processes
+                    if now - mtime > 3600:
+                        shutil.rmtree(path, ignore_errors=True)
+                    continue
+                size = sum(os.path.getsize(os.path.join(path, f))
+                           for f in os.listdir(path))
+            except OSError:
+                continue
+            entries.append((mtime, size, path))
+            total += size
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove all entries."""
+        for name in os.listdir(self.directory):
+            if not name.startswith('.'):
+                self._remove(self._path(name))
+
+
+class _KeyPrinter(ReprPrinter):
+    """Printer, used to compute keys with :func:`disk_cache_key`.
+
+    Dummy symbols are printed with their number, in order of appearance,
+    since their names aren't unique and indices aren't stable.
+    """
+
+    def __init__(self, settings=None):
+        super().__init__(settings)
+        self._dummies = {}
+
+    def _print_Dummy(self, expr):
+        n = self._dummies.setdefault(expr, len(self._dummies))
+        d = sorted(expr._assumptions.generator.items())
+        return "Dummy(%d, %s)" % (n, ', '.join('%s=%s' % kv for kv in d))
+
+
+def disk_cache_key(*args):
+    """Return a key (a hex string), computed from ``args``.
+
+    Arguments could be expressions, matrices, classes, strings, numbers
+    and (nested) lists, tuples or dictionaries of them.
+
+    Examples
+    ========
+
+    >>> from diofant import Dummy
+    >>> from diofant.abc import x
+    >>> from diofant.utilities.diskcache import disk_cache_key
+    >>> disk_cache_key(x + 1, 'numpy') == disk_cache_key(x + 1, 'numpy')
+    True
+    >>> disk_cache_key(Dummy('x')) == disk_cache_key(Dummy('x'))
+    True
+    >>> disk_cache_key(x + 1, 'numpy') == disk_cache_key(x + 2, 'numpy')
+    False
+    """
+    printer = _KeyPrinter()
+
+    def serialize(obj):
+        if isinstance(obj, (list, tuple)):
+            return '%s(%s)' % (type(obj).__name__,
+                               ', '.join(serialize(a) for a in obj))
+        elif isinstance(obj, dict):
+            items = sorted('%s: %s' % (serialize(k), serialize(v))
+                           for k, v in obj.items())
+            return '{%s}' % ', '.join(items)
+        elif isinstance(obj, type):
+            return '%s.%s' % (obj.__module__, obj.__qualname__)
+        elif isinstance(obj, (str, bytes, int, float, bool, type(None))):
+            return repr(obj)
+        else:
+            return printer.doprint(obj)
+
+    data = '\n'.join([sys.version, serialize(args)])
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+_disk_cache = None
+
+
+def set_disk_cache(directory=None, max_size=None):
+    """Enable the disk cache in ``directory`` or disable it (if None).
+
+    Returns the previously used :class:`DiskCache` instance (or None).
+    """
+    global _disk_cache
+    old = _disk_cache
+    if directory is None:
+        _disk_cache = None
+    else:
+        if max_size is None:
+            max_size = int(os.getenv('DIOFANT_DISK_CACHE_SIZE', 2**30))
+        _disk_cache = DiskCache(directory, max_size)
+    return old
+
+
+def get_disk_cache():
+    """Return the current :class:`DiskCache` instance or None."""
+    return _disk_cache
+
+
+if os.getenv('DIOFANT_DISK_CACHE'):
+    set_disk_cache(os.getenv('DIOFANT_DISK_CACHE'))
@@ -4,11 +4,13 @@
 """
 
 import inspect
+import os
 import textwrap
 
 from diofant.external import import_module
 from diofant.core.compatibility import is_sequence, iterable
 from diofant.utilities.decorator import doctest_depends_on
+from diofant.utilities.iterables import numbered_symbols
 
 # These are the namespaces the lambda functions will use.
 MATH = {}
@@ -156,7 +158,7 @@ def _import(module, reload="False"):
 
 @doctest_depends_on(modules=('numpy'))
 def lambdify(args, expr, modules=None, printer=None, use_imps=True,
-        dummify=True):
+        dummify=True, cse=False):
     """
     Returns a lambda function for fast calculation of numerical values.
 
@@ -291,9 +293,25 @@ def lambdify(args, expr, modules=None, printer=None, use_imps=True,
 
     ``lambdify`` always prefers ``_imp_`` implementations to implementations
     in other namespaces, unless the ``use_imps`` input parameter is False.
+
+    If ``cse`` is True, common subexpressions are computed only once, as
+    local variables of the generated function (see :func:`funcstr`).
+    This is useful for large expressions or collections of them, e.g.
+    Jacobian matrices:
+
+    >>> from diofant import cos
+    >>> J = Matrix([sin(x*y)**2, cos(x*y)]).jacobian([x, y])
+    >>> f = lambdify((x, y), J, modules='diofant', cse=True)
+    >>> f(x, y) == J
+    True
+
+    If the disk cache is enabled (see :mod:`~diofant.utilities.diskcache`),
+    the generated code is stored there and reused in subsequent calls
+    (unless a custom ``printer`` instance or function is provided).
     """
     from diofant.core.symbol import Symbol
     from diofant.utilities.iterables import flatten
+    from diofant.utilities.diskcache import disk_cache_key, get_disk_cache
 
     # If the user hasn't specified any modules, use what is available.
     module_provided = True
@@ -365,13 +383,35 @@ def lambdify(args, expr, modules=None, printer=None, use_imps=True,
                 # Cannot infer name with certainty. arg_# will have to do.
                 names.append('arg_' + str(n))
 
+    # Lookup the disk cache for generated code.
+    lstr = key = None
+    cache = get_disk_cache()
+    if cache is not None and (printer is None or inspect.isclass(printer)):
+        key = disk_cache_key('lambdify', args, expr, printer, dummify, cse)
+        path = cache.get(key)
+        if path is not None:
+            try:
+                with open(os.path.join(path, 'source.py')) as f:
+                    lstr = f.read()
+            except OSError:
+                pass
+
     # Create lambda function.
-    lstr = lambdastr(args, expr, printer=printer, dummify=dummify)
+    if lstr is None:
+        if cse:
+            lstr = funcstr(args, expr, printer=printer, dummify=dummify)
+        else:
+            lstr = lambdastr(args, expr, printer=printer, dummify=dummify)
+        if key is not None:
+            cache.put(key, {'source.py': lstr.encode()})
     flat = '__flatten_args__'
-
     if flat in lstr:
         namespace.update({flat: flatten})
-    func = eval(lstr, namespace)
+    if cse:
+        exec(lstr, namespace)
+        func = namespace.pop('_lambdified')
+    else:
+        func = eval(lstr, namespace)
     # Apply the docstring
     sig = "func({0})".format(", ".join(str(i) for i in names))
     sig = textwrap.fill(sig, subsequent_indent=' '*8)
@@ -407,45 +447,35 @@ def _get_namespace(m):
         raise TypeError("Argument must be either a string, dict or module but it is: %s" % m)
 
 
-def lambdastr(args, expr, printer=None, dummify=False):
-    """
-    Returns a string that can be evaluated to a lambda function.
+def _get_lambdarepr(printer):
+    """Return a function, that prints an expression with ``printer``."""
+    if printer is not None:
+        if inspect.isfunction(printer):
+            return printer
+        elif inspect.isclass(printer):
+            return lambda expr: printer().doprint(expr)
+        else:
+            return printer.doprint
+    else:
+        # XXX: This has to be done here because of circular imports
+        from diofant.printing.lambdarepr import lambdarepr
+        return lambdarepr
 
-    Examples
-    ========
 
-    >>> from diofant.abc import x, y, z
-    >>> from diofant.utilities.lambdify import lambdastr
-    >>> lambdastr(x, x**2)
-    'lambda x: (x**2)'
-    >>> lambdastr((x,y,z), [z,y,x])
-    'lambda x,y,z: ([z, y, x])'
+def _isiter(l):
+    from diofant.matrices import DeferredVector
+    return iterable(l, exclude=(str, DeferredVector))
 
-    Although tuples may not appear as arguments to lambda in Python 3,
-    lambdastr will create a lambda function that will unpack the original
-    arguments so that nested arguments can be handled:
 
-    >>> lambdastr((x, (y, z)), x + y)
-    'lambda _0,_1: (lambda x,y,z: (x + y))(*list(__flatten_args__([_0,_1])))'
+def _dummify_args_expr(args, expr, dummify):
+    """
+    Return a string with comma-separated arguments and the expression,
+    where (if ``dummify`` is True) symbols and functions in ``args`` are
+    replaced by dummy symbols.
     """
-    # Transforming everything to strings.
     from diofant.matrices import DeferredVector
     from diofant import Dummy, sympify, Symbol, Function, flatten
 
-    if printer is not None:
-        if inspect.isfunction(printer):
-            lambdarepr = printer
-        else:
-            if inspect.isclass(printer):
-                def lambdarepr(expr):
-                    return printer().doprint(expr)
-            else:
-                def lambdarepr(expr):
-                    return printer.doprint(expr)
-    else:
-        # XXX: This has to be done here because of circular imports
-        from diofant.printing.lambdarepr import lambdarepr
-
     def sub_args(args, dummies_dict):
         if isinstance(args, str):
             return args
@@ -479,14 +509,52 @@ def sub_expr(expr, dummies_dict):
                 expr = [sub_expr(sympify(a), dummies_dict) for a in expr]
         return expr
 
-    # Transform args
-    def isiter(l):
-        return iterable(l, exclude=(str, DeferredVector))
+    dummies_dict = {}
+    if dummify:
+        args = sub_args(args, dummies_dict)
+    else:
+        if isinstance(args, str):
+            pass
+        elif iterable(args, exclude=DeferredVector):
+            args = ",".join(str(a) for a in args)
+
+    # Transform expr
+    if dummify and not isinstance(expr, str):
+        expr = sub_expr(expr, dummies_dict)
+
+    return args, expr
+
+
+def lambdastr(args, expr, printer=None, dummify=False):
+    """
+    Returns a string that can be evaluated to a lambda function.
+
+    Examples
+    ========
+
+    >>> from diofant.abc import x, y, z
+    >>> from diofant.utilities.lambdify import lambdastr
+    >>> lambdastr(x, x**2)
+    'lambda x: (x**2)'
+    >>> lambdastr((x,y,z), [z,y,x])
+    'lambda x,y,z: ([z, y, x])'
+
+    Although tuples may not appear as arguments to lambda in Python 3,
+    lambdastr will create a lambda function that will unpack the original
+    arguments so that nested arguments can be handled:
+
+    >>> lambdastr((x, (y, z)), x + y)
+    'lambda _0,_1: (lambda x,y,z: (x + y))(*list(__flatten_args__([_0,_1])))'
+    """
+    # Transforming everything to strings.
+    from diofant import Dummy, flatten
+
+    lambdarepr = _get_lambdarepr(printer)
 
-    if isiter(args) and any(isiter(i) for i in args):
+    if _isiter(args) and any(_isiter(i) for i in args):
         import re
         dum_args = [str(Dummy(str(i))) for i in range(len(args))]
-        iter_args = ','.join([i if isiter(a) else i
+        iter_args = ','.join([i if _isiter(a) else i
             for i, a in zip(dum_args, args)])
         lstr = lambdastr(flatten(args), expr, printer=printer, dummify=dummify)
         flat = '__flatten_args__'
@@ -496,24 +564,94 @@ def isiter(l):
             raise ValueError('the name %s is reserved by lambdastr' % flat)
         return rv
 
-    dummies_dict = {}
-    if dummify:
-        args = sub_args(args, dummies_dict)
+    args, expr = _dummify_args_expr(args, expr, dummify)
+    expr = lambdarepr(expr)
+
+    return "lambda %s: (%s)" % (args, expr)
+
+
+def funcstr(args, expr, printer=None, dummify=False):
+    """
+    Returns a string that can be executed to define a function ``_lambdified``.
+
+    Unlike :func:`lambdastr`, common subexpressions of ``expr`` are
+    eliminated with :func:`~diofant.simplify.cse_main.cse` and computed
+    only once, as local variables of the function.  The ``expr`` could
+    be a single expression, a matrix or a (nested) list, tuple or
+    dictionary of them.
+
+    Examples
+    ========
+
+    >>> from diofant import sin, cos
+    >>> from diofant.abc import x, y, z
+    >>> from diofant.utilities.lambdify import funcstr
+    >>> print(funcstr((x, y), [sin(x + y), cos(x + y)]))
+    def _lambdified(x,y):
+        x0 = x + y
+        return ([sin(x0), cos(x0)])
+
+    Nested arguments are unpacked in the function body:
+
+    >>> print(funcstr((x, (y, z)), (x + y + z)**2 + x + y + z))
+    def _lambdified(_0,_1):
+        [x,y,z] = __flatten_args__([_0,_1])
+        x0 = x + y + z
+        return (x0**2 + x0)
+    """
+    import re
+    from diofant import Dummy, sympify, flatten
+    from diofant.simplify.cse_main import cse
+
+    lambdarepr = _get_lambdarepr(printer)
+
+    lines = []
+    if _isiter(args) and any(_isiter(i) for i in args):
+        head = ','.join(str(Dummy(str(i))) for i in range(len(args)))
+        args, expr = _dummify_args_expr(flatten(args), expr, dummify)
+        lines.append('[%s] = __flatten_args__([%s])' % (args, head))
     else:
-        if isinstance(args, str):
-            pass
-        elif iterable(args, exclude=DeferredVector):
-            args = ",".join(str(a) for a in args)
+        args, expr = _dummify_args_expr(args, expr, dummify)
+        head = args
 
-    # Transform expr
-    if dummify:
-        if isinstance(expr, str):
-            pass
+    if isinstance(expr, str):
+        expr = sympify(expr)
+
+    leaves = []
+
+    def collect(e):
+        if isinstance(e, (list, tuple)):
+            for a in e:
+                collect(a)
+        elif isinstance(e, dict):
+            for a in e.values():
+                collect(a)
         else:
-            expr = sub_expr(expr, dummies_dict)
-    expr = lambdarepr(expr)
+            leaves.append(sympify(e))
 
-    return "lambda %s: (%s)" % (args, expr)
+    def rebuild(e, reduced):
+        if isinstance(e, (list, tuple)):
+            return type(e)(rebuild(a, reduced) for a in e)
+        elif isinstance(e, dict):
+            return {k: rebuild(v, reduced) for k, v in e.items()}
+        else:
+            return next(reduced)
+
+    collect(expr)
+
+    # Names of the common subexpressions shouldn't clash with arguments.
+    taken = set(re.findall(r'\w+', args))
+    taken.update(str(s) for e in leaves for s in e.free_symbols)
+    symbols = (s for s in numbered_symbols() if str(s) not in taken)
+
+    replacements, reduced = cse(leaves, symbols=symbols)
+
+    for sym, e in replacements:
+        lines.append('%s = %s' % (sym, lambdarepr(e)))
+    lines.append('return (%s)' % lambdarepr(rebuild(expr, iter(reduced))))
+
+    return '\n'.join(['def _lambdified(%s):' % head] +
+                     ['    ' + l for l in lines])
 
 
 def _imp_namespace(expr, namespace=None):
@@ -631,3 +769,137 @@ def implemented_function(symfunc, implementation):
     # We need to attach as a method because symfunc will be a class
     symfunc._imp_ = staticmethod(implementation)
     return symfunc
+
+
+# Function, compiled in worker processes of evaluate_batch()
+_batch_func = None
+
+
+def _batch_init(symbols, exprs, dps):
+    global _batch_func
+    _batch_func = _batch_compile(symbols, exprs, dps)
+
+
+def _batch_compile(symbols, exprs, dps):
+    """Return a function, which evaluates ``exprs`` over a chunk of rows."""
+    if dps is None:
+        numpy = import_module('numpy')
+        if numpy is not None:
+            f = lambdify(symbols, exprs, 'numpy', cse=True)
+
+            def func(chunk):
+                chunk = numpy.asarray(chunk, dtype=numpy.float64)
+                chunk = chunk.reshape(len(chunk), len(symbols))
+                out = f(*chunk.T)
+                rv = numpy.empty((len(chunk), len(out)))
+                for i, o in enumerate(out):
+                    rv[:, i] = o
+                return rv
+            return func
+        f = lambdify(symbols, exprs, ['math', 'mpmath', 'diofant'], cse=True)
+
+        def func(chunk):
+            return [tuple(f(*row)) for row in chunk]
+        return func
+
+    import mpmath
+    from diofant.printing.lambdarepr import MpmathPrinter
+
+    f = lambdify(symbols, exprs, ['mpmath', 'diofant'],
+                 printer=MpmathPrinter, cse=True)
+
+    def func(chunk):
+        with mpmath.workdps(dps):
+            return [tuple(+mpmath.mpmathify(v)
+                          for v in f(*map(mpmath.mpmathify, row)))
+                    for row in chunk]
+    return func
+
+
+def _batch_eval(chunk):
+    return _batch_func(chunk)
+
+
+@doctest_depends_on(modules=('numpy',))
+def evaluate_batch(exprs, symbols, data, dps=None, chunksize=10000,
+                   processes=None):
+    """
+    Evaluate expressions over a table of values of symbols.
+
+    Expressions are compiled once with :func:`lambdify` (with common
+    subexpression elimination).  Rows of ``data`` are processed in chunks,
+    so ``data`` could be an iterator.
+
+    Parameters
+    ==========
+
+    exprs : Expr or sequence of Expr
+        Expressions to evaluate.
+    symbols : sequence of Symbol
+        Symbols, which values are given in rows of ``data``.
+    data : iterable
+        Table (e.g. a 2-dimensional array or an iterator over tuples),
+        where each row contains values of ``symbols``.
+    dps : int or None, optional
+        If None (default), the evaluation is done with machine floats,
+        vectorized with NumPy, if available.  Otherwise, mpmath is used
+        with ``dps`` decimal digits of precision.
+    chunksize : int, optional
+        Number of rows, evaluated at once.
+    processes : int or None, optional
+        If given, chunks are evaluated in a pool of worker processes.
+
+    Returns
+    =======
+
+    A table of values of ``exprs`` (one row per row of ``data``): a
+    2-dimensional NumPy array with machine floats (if NumPy is available)
+    or a list of tuples.  If ``exprs`` is a single expression, the
+    one-dimensional array (or list) of values is returned.
+
+    Examples
+    ========
+
+    >>> from diofant import pi
+    >>> from diofant.abc import x, y
+    >>> from diofant.utilities.lambdify import evaluate_batch
+    >>> evaluate_batch([x + y, x*y], [x, y], [(1, 2), (3, 4), (5, 6)]).tolist()
+    [[3.0, 2.0], [7.0, 12.0], [11.0, 30.0]]
+    >>> from mpmath import nstr
+    >>> [nstr(v, 30) for v in evaluate_batch(pi*x, [x], [[1], [2]], dps=30)]
+    ['3.14159265358979323846264338328', '6.28318530717958647692528676656']
+    """
+    import itertools
+
+    single = not is_sequence(exprs)
+    exprs = [exprs] if single else list(exprs)
+    symbols = list(symbols)
+
+    rows = iter(data)
+    chunks = iter(lambda: list(itertools.islice(rows, chunksize)), [])
+
+    if processes is None:
+        func = _batch_compile(symbols, exprs, dps)
+        results = map(func, chunks)
+    else:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes, _batch_init,
+                                    (symbols, exprs, dps))
+        results = pool.imap(_batch_eval, chunks)
+
+    try:
+        results = list(results)
+    finally:
+        if processes is not None:
+            pool.terminate()
+
+    numpy = import_module('numpy')
+    if dps is None and numpy is not None:
+        if results:
+            rv = numpy.concatenate(results)
+        else:
+            rv = numpy.empty((0, len(exprs)))
+        return rv[:, 0] if single else rv
+    else:
+        rv = list(itertools.chain.from_iterable(results))
+        return [r[0] for r in rv] if single else rv
@@ -0,0 +1,267 @@
+"""Racing of independent strategies in worker processes.
+
+Some algorithms try several independent strategies one after another and
+keep the first (e.g. integration) or the best (e.g. simplification)
+result.  With racing enabled, such strategies are run concurrently, each
+in a separate worker process, see :func:`race`.  Inputs and results are
+passed between processes with :mod:`~diofant.utilities.serialize`.
+
+Racing is disabled by default.  To enable it, either set the
+``DIOFANT_RACING`` environment variable to the maximal number of worker
+processes or call :func:`set_racing`.  The limit is global: it's shared
+by all races in the process (e.g. in different threads).  Worker processes
+never start races on their own.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import threading
+import time
+
+from diofant.core.basic import Basic
+from diofant.core.deadline import (DeadlineExceeded, check_deadline,
+                                   deadline, get_deadline)
+from diofant.core.symbol import Dummy
+from diofant.utilities.serialize import dumps, loads
+
+
+__all__ = ('race', 'set_racing', 'get_racing')
+
+
+class _Racing:
+    """Settings of racing."""
+
+    def __init__(self, processes, timeout):
+        self.processes = processes
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(processes)
+
+    def __repr__(self):
+        return '%s(processes=%s, timeout=%s)' % (self.__class__.__name__,
+                                                 self.processes, self.timeout)
+
+
+_racing = None
+_in_worker = False
+
+
+def set_racing(processes=None, timeout=None):
+    """Enable racing with at most ``processes`` workers or disable it.
+
+    ``processes=True`` means the number of CPUs.  ``timeout`` (in
+    seconds) limits waiting for the best result, see :func:`race`.
+
+    Returns previous settings (or None).
+    """
+    global _racing
+    old = _racing
+    if processes is None or processes is False:
+        _racing = None
+    else:
+        if processes is True:
+            processes = os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError('processes must be positive, got %s' % processes)
+        _racing = _Racing(processes, timeout)
+    return old
+
+
+def get_racing():
+    """Return current settings of racing or None, if it's disabled."""
+    return None if _in_worker else _racing
+
+
+def _worker(conn, data, seconds):
+    global _in_worker
+    _in_worker = True
+    try:
+        func, args, kwargs = loads(data)
+        with deadline(seconds):
+            result = func(*args, **kwargs)
+        data = dumps((True, result))
+    except Exception as exc:
+        data = dumps((False, '%s: %s' % (type(exc).__name__, exc)))
+    conn.send_bytes(data)
+    conn.close()
+
+
+class _Task:
+    """Worker process, running a strategy."""
+
+    def __init__(self, index, name, func, args, kwargs):
+        self.index = index
+        self.name = name
+        self.data = dumps((func, args, kwargs))
+        self.dummies = set().union(*[a.atoms(Dummy) for a in
+                                     list(args) + list(kwargs.values())
+                                     if isinstance(a, Basic)])
+        self.process = None
+        self.conn = None
+
+    def start(self, seconds):
+        self.conn, child = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(target=_worker,
+                                               args=(child, self.data,
+                                                     seconds),
+                                               daemon=True)
+        self.process.start()
+        child.close()
+
+    def result(self):
+        """Return the result or None, if the strategy failed."""
+        try:
+            ok, result = loads(self.conn.recv_bytes())
+        except (EOFError, OSError):
+            return
+        if not ok:
+            return
+        if isinstance(result, Basic):
+            # dummies, created by the worker, may clash with new ones
+            reps = {d: Dummy(d.name, **d._assumptions.generator)
+                    for d in result.atoms(Dummy) - self.dummies}
+            result = result.xreplace(reps)
+        return result
+
+    def stop(self):
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+
+def _sequential(tasks, measure):
+    best = None
+    for name, func, args, kwargs in tasks:
+        # exceptions mean failure, as for workers, but an exceeded
+        # deadline stops the whole race
+        try:
+            result = func(*args, **kwargs)
+        except DeadlineExceeded:
+            raise
+        except Exception:
+            continue
+        if result is None:
+            continue
+        if measure is None:
+            return name, result
+        if best is None or measure(result) < measure(best[1]):
+            best = name, result
+    return best
+
+
+def race(tasks, measure=None):
+    """Run strategies concurrently and return the result of the winner.
+
+    ``tasks`` is a sequence of tuples ``(name, func, args, kwargs)``, each
+    strategy computes ``func(*args, **kwargs)``, a None result or an
+    exception means failure.  Without ``measure``, the first successful
+    strategy wins.  Otherwise, the winner is the result with the least
+    ``measure`` (ties are resolved in the order of ``tasks``); if the
+    racing timeout (see :func:`set_racing`) has passed, only strategies,
+    finished so far, are compared (once some of them succeeded).  Other
+    workers are terminated.
+
+    Returns ``(name, result)`` of the winner or None, if all strategies
+    failed.
+
+    Strategies are run sequentially in the current process (in the order
+    of ``tasks``), if racing is disabled or arguments can't be serialized.
+    The active :func:`~diofant.core.deadline.deadline` applies to workers
+    and to waiting for free slots (held by races in other threads) as well.
+
+    Examples
+    ========
+
+    >>> from diofant import cancel, factor, count_ops
+    >>> from diofant.abc import x
+    >>> from diofant.utilities.racing import race, set_racing
+    >>> e = (x**2 - 1)/(x - 1)
+    >>> _ = set_racing(2)
+    >>> race([('cancel', cancel, (e,), {}),
+    ...       ('factor', factor, (e,), {})], measure=count_ops)
+    ('cancel', x + 1)
+    >>> _ = set_racing(None)
+    """
+    tasks = list(tasks)
+    racing = get_racing()
+    if racing is None or len(tasks) < 2:
+        return _sequential(tasks, measure)
+    try:
+        pending = [_Task(i, name, func, args, kwargs)
+                   for i, (name, func, args, kwargs) in enumerate(tasks)]
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return _sequential(tasks, measure)
+
+    active = get_deadline()
+    start = time.monotonic()
+    running = {}
+    results = {}
+    best = None
+
+    def timeout():
+        # time left until the deadline or the end of the race
+        rv = None
+        if active is not None:
+            rv = max(active.remaining(), 0)
+        if measure is not None and racing.timeout is not None:
+            left = max(start + racing.timeout - time.monotonic(), 0)
+            if left or results:
+                rv = left if rv is None else min(rv, left)
+        return rv
+
+    try:
+        while pending or running:
+            # launch workers, while slots are available; if all slots are
+            # held by other races, wait for one until the timeout
+            while pending:
+                if running:
+                    acquired = racing.slots.acquire(blocking=False)
+                else:
+                    acquired = racing.slots.acquire(timeout=timeout())
+                if not acquired:
+                    break
+                task = pending.pop(0)
+                task.start(None if active is None else
+                           max(active.remaining(), 0))
+                running[task.conn] = task
+
+            if running:
+                ready = multiprocessing.connection.wait(list(running),
+                                                        timeout())
+            else:
+                ready = []
+
+            for conn in ready:
+                task = running.pop(conn)
+                result = task.result()
+                task.stop()
+                racing.slots.release()
+                if result is None:
+                    continue
+                if measure is None:
+                    return task.name, result
+                results[task.index] = task.name, result
+
+            check_deadline('race', finished=len(tasks) - len(pending) -
+                           len(running), running=len(running))
+
+            if (measure is not None and results and
+                    racing.timeout is not None and
+                    time.monotonic() - start >= racing.timeout):
+                break
+    finally:
+        for task in running.values():
+            task.stop()
+            racing.slots.release()
+
+    for index in sorted(results):
+        name, result = results[index]
+        if best is None or measure(result) < measure(best[1]):
+            best = name, result
+    return best
+
+
+if os.getenv('DIOFANT_RACING'):
+    set_racing(int(os.getenv('DIOFANT_RACING')))
@@ -0,0 +1,521 @@
+"""Compact binary serialization of expressions.
+
+Unlike :mod:`pickle`, the format preserves sharing of subexpressions: every
+node is stored once and then referenced by its index, so the size of the
+stream is proportional to the size of the expression DAG, not of the tree.
+Classes are stored once per stream (in a type table) and integers are
+encoded as variable-length quantities.
+
+The stream is a program for a simple stack machine: nodes are written in
+post-order, each constructor opcode pops its arguments from the stack,
+pushes the result and appends it to the memo (for back-references).  Both
+the writer and the reader are iterative, so very deep expressions are
+supported as well.
+
+Expressions are rebuilt by calling their classes on the arguments, as with
+:mod:`pickle`, optionally with automatic evaluation turned off.  Polynomials
+(:class:`~diofant.polys.polytools.Poly` and
+:class:`~diofant.polys.rings.PolyElement`) are stored in their internal
+representation and are loaded without conversion to expressions and back.
+Objects, which can't be encoded otherwise, are embedded as pickles.
+
+.. warning::
+
+   Like :mod:`pickle`, the format is not secure: loading a stream imports
+   modules and calls classes, named in its type table, and unpickles
+   embedded objects.  Never load data from untrusted sources.
+"""
+
+import io
+import pickle
+import struct
+
+from mpmath.libmp import MPZ
+
+from diofant.core.basic import Basic
+from diofant.core.evaluate import global_evaluate
+from diofant.core.function import Function, UndefinedFunction
+from diofant.core.numbers import Float, Integer, Rational
+from diofant.core.symbol import BaseSymbol
+from diofant.polys.domains import PolynomialRing
+from diofant.polys.polyclasses import DMP
+from diofant.polys.polytools import Poly
+from diofant.polys.rings import PolyElement, PolyRing
+
+
+__all__ = ('dump', 'dumps', 'load', 'loads')
+
+
+MAGIC = b'DIOF\x01'
+
+(STOP, NONE, TRUE, FALSE, INT, FLOAT, STR, BYTES, TUPLE, LIST, DICT, REF,
+ TYPE, UNDEF, NODE, REDUCE, INTEGER, RATIONAL, REAL, SYMBOL, POLY, RING,
+ RING_ELEMENT, RING_DOMAIN, PICKLE) = range(25)
+
+_double = struct.Struct('<d')
+
+
+def _coeff_encoder(domain):
+    if domain.is_IntegerRing:
+        return int
+    elif domain.is_RationalField:
+        return lambda c: (int(domain.numer(c)), int(domain.denom(c)))
+    return domain.to_diofant
+
+
+def _coeff_decoder(domain):
+    if domain.is_IntegerRing:
+        return domain.dtype
+    elif domain.is_RationalField:
+        return lambda c: domain.dtype(*c)
+    return domain.from_diofant
+
+
+def _map_dmp(f, rep, lev):
+    if not lev:
+        return [f(c) for c in rep]
+    return [_map_dmp(f, r, lev - 1) for r in rep]
+
+
+def _resolve(name):
+    import importlib
+    module, qualname = name.split(':')
+    obj = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _type_name(cls):
+    """Return the name of ``cls`` for the type table or None."""
+    name = '%s:%s' % (cls.__module__, cls.__qualname__)
+    try:
+        if _resolve(name) is cls:
+            return name
+    except (ImportError, AttributeError, ValueError):
+        pass
+
+
+class _Deferred:
+    """Writer action, done after arguments of a node were written."""
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+
+class _Writer:
+    def __init__(self, file):
+        self.file = file
+        self.buf = bytearray()
+        self.memo = {}
+        self.types = {}
+
+    def write_uint(self, n):
+        buf = self.buf
+        while n > 0x7f:
+            buf.append((n & 0x7f) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def write_int(self, n):
+        self.write_uint(2*n if n >= 0 else -2*n - 1)
+
+    def write_bytes(self, data):
+        self.write_uint(len(data))
+        self.buf += data
+
+    def write_type(self, cls):
+        """Return index of ``cls`` in the type table or None."""
+        tid = self.types.get(cls)
+        if tid is None:
+            if isinstance(cls, UndefinedFunction):
+                self.buf.append(UNDEF)
+                self.write_bytes(cls.__name__.encode())
+            else:
+                name = _type_name(cls)
+                if name is None:
+                    return
+                self.buf.append(TYPE)
+                self.write_bytes(name.encode())
+            tid = self.types[cls] = len(self.types)
+        return tid
+
+    def memoize(self, obj):
+        # Keep a reference, so ids of temporary objects are not reused.
+        self.memo[id(obj)] = (len(self.memo), obj)
+
+    def end(self, op, obj, *args):
+        self.buf.append(op)
+        for n in args:
+            self.write_uint(n)
+        if obj is not None:
+            self.memoize(obj)
+
+    def dump(self, obj):
+        buf = self.buf
+        buf += MAGIC
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            t = type(obj)
+            if t is _Deferred:
+                obj.func(*obj.args)
+            elif obj is None:
+                buf.append(NONE)
+            elif obj is True:
+                buf.append(TRUE)
+            elif obj is False:
+                buf.append(FALSE)
+            elif t is int:
+                buf.append(INT)
+                self.write_int(obj)
+            elif t is float:
+                buf.append(FLOAT)
+                buf += _double.pack(obj)
+            elif t is str:
+                buf.append(STR)
+                self.write_bytes(obj.encode('utf-8', 'surrogatepass'))
+            elif t is bytes:
+                buf.append(BYTES)
+                self.write_bytes(obj)
+            elif t is tuple or t is list:
+                stack.append(_Deferred(self.end, TUPLE if t is tuple else LIST,
+                                       None, len(obj)))
+                stack.extend(reversed(obj))
+            elif t is dict:
+                stack.append(_Deferred(self.end, DICT, None, len(obj)))
+                for k, v in reversed(list(obj.items())):
+                    stack.extend((v, k))
+            else:
+                ref = self.memo.get(id(obj))
+                if ref is not None:
+                    buf.append(REF)
+                    self.write_uint(ref[0])
+                else:
+                    self.save(obj, stack)
+            if len(buf) > 65536:
+                self.file.write(buf)
+                buf.clear()
+        buf.append(STOP)
+        self.file.write(buf)
+        buf.clear()
+
+    def save(self, obj, stack):
+        t = type(obj)
+        buf = self.buf
+        if t is Integer:
+            buf.append(INTEGER)
+            self.write_int(obj.p)
+            self.memoize(obj)
+        elif t is Rational:
+            buf.append(RATIONAL)
+            self.write_int(obj.p)
+            self.write_uint(obj.q)
+            self.memoize(obj)
+        elif t is Float:
+            sign, man, exp, bc = obj._mpf_
+            buf.append(REAL)
+            self.write_uint(sign)
+            self.write_uint(int(man))
+            self.write_int(exp)
+            self.write_uint(bc)
+            self.write_uint(obj._prec)
+            self.memoize(obj)
+        elif isinstance(obj, Basic):
+            tid = self.write_type(t)
+            if tid is None:
+                return self.save_pickle(obj)
+            if isinstance(obj, BaseSymbol):
+                state = obj.__getstate__()
+                if not set(state) <= {'_assumptions', 'dummy_index'}:
+                    return self.save_pickle(obj)
+                stack.append(_Deferred(self.end, SYMBOL, obj, tid))
+                stack.extend((state.get('dummy_index'),
+                              obj._assumptions.generator,
+                              obj.__getnewargs__()))
+            elif isinstance(obj, Poly):
+                rep, lev = obj.rep.rep, obj.rep.lev
+                domain = obj.rep.domain
+                stack.append(_Deferred(self.end, POLY, obj, tid))
+                stack.extend((obj.gens, domain,
+                              _map_dmp(_coeff_encoder(domain), rep, lev)))
+            else:
+                rv = obj.__reduce_ex__(2)
+                if len(rv) != 3 or rv[0] is not t:
+                    return self.save_pickle(obj)
+                args, state = rv[1:]
+                if args is obj.args and not state:
+                    stack.append(_Deferred(self.end, NODE, obj,
+                                           tid, len(args)))
+                    stack.extend(reversed(args))
+                else:
+                    stack.append(_Deferred(self.end, REDUCE, obj, tid))
+                    stack.extend((state, args))
+        elif isinstance(obj, PolyElement):
+            encode = _coeff_encoder(obj.ring.domain)
+            stack.append(_Deferred(self.end, RING_ELEMENT, obj))
+            stack.extend(([(m, encode(c)) for m, c in obj.iterterms()],
+                          obj.ring))
+        elif t is PolyRing:
+            stack.append(_Deferred(self.end, RING, obj))
+            stack.extend((obj.order, obj.domain, obj.symbols))
+        elif type(obj) is PolynomialRing:
+            stack.append(_Deferred(self.end, RING_DOMAIN, obj))
+            stack.append(obj.ring)
+        else:
+            self.save_pickle(obj)
+
+    def save_pickle(self, obj):
+        self.buf.append(PICKLE)
+        self.write_bytes(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+        self.memoize(obj)
+
+
+class _Reader:
+    def __init__(self, file):
+        self.file = file
+
+    def read(self, n):
+        data = self.file.read(n)
+        if len(data) != n:
+            raise EOFError('unexpected end of stream')
+        return data
+
+    def read_uint(self):
+        read = self.file.read
+        n = shift = 0
+        while True:
+            b = read(1)
+            if not b:
+                raise EOFError('unexpected end of stream')
+            b = b[0]
+            n |= (b & 0x7f) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+
+    def read_int(self):
+        n = self.read_uint()
+        return -(n + 1)//2 if n & 1 else n//2
+
+    def read_bytes(self):
+        return self.read(self.read_uint())
+
+    def load(self):
+        magic = self.file.read(len(MAGIC))
+        if not magic:
+            raise EOFError
+        elif magic != MAGIC:
+            raise ValueError('not a serialized expression or '
+                             'unsupported version of the format')
+
+        read = self.file.read
+        read_uint = self.read_uint
+        stack, memo, types = [], [], []
+        push, remember = stack.append, memo.append
+        while True:
+            op = read(1)
+            if not op:
+                raise EOFError('unexpected end of stream')
+            op = op[0]
+            if op == REF:
+                push(memo[read_uint()])
+            elif op == NODE:
+                cls, n = types[read_uint()], read_uint()
+                if n:
+                    args = stack[-n:]
+                    del stack[-n:]
+                else:
+                    args = ()
+                obj = cls(*args)
+                push(obj)
+                remember(obj)
+            elif op == INTEGER:
+                obj = Integer(self.read_int())
+                push(obj)
+                remember(obj)
+            elif op == INT:
+                push(self.read_int())
+            elif op in (TUPLE, LIST):
+                n = read_uint()
+                items = stack[len(stack) - n:]
+                del stack[len(stack) - n:]
+                push(tuple(items) if op == TUPLE else items)
+            elif op == DICT:
+                n = 2*read_uint()
+                items = stack[len(stack) - n:]
+                del stack[len(stack) - n:]
+                push(dict(zip(items[::2], items[1::2])))
+            elif op == SYMBOL:
+                cls = types[read_uint()]
+                dummy_index = stack.pop()
+                assumptions = stack.pop()
+                obj = cls(*stack.pop(), **assumptions)
+                if dummy_index is not None:
+                    obj.dummy_index = dummy_index
+                push(obj)
+                remember(obj)
+            elif op == RATIONAL:
+                obj = Rational(self.read_int(), read_uint())
+                push(obj)
+                remember(obj)
+            elif op == REAL:
+                sign, man = read_uint(), MPZ(read_uint())
+                exp, bc = self.read_int(), read_uint()
+                obj = Float._new((sign, man, exp, bc), read_uint())
+                push(obj)
+                remember(obj)
+            elif op == STR:
+                push(self.read_bytes().decode('utf-8', 'surrogatepass'))
+            elif op in (NONE, TRUE, FALSE):
+                push({NONE: None, TRUE: True, FALSE: False}[op])
+            elif op == FLOAT:
+                push(_double.unpack(self.read(8))[0])
+            elif op == BYTES:
+                push(self.read_bytes())
+            elif op == TYPE:
+                types.append(_resolve(self.read_bytes().decode()))
+            elif op == UNDEF:
+                types.append(Function(self.read_bytes().decode()))
+            elif op == REDUCE:
+                cls = types[read_uint()]
+                state = stack.pop()
+                obj = cls(*stack.pop())
+                if state:
+                    obj.__setstate__(state)
+                push(obj)
+                remember(obj)
+            elif op == POLY:
+                cls = types[read_uint()]
+                gens, domain = stack.pop(), stack.pop()
+                lev = len(gens) - 1
+                rep = _map_dmp(_coeff_decoder(domain), stack.pop(), lev)
+                obj = cls.new(DMP(rep, domain, lev), *gens)
+                push(obj)
+                remember(obj)
+            elif op == RING:
+                order, domain = stack.pop(), stack.pop()
+                obj = PolyRing(stack.pop(), domain, order)
+                push(obj)
+                remember(obj)
+            elif op == RING_ELEMENT:
+                terms, ring = stack.pop(), stack.pop()
+                decode = _coeff_decoder(ring.domain)
+                obj = ring.dtype([(m, decode(c)) for m, c in terms])
+                push(obj)
+                remember(obj)
+            elif op == RING_DOMAIN:
+                obj = stack.pop().to_domain()
+                push(obj)
+                remember(obj)
+            elif op == PICKLE:
+                obj = pickle.loads(self.read_bytes())
+                push(obj)
+                remember(obj)
+            elif op == STOP:
+                break
+            else:
+                raise ValueError('invalid opcode %d' % op)
+        if len(stack) != 1:
+            raise ValueError('corrupted stream')
+        return stack[0]
+
+
+def dump(obj, file):
+    """Write the serialized ``obj`` to the binary ``file``.
+
+    ``obj`` could be an expression, a polynomial, a number, a string or
+    (nested) tuples, lists and dictionaries of them.  Several objects could
+    be written to the same file one after another.
+
+    See Also
+    ========
+
+    load, dumps
+    """
+    _Writer(file).dump(obj)
+
+
+def dumps(obj):
+    """Return the serialized ``obj`` as :class:`bytes`.
+
+    Examples
+    ========
+
+    >>> from diofant import sin, cos
+    >>> from diofant.abc import x
+    >>> e = (sin(x) + cos(x))**2 + (sin(x) + cos(x))**3
+    >>> loads(dumps(e)) == e
+    True
+
+    Shared subexpressions are stored only once:
+
+    >>> len(dumps([e]*10)) < len(dumps(e)) + 30
+    True
+
+    See Also
+    ========
+
+    loads, dump
+    """
+    file = io.BytesIO()
+    dump(obj, file)
+    return file.getvalue()
+
+
+def load(file, evaluate=True):
+    """Read the next serialized object from the binary ``file``.
+
+    Parameters
+    ==========
+
+    file : file-like object
+        Stream, created with :func:`dump`.  Only the bytes of the object
+        are consumed.
+    evaluate : bool, optional
+        If False, automatic evaluation is turned off while expressions are
+        rebuilt.  Default is True.
+
+    Raises
+    ======
+
+    EOFError
+        If the end of the file was reached.
+
+    See Also
+    ========
+
+    dump, loads
+    """
+    old = global_evaluate[0]
+    global_evaluate[0] = evaluate and old
+    try:
+        return _Reader(file).load()
+    finally:
+        global_evaluate[0] = old
+
+
+def loads(data, evaluate=True):
+    """Return the object, serialized in ``data``.
+
+    Examples
+    ========
+
+    >>> from diofant.abc import x
+    >>> from diofant.core.evaluate import evaluate
+    >>> with evaluate(False):
+    ...     e = x + x
+    >>> loads(dumps(e))
+    2*x
+    >>> loads(dumps(e), evaluate=False)
+    x + x
+
+    See Also
+    ========
+
+    dumps, load
+    """
+    return load(io.BytesIO(data), evaluate=evaluate)
@@ -0,0 +1,191 @@
+"""Lookup tables, stored on disk and loaded lazily.
+
+Some algorithms use large tables of formulae (e.g. the table of Meijer
+G-function representations in :mod:`~diofant.integrals.meijerint` or the
+knowledge base of :mod:`~diofant.simplify.hyperexpand`), which are
+expensive to build.  With the disk cache enabled (see
+:mod:`~diofant.utilities.diskcache`), such tables are built on first use
+and stored in a file; other processes map this file into memory and
+materialize entries only on access.
+
+A table file starts with a header (magic bytes and the offset of the
+index), followed by entries, serialized separately with
+:mod:`~diofant.utilities.serialize`.  The index maps keys of the table to
+positions of entries.  Keys of tables in the disk cache are computed from
+the name of the table, the version of Diofant and the source code of
+modules, which define the table, so tables are rebuilt after any change.
+
+Dummy symbols are not preserved by serialization, so on loading every
+dummy of the table is replaced with a fresh one, except for the given
+``symbols`` (e.g. module-level dummies), which are replaced with current
+objects.  Wild symbols are rebuilt with replaced exclusions.
+
+.. warning::
+
+   Entries are loaded with :mod:`~diofant.utilities.serialize`, which (like
+   :mod:`pickle`) can execute arbitrary code.  The disk cache directory must
+   be trusted, i.e. writable only by users, whose code you would run.
+"""
+
+import hashlib
+import io
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Mapping
+
+from diofant.core.basic import Basic
+from diofant.core.symbol import Dummy, Wild
+from diofant.utilities.diskcache import disk_cache_key, get_disk_cache
+from diofant.utilities.serialize import dumps, loads
+
+
+__all__ = ('LazyTable', 'dump_table', 'cached_table')
+
+
+MAGIC = b'DIOFTBL\x01'
+
+_header = struct.Struct('<8sQ')
+
+
+def dump_table(table, file, symbols=()):
+    """Write ``table`` (a mapping) to the binary ``file``.
+
+    ``symbols`` are stored in the index, to be replaced with current
+    objects by :class:`LazyTable`.
+    """
+    start = file.tell()
+    file.write(_header.pack(MAGIC, 0))
+    index = {}
+    offset = _header.size
+    for key, value in table.items():
+        data = dumps(value)
+        index[key] = (offset, len(data))
+        file.write(data)
+        offset += len(data)
+    file.write(dumps((tuple(symbols), index)))
+    end = file.tell()
+    file.seek(start)
+    file.write(_header.pack(MAGIC, offset))
+    file.seek(end)
+
+
+def _remap(obj, mapping):
+    if isinstance(obj, Basic):
+        for s in obj.atoms(Dummy, Wild):
+            if s not in mapping:
+                if isinstance(s, Wild):
+                    mapping[s] = Wild(s.name, _remap(s.exclude, mapping),
+                                      s.properties,
+                                      **s._assumptions.generator)
+                else:
+                    mapping[s] = Dummy(s.name, **s._assumptions.generator)
+        return obj.xreplace(mapping)
+    elif getattr(obj, 'is_Matrix', False):
+        return obj.applyfunc(lambda e: _remap(e, mapping))
+    elif isinstance(obj, (tuple, list)):
+        return type(obj)(_remap(o, mapping) for o in obj)
+    elif isinstance(obj, dict):
+        return {_remap(k, mapping): _remap(v, mapping)
+                for k, v in obj.items()}
+    return obj
+
+
+class LazyTable(Mapping):
+    """Read-only mapping, loaded from a file, written by :func:`dump_table`.
+
+    The file is mapped into memory and entries are deserialized on first
+    access.  ``decode``, if given, is applied to deserialized entries.
+
+    Examples
+    ========
+
+    >>> import os, tempfile
+    >>> from diofant import Dummy, sin
+    >>> z = Dummy('z')
+    >>> path = os.path.join(tempfile.mkdtemp(), 'table')
+    >>> with open(path, 'wb') as f:
+    ...     dump_table({sin: [sin(z)], 'one': 1}, f, [z])
+    >>> table = LazyTable(path, [z])
+    >>> sorted(table, key=str)
+    ['one', sin]
+    >>> table[sin] == [sin(z)]
+    True
+    """
+
+    def __init__(self, path, symbols=(), decode=None):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, offset = _header.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError('not a table file: %s' % path)
+        stored, self._index = loads(self._data[offset:])
+        self._mapping = dict(zip(stored, symbols))
+        self._decode = decode
+        self._entries = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._entries[key]
+        except KeyError:
+            pass
+        offset, size = self._index[key]
+        value = _remap(loads(self._data[offset:offset + size]),
+                       self._mapping)
+        if self._decode is not None:
+            value = self._decode(value)
+        return self._entries.setdefault(key, value)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+
+def _source_hash(modules):
+    h = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def cached_table(name, build, modules, symbols=(), encode=None,
+                 decode=None):
+    """Return the lookup table ``name``.
+
+    If the disk cache is disabled, ``build()`` is returned.  Otherwise the
+    table is loaded from the disk cache (as :class:`LazyTable`) or, if
+    it's missing, built and stored there.  ``modules`` are modules, which
+    define the table.  ``encode`` and ``decode``, if given, convert
+    entries of the table to and from serializable objects.
+    """
+    import diofant
+
+    cache = get_disk_cache()
+    if cache is None:
+        return build()
+
+    key = disk_cache_key('table', name, MAGIC, diofant.__version__,
+                         _source_hash(modules))
+    path = cache.get(key)
+    if path is not None:
+        try:
+            return LazyTable(os.path.join(path, name), symbols, decode)
+        except (OSError, ValueError, struct.error):
+            pass
+
+    table = build()
+    file = io.BytesIO()
+    try:
+        dump_table(table if encode is None else
+                   {k: encode(v) for k, v in table.items()}, file, symbols)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return table
+    cache.put(key, {name: file.getvalue()})
+    return table
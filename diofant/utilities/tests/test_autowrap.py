@@ -167,12 +167,19 @@ def test_ufuncify_source():
     npy_intp in1_step = steps[1];
     npy_intp in2_step = steps[2];
     npy_intp out1_step = steps[3];
-    for (i = 0; i < n; i++) {
-        *((double *)out1) = test(*(double *)in0, *(double *)in1, *(double *)in2);
-        in0 += in0_step;
-        in1 += in1_step;
-        in2 += in2_step;
-        out1 += out1_step;
+    if (in0_step == sizeof(double) && in1_step == sizeof(double) && in2_step == sizeof(double) && out1_step == sizeof(double)) {
+        const double *restrict in0_array = (const double *)in0;
+        const double *restrict in1_array = (const double *)in1;
+        const double *restrict in2_array = (const double *)in2;
+        double *restrict out1_array = (double *)out1;
+        for (i = 0; i < n; i++) {
+            out1_array[i] = test(in0_array[i], in1_array[i], in2_array[i]);
+        }
+    }
+    else {
+        for (i = 0; i < n; i++) {
+            *(double *)(out1 + i*out1_step) = test(*(double *)(in0 + i*in0_step), *(double *)(in1 + i*in1_step), *(double *)(in2 + i*in2_step));
+        }
     }
 }
 PyUFuncGenericFunction test_funcs[1] = {&test_ufunc};
@@ -228,3 +235,58 @@ def test_ufuncify_source():
 }
 #endif"""
     assert source == expected
+
+
+def test_ufuncify_source_multioutput():
+    x, y, z = symbols('x,y,z')
+    var_symbols = (x, y, z)
+    expr = x + y**3 + 10*z**2
+    code_wrapper = UfuncifyCodeWrapper(CCodeGen("ufuncify"), openmp=True)
+    CodeWrapper._module_counter = 0
+    routine = make_routine("func", [Eq(a, expr.diff(v))
+                                    for a, v in zip(symbols('a:3'),
+                                                    var_symbols)],
+                           var_symbols + symbols('a:3'))
+    source = get_string(code_wrapper.dump_c, [routine])
+    expected = """\
+static void func_ufunc(char **args, npy_intp *dimensions, npy_intp* steps, void* data)
+{
+    npy_intp i;
+    npy_intp n = dimensions[0];
+    char *in0 = args[0];
+    char *in1 = args[1];
+    char *in2 = args[2];
+    char *out1 = args[3];
+    char *out2 = args[4];
+    char *out3 = args[5];
+    npy_intp in0_step = steps[0];
+    npy_intp in1_step = steps[1];
+    npy_intp in2_step = steps[2];
+    npy_intp out1_step = steps[3];
+    npy_intp out2_step = steps[4];
+    npy_intp out3_step = steps[5];
+    if (in0_step == sizeof(double) && in1_step == sizeof(double) && in2_step == sizeof(double) && out1_step == sizeof(double) && out2_step == sizeof(double) && out3_step == sizeof(double)) {
+        const double *restrict in0_array = (const double *)in0;
+        const double *restrict in1_array = (const double *)in1;
+        const double *restrict in2_array = (const double *)in2;
+        double *restrict out1_array = (double *)out1;
+        double *restrict out2_array = (double *)out2;
+        double *restrict out3_array = (double *)out3;
+#pragma omp parallel for if (n > 1000)
+        for (i = 0; i < n; i++) {
+            func(in0_array[i], in1_array[i], in2_array[i], &out1_array[i], &out2_array[i], &out3_array[i]);
+        }
+    }
+    else {
+#pragma omp parallel for if (n > 1000)
+        for (i = 0; i < n; i++) {
+            func(*(double *)(in0 + i*in0_step), *(double *)(in1 + i*in1_step), *(double *)(in2 + i*in2_step), (double *)(out1 + i*out1_step), (double *)(out2 + i*out2_step), (double *)(out3 + i*out3_step));
+        }
+    }
+}
+PyUFuncGenericFunction func_funcs[1] = {&func_ufunc};
+static char func_types[6] = {NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE, NPY_DOUBLE};
+static void *func_data[1] = {NULL};"""
+    assert expected in source
+    assert ("PyUFunc_FromFuncAndData(func_funcs, func_data, func_types, 1, 3, 3,"
+            in source)
@@ -3,7 +3,7 @@
 import pytest
 
 from diofant.core import symbols, Eq, pi, Catalan, Lambda, Dummy
-from diofant import erf, Integral
+from diofant import erf, Integral, sin, cos
 from diofant import Equality
 from diofant.matrices import Matrix, MatrixSymbol
 from diofant.utilities.codegen import (codegen, make_routine, CCodeGen,
@@ -106,6 +106,24 @@ def test_simple_c_code():
     assert source == expected
 
 
+def test_c_code_cse():
+    x, y, z = symbols('x,y,z')
+    a, b, x0 = symbols('a,b,x0')
+    routine = make_routine("test", [Eq(a, sin(x + y)*z), Eq(b, cos(x + y)*x0)])
+    code_gen = CCodeGen(cse=True)
+    source = get_string(code_gen.dump_c, [routine])
+    expected = (
+        "#include \"file.h\"\n"
+        "#include <math.h>\n"
+        "void test(double x, double x0, double y, double z, double *a, double *b) {\n"
+        "   const double x1 = x + y;\n"
+        "   (*a) = z*sin(x1);\n"
+        "   (*b) = x0*cos(x1);\n"
+        "}\n"
+    )
+    assert source == expected
+
+
 def test_c_code_reserved_words():
     x, y, z = symbols('if, typedef, while')
     expr = (x + y) * z
@@ -467,6 +485,59 @@ def test_partial_loops_c():
     )
 
 
+def test_fused_loops_c():
+    from diofant.tensor import IndexedBase, Idx
+    n, m = symbols('n m', integer=True)
+    a, b = symbols('a b')
+    A = IndexedBase('A')
+    x = IndexedBase('x')
+    y = IndexedBase('y')
+    z = IndexedBase('z')
+    i = Idx('i', m)
+    j = Idx('j', n)
+
+    r = make_routine('f', [Eq(y[i], A[i, j]*x[j]*cos(a) + sin(a)*b*x[i]),
+                           Eq(z[i], 2*b*sin(a)*x[i] - cos(a))])
+    c = CCodeGen(fuse_loops=True)
+    code = get_string(c.dump_c, [r])
+    assert code == (
+        '#include "file.h"\n'
+        '#include <math.h>\n'
+        'void f(double *A, double a, double b, int m, int n, double *x, '
+        'double *y, double *z) {\n'
+        '   const double x0 = b*sin(a);\n'
+        '   const double x1 = cos(a);\n'
+        '   for (int i=0; i<m; i++){\n'
+        '      y[i] = x0*x[i];\n'
+        '      for (int j=0; j<n; j++){\n'
+        '         y[i] = x1*x[j]*A[%s] + y[i];\n' % (i*n + j) +
+        '      }\n'
+        '      z[i] = 2*x0*x[i] - x1;\n'
+        '   }\n'
+        '}\n'
+    )
+
+    # names of local variables are unique
+    x0 = symbols('x0')
+    r = make_routine('f', [Eq(a, (b + 1)**2 + sin(b + 1)),
+                           Eq(y[i], cos(b)*x[i] + x0)])
+    c = CCodeGen(cse=True, fuse_loops=True)
+    code = get_string(c.dump_c, [r])
+    assert code == (
+        '#include "file.h"\n'
+        '#include <math.h>\n'
+        'void f(double b, int m, double *x, double x0, double *a, '
+        'double *y) {\n'
+        '   const double x1 = b + 1;\n'
+        '   (*a) = pow(x1, 2) + sin(x1);\n'
+        '   const double x2 = cos(b);\n'
+        '   for (int i=0; i<m; i++){\n'
+        '      y[i] = x0 + x2*x[i];\n'
+        '   }\n'
+        '}\n'
+    )
+
+
 def test_output_arg_c():
     from diofant import sin, cos, Equality
     x, y, z = symbols("x,y,z")
@@ -1172,6 +1243,56 @@ def test_partial_loops_f():
         code == expected % {'rhs': 'x(j)*A(i, j)'}
 
 
+def test_tiled_loops_f():
+    from diofant.tensor import IndexedBase, Idx
+    n, m, o = symbols('n m o', integer=True)
+    A = IndexedBase('A')
+    B = IndexedBase('B')
+    C = IndexedBase('C')
+    i = Idx('i', m)
+    j = Idx('j', n)
+    k = Idx('k', o)
+
+    r = make_routine('matmat', Eq(C[i, k], A[i, j]*B[j, k]))
+    c = FCodeGen(fuse_loops=True, tile=64)
+    code = get_string(c.dump_f95, [r])
+    assert code == (
+        'subroutine matmat(A, B, m, n, o, C)\n'
+        'implicit none\n'
+        'INTEGER*4, intent(in) :: m\n'
+        'INTEGER*4, intent(in) :: n\n'
+        'INTEGER*4, intent(in) :: o\n'
+        'REAL*8, intent(in), dimension(1:m, 1:n) :: A\n'
+        'REAL*8, intent(in), dimension(1:n, 1:o) :: B\n'
+        'REAL*8, intent(out), dimension(1:m, 1:o) :: C\n'
+        'INTEGER*4 :: i\n'
+        'INTEGER*4 :: j\n'
+        'INTEGER*4 :: k\n'
+        'INTEGER*4 :: i_tile\n'
+        'INTEGER*4 :: j_tile\n'
+        'INTEGER*4 :: k_tile\n'
+        'do k = 1, o\n'
+        '   do i = 1, m\n'
+        '      C(i, k) = 0\n'
+        '   end do\n'
+        'end do\n'
+        'do k_tile = 1, o, 64\n'
+        '   do j_tile = 1, n, 64\n'
+        '      do i_tile = 1, m, 64\n'
+        '         do k = k_tile, min(o, k_tile + 63)\n'
+        '            do j = j_tile, min(n, j_tile + 63)\n'
+        '               do i = i_tile, min(m, i_tile + 63)\n'
+        '                  C(i, k) = A(i, j)*B(j, k) + C(i, k)\n'
+        '               end do\n'
+        '            end do\n'
+        '         end do\n'
+        '      end do\n'
+        '   end do\n'
+        'end do\n'
+        'end subroutine\n'
+    )
+
+
 def test_output_arg_f():
     from diofant import sin, cos, Equality
     x, y, z = symbols("x,y,z")
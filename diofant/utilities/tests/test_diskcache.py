@@ -0,0 +1,95 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from diofant import symbols, sin, cos, Dummy, Matrix
+from diofant.core.cache import clear_cache
+from diofant.utilities.autowrap import autowrap
+from diofant.utilities.diskcache import (DiskCache, disk_cache_key,
+                                         get_disk_cache, set_disk_cache)
+from diofant.utilities.lambdify import lambdify
+
+
+x, y = symbols('x y')
+
+
+def test_DiskCache():
+    tmp = tempfile.mkdtemp()
+    try:
+        cache = DiskCache(tmp, max_size=10)
+        assert cache.get('a') is None
+        path = cache.put('a', {'spam': b'12345'})
+        with open(os.path.join(path, 'spam'), 'rb') as f:
+            assert f.read() == b'12345'
+        # existing entries are kept intact
+        cache.put('a', {'spam': b'54321'})
+        with open(os.path.join(cache.get('a'), 'spam'), 'rb') as f:
+            assert f.read() == b'12345'
+
+        os.utime(cache.get('a'), (0, 0))
+        cache.put('b', {'eggs': b'123'})
+        assert os.path.isdir(os.path.join(tmp, 'a'))
+        cache.put('c', {'ham': b'123'})
+        # least recently used entry was evicted
+        assert cache.get('a') is None
+        assert cache.get('b') is not None
+        assert cache.get('c') is not None
+
+        cache.clear()
+        assert cache.get('b') is None
+        assert [f for f in os.listdir(tmp) if not f.startswith('.')] == []
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_disk_cache_key():
+    assert disk_cache_key(x + 1) == disk_cache_key(x + 1)
+    assert disk_cache_key(x + 1) != disk_cache_key(x + 2)
+    assert disk_cache_key([x], {1: x}) != disk_cache_key((x,), {1: x})
+    assert disk_cache_key(Dummy('x')) == disk_cache_key(Dummy('y'))
+    assert disk_cache_key(Dummy('x')) != disk_cache_key(Dummy('x', real=True))
+    d1, d2 = Dummy('x'), Dummy('x')
+    assert disk_cache_key(d1 + 2*d2) != disk_cache_key(3*d1)
+
+
+def test_lambdify():
+    tmp = tempfile.mkdtemp()
+    old = set_disk_cache(tmp)
+    try:
+        assert get_disk_cache().directory == tmp
+        e = Matrix([sin(x + y), cos(x + y)])
+        f = lambdify((x, y), e, modules='diofant', cse=True)
+        assert len(os.listdir(tmp)) == 1
+        g = lambdify((x, y), e, modules='diofant', cse=True)
+        assert len(os.listdir(tmp)) == 1
+        assert f(x, y) == g(x, y) == e
+        lambdify((x, y), e, modules='diofant')
+        assert len(os.listdir(tmp)) == 2
+    finally:
+        set_disk_cache(old.directory if old else None)
+        shutil.rmtree(tmp)
+
+
+def test_autowrap():
+    tmp = tempfile.mkdtemp()
+    old = set_disk_cache(tmp)
+    try:
+        clear_cache()
+        f = autowrap(x + y, backend='dummy')
+        assert f() == str(x + y)
+        entries = os.listdir(tmp)
+        assert len(entries) == 1
+        name = f.__module__
+        assert name.endswith(entries[0][:16])
+
+        # load module from the cache entry
+        clear_cache()
+        del sys.modules[name]
+        f = autowrap(x + y, backend='dummy')
+        assert f() == str(x + y)
+        assert sys.modules[name].__file__.startswith(tmp)
+        assert os.listdir(tmp) == entries
+    finally:
+        set_disk_cache(old.directory if old else None)
+        shutil.rmtree(tmp)
@@ -7,7 +7,7 @@
                      Rational, Float, Matrix, Lambda, Piecewise, exp, Integral,
                      oo, I, Abs, Function, true, false, And, Or, Not, sympify, ITE)
 from diofant.printing.lambdarepr import LambdaPrinter
-from diofant.utilities.lambdify import implemented_function
+from diofant.utilities.lambdify import implemented_function, evaluate_batch
 from diofant.utilities.decorator import conserve_mpmath_dps
 from diofant.external import import_module
 import diofant
@@ -582,3 +582,69 @@ def test_sympyissue_2790():
 def test_ITE():
     assert lambdify((x, y, z), ITE(x, y, z))(True, 5, 3) == 5
     assert lambdify((x, y, z), ITE(x, y, z))(False, 5, 3) == 3
+
+
+def test_cse():
+    e = sin(x + y)**2 + cos(x + y)
+    f = lambdify((x, y), e, cse=True)
+    assert f(1, 2) == lambdify((x, y), e)(1, 2)
+
+    f = lambdify((x, y), [sin(x + y), (x + y)**2], cse=True)
+    assert f(1, 2) == [math.sin(3), 9]
+    f = lambdify((x, y), (x + y, [(x + y)**2]), cse=True)
+    assert f(1, 2) == (3, [9])
+    f = lambdify(x, {1: x + 1, 2: (x + 1)**2}, cse=True)
+    assert f(1) == {1: 2, 2: 4}
+
+    J = Matrix([sin(x*y)**2, cos(x*y), x*y]).jacobian([x, y])
+    f = lambdify((x, y), J, modules='diofant', cse=True)
+    assert f(x, y) == J
+
+    assert lambdify('x,y,z', 'z,y,x', cse=True)(3, 2, 1) == (1, 2, 3)
+    assert lambdify([], 1, cse=True)() == 1
+    assert lambdify((x, (y, (w, z))), (w + x + y + z)**2,
+                    cse=True)(1, (2, (3, 4))) == 100
+
+    # symbols for common subexpressions must not clash with arguments
+    x0 = symbols('x0')
+    f = lambdify((x0, x), [x0, (x + 1)**2, x + 1], cse=True, dummify=False)
+    assert f(5, 1) == [5, 4, 2]
+
+
+@pytest.mark.skipif(numpy is None, reason="no numpy")
+def test_cse_numpy():
+    J = Matrix([sin(x*y)**2, cos(x*y)]).jacobian([x, y])
+    f = lambdify((x, y), J, modules='numpy', cse=True)
+    assert numpy.allclose(f(1.0, 2.0), lambdify((x, y), J, 'numpy')(1.0, 2.0))
+
+
+def test_evaluate_batch():
+    e = [sin(x)**2 + cos(x)**2, x*y + Rational(1, 3)]
+    data = [(0.5, 1), ('0.1', 2), (3, 4)]
+
+    r = evaluate_batch(e, [x, y], data, dps=30)
+    assert len(r) == 3
+    assert all(isinstance(v, mpmath.mpf) for row in r for v in row)
+    with mpmath.workdps(30):
+        assert r[1][1] == mpmath.mpf('0.2') + mpmath.mpf(1)/3
+        assert abs(r[2][0] - 1) < mpmath.mpf(10)**-29
+
+    r = evaluate_batch(x*y, [x, y], iter(data[::2]), dps=30, chunksize=1)
+    assert r == [0.5, 12]
+
+    r = evaluate_batch(e, [x, y], data[::2], processes=2, chunksize=1)
+    assert len(r) == 2
+    for row, ans in zip(r, [[1, 0.5 + 1/3], [1, 12 + 1/3]]):
+        assert all(abs(a - b) < 1e-14 for a, b in zip(row, ans))
+
+
+@pytest.mark.skipif(numpy is None, reason="no numpy")
+def test_evaluate_batch_numpy():
+    data = numpy.random.rand(100, 2)
+    r = evaluate_batch([sin(x)*y, 1], [x, y], data, chunksize=30)
+    assert r.shape == (100, 2)
+    assert numpy.allclose(r[:, 0], numpy.sin(data[:, 0])*data[:, 1])
+    assert (r[:, 1] == 1).all()
+    r = evaluate_batch(x + y, [x, y], data)
+    assert numpy.allclose(r, data.sum(axis=1))
+    assert evaluate_batch(x, [x], []).shape == (0,)
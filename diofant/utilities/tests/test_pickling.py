@@ -131,8 +131,9 @@ def check(a, exclude=[], check_attr=True):
 
         def c(a, b, d):
             for i in d:
-                if not hasattr(a, i) or i in {'_assumptions',
-                                              '_mhash', '__dict__'}:
+                # _mhash and _sort_key are caches, computed on demand
+                if not hasattr(a, i) or i in {'_assumptions', '_mhash',
+                                              '_sort_key', '__dict__'}:
                     continue
                 attr = getattr(a, i)
                 if not hasattr(attr, "__call__"):
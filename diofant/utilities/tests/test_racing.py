@@ -0,0 +1,141 @@
+import time
+
+import pytest
+
+from diofant import (Dummy, Symbol, cancel, count_ops, factor, integrate,
+                     simplify, sin, cos, exp, deadline, DeadlineExceeded)
+from diofant.utilities.racing import get_racing, race, set_racing
+
+from diofant.abc import x
+
+
+def _sleep(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def _fail(value):
+    raise ValueError(value)
+
+
+def _dummy(name):
+    return Dummy(name)
+
+
+@pytest.fixture
+def racing():
+    old = set_racing(2)
+    try:
+        yield get_racing()
+    finally:
+        set_racing(old.processes if old else None,
+                   old.timeout if old else None)
+
+
+def test_set_racing():
+    old = set_racing(None)
+    try:
+        assert get_racing() is None
+        assert set_racing(True) is None
+        assert get_racing().processes >= 1
+        assert set_racing(3, 1.5).processes >= 1
+        assert repr(get_racing()) == '_Racing(processes=3, timeout=1.5)'
+        pytest.raises(ValueError, lambda: set_racing(0))
+    finally:
+        set_racing(old.processes if old else None,
+                   old.timeout if old else None)
+
+
+def test_sequential():
+    old = set_racing(None)
+    try:
+        e = (x**2 - 1)/(x - 1)
+        assert race([('none', _sleep, (0, None), {}),
+                     ('cancel', cancel, (e,), {}),
+                     ('fail', _fail, (1,), {})]) == ('cancel', x + 1)
+        assert race([('fail', _sleep, (0, None), {})]) is None
+
+        # exceptions are failures, as with racing
+        assert race([('fail', _fail, (1,), {}),
+                     ('cancel', cancel, (e,), {})]) == ('cancel', x + 1)
+    finally:
+        set_racing(old.processes if old else None,
+                   old.timeout if old else None)
+
+
+def test_race(racing):
+    e = (x**2 - 1)/(x - 1)
+
+    assert race([('slow', _sleep, (10, 1), {}),
+                 ('fast', _sleep, (0, 2), {})]) == ('fast', 2)
+    assert race([('fail', _fail, (1,), {}),
+                 ('none', _sleep, (0, None), {}),
+                 ('one', _sleep, (0.1, 1), {})]) == ('one', 1)
+    assert race([('fail', _fail, (1,), {}),
+                 ('none', _sleep, (0, None), {})]) is None
+
+    # more tasks, than slots
+    assert race([('expand', _sleep, (0.2, e.expand()), {}),
+                 ('factor', factor, (e,), {}),
+                 ('cancel', cancel, (e,), {})],
+                measure=count_ops) == ('factor', x + 1)
+
+    # losers are terminated
+    start = time.monotonic()
+    assert race([('slow', _sleep, (30, 1), {}),
+                 ('fast', _sleep, (0.1, 2), {})]) == ('fast', 2)
+    assert time.monotonic() - start < 10
+    assert all(racing.slots.acquire(blocking=False) for _ in range(2))
+    racing.slots.release()
+    racing.slots.release()
+
+    # unserializable tasks are run sequentially
+    assert race([('lambda', lambda: 1, (), {}),
+                 ('none', _sleep, (0, None), {})]) == ('lambda', 1)
+
+    # new dummies of workers are replaced
+    d = Dummy('d')
+    assert race([('dummy', _sleep, (0, d), {}),
+                 ('none', _sleep, (0, None), {})]) == ('dummy', d)
+    name, d2 = race([('dummy', _dummy, ('d',), {}),
+                     ('none', _sleep, (0, None), {})])
+    assert d2.name == 'd' and d2.is_Dummy
+
+    with pytest.raises(DeadlineExceeded) as exc:
+        with deadline(0.2):
+            race([('slow', _sleep, (30, 1), {}),
+                  ('slower', _sleep, (60, 1), {})])
+    assert exc.value.where == 'race'
+
+    # slots are held by other races
+    assert all(racing.slots.acquire(blocking=False) for _ in range(2))
+    try:
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            with deadline(0.2):
+                race([('one', _sleep, (0, 1), {}),
+                      ('two', _sleep, (0, 2), {})])
+        assert time.monotonic() - start < 10
+    finally:
+        racing.slots.release()
+        racing.slots.release()
+
+
+def test_race_timeout():
+    old = set_racing(2, 0.5)
+    try:
+        start = time.monotonic()
+        assert race([('slow', _sleep, (30, Symbol('y')), {}),
+                     ('fast', _sleep, (0, x + x), {})],
+                    measure=count_ops) == ('fast', 2*x)
+        assert time.monotonic() - start < 10
+    finally:
+        set_racing(old.processes if old else None,
+                   old.timeout if old else None)
+
+
+def test_integrate_simplify(racing):
+    f = x*exp(x)
+    assert (integrate(f, x).diff(x) - f).expand() == 0
+    assert simplify(sin(x)**2 + cos(x)**2) == 1
+    assert simplify((x**2 - 1)/(x - 1)) == x + 1
@@ -0,0 +1,112 @@
+import io
+
+import pytest
+
+from diofant import (symbols, Symbol, Dummy, Wild, Function, Integer,
+                     Rational, Float, pi, oo, I, sin, cos, sqrt, Integral,
+                     Matrix, ImmutableMatrix, Poly, QQ, ZZ, Tuple, Eq)
+from diofant.core.evaluate import evaluate
+from diofant.polys.orderings import grlex
+from diofant.polys.rings import ring
+from diofant.utilities.serialize import dump, dumps, load, loads
+
+
+x, y, z = symbols('x y z')
+f = Function('f')
+
+
+def test_roundtrip():
+    for obj in [x, Integer(0), Integer(-10**30), Rational(-3, 7),
+                Float('1.25', 30), Float(-1e-300), pi, oo, I, x + y*z,
+                sin(x)**2/cos(y) - sqrt(3)*x, f(x, y).diff(x),
+                Integral(f(x), (x, 0, 1)), Eq(x, 1), Tuple(x, (1, 2)),
+                ImmutableMatrix([[x, 1], [2, y]]),
+                Symbol('a', positive=True), Wild('w', exclude=[x]),
+                None, True, False, 1, -2**70, 1.5, 'spam', b'eggs',
+                (1, x), [x, [y]], {x: 1, 'a': [2]}, Matrix([x, 1])]:
+        r = loads(dumps(obj))
+        assert r == obj
+        assert type(r) is type(obj)
+
+    p = Symbol('p', positive=True)
+    assert loads(dumps(p)).is_positive is True
+
+    d1, d2 = Dummy('d'), Dummy('d', integer=True)
+    r1, r2 = loads(dumps((d1, d2)))
+    assert (r1, r2) == (d1, d2)
+    assert r2.is_integer is True
+
+    g = Function('g')
+    assert loads(dumps(g(x) + f(y))) == g(x) + f(y)
+
+
+def test_sharing():
+    e = x
+    for i in range(20):
+        e = Tuple(e, Tuple(e, i))
+    data = dumps(e)
+    assert len(data) < 400
+
+    # don't compare trees, that's exponential in the depth
+    r = loads(data)
+    a, b = r.args
+    assert b.args[0] is a
+
+    s = sin(x)
+    assert len(dumps([s]*100)) < len(dumps(s)) + 300
+    r = loads(dumps([s, s]))
+    assert r[0] is r[1]
+
+
+def test_deep():
+    e = x
+    for i in range(3000):
+        e = e**y
+    assert loads(dumps(e)) == e
+
+
+def test_stream():
+    file = io.BytesIO()
+    objs = [x + 1, [x, y], Poly(x**2 + 1, x), 3]
+    for obj in objs:
+        dump(obj, file)
+    file.seek(0)
+    assert [load(file) for _ in objs] == objs
+    pytest.raises(EOFError, lambda: load(file))
+
+    pytest.raises(ValueError, lambda: loads(b'spam'))
+    pytest.raises(EOFError, lambda: loads(dumps(x + 1)[:-3]))
+
+
+def test_evaluate():
+    with evaluate(False):
+        e = x + x + 2*3
+    assert loads(dumps(e)) == 2*x + 6
+    r = loads(dumps(e), evaluate=False)
+    assert r.args == e.args
+    assert r != 2*x + 6
+    assert (x + x).args == (2, x)
+
+
+def test_Poly():
+    for p in [Poly(x**2 - 3*x*y + 7, x, y),
+              Poly(x/3 + Rational(1, 2), x, domain=QQ),
+              Poly(sqrt(2)*x + 1, x, extension=True),
+              Poly(x*y + y, x, domain=ZZ.poly_ring(y)),
+              Poly(0, x)]:
+        r = loads(dumps(p))
+        assert r == p
+        assert r.domain == p.domain
+        assert r.gens == p.gens
+
+
+def test_PolyElement():
+    R, a, b = ring('a b', QQ, grlex)
+    p = a**3*b/4 - 2*b + 1
+    r = loads(dumps([p, R.zero, p]))
+    assert r == [p, R.zero, p]
+    assert r[0].ring is R
+    assert r[0] is r[2]
+
+    S, c = ring('c', ZZ)
+    assert loads(dumps(c**2 - 10**20)) == c**2 - 10**20
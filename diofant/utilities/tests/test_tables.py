@@ -0,0 +1,130 @@
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+from diofant import Dummy, Wild, Symbol, S, sin, exp, Matrix, integrate, oo
+from diofant.utilities.diskcache import set_disk_cache
+from diofant.utilities.tables import LazyTable, dump_table, cached_table
+
+
+z = Dummy('z')
+
+
+def test_LazyTable():
+    x = Symbol('x')
+    d = Dummy('d', positive=True)
+    w = Wild('w', exclude=[z, d])
+    table = {(): [1, 2], sin: [(sin(w*z + d), True)], 'x': {x: d}}
+
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'table')
+        with open(path, 'wb') as f:
+            dump_table(table, f, [z])
+        t = LazyTable(path, [z])
+
+        assert len(t) == 3
+        assert set(t) == set(table)
+        assert sin in t and 'y' not in t
+        assert t._entries == {}
+        assert t[()] == [1, 2]
+        assert list(t._entries) == [()]
+
+        # module-level dummies are kept, other dummies are replaced
+        (e, cond), = t[sin]
+        assert cond is True
+        assert z in e.free_symbols
+        d2, = e.atoms(Dummy) - {z}
+        assert d2 != d and d2.name == 'd' and d2.is_positive
+        w2, = e.atoms(Wild)
+        assert w2.name == 'w' and set(w2.exclude) == {z, d2}
+        assert t['x'] == {x: d2}
+        assert t[sin] is t[sin]
+
+        pytest.raises(KeyError, lambda: t['y'])
+
+        with open(path, 'wb') as f:
+            f.write(b'spam')
+        pytest.raises(Exception, lambda: LazyTable(path))
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_decode():
+    f = io.BytesIO()
+    dump_table({1: [Matrix([z])]}, f)
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'table')
+        with open(path, 'wb') as fp:
+            fp.write(f.getvalue())
+        t = LazyTable(path, decode=lambda v: v[0])
+        m = t[1]
+        assert m.shape == (1, 1) and m[0] != z and m[0].is_Dummy
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_cached_table():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {1: exp(z), 2: sin(z)}
+
+    module = sys.modules[__name__]
+    old = set_disk_cache(None)
+    try:
+        assert cached_table('test', build, [module], [z]) == build()
+        assert len(calls) == 2
+
+        tmp = tempfile.mkdtemp()
+        set_disk_cache(tmp)
+        try:
+            calls.clear()
+            t1 = cached_table('test', build, [module], [z])
+            t2 = cached_table('test', build, [module], [z])
+            assert len(calls) == 1
+            assert isinstance(t2, LazyTable)
+            assert dict(t2) == t1 == {1: exp(z), 2: sin(z)}
+
+            # unserializable tables are not stored
+            def build2():
+                return {1: lambda: 1}
+            cached_table('test2', build2, [module])
+            assert not isinstance(cached_table('test2', build2, [module]),
+                                  LazyTable)
+        finally:
+            shutil.rmtree(tmp)
+    finally:
+        set_disk_cache(old.directory if old else None)
+
+
+@pytest.mark.slow
+def test_meijerint_tables():
+    from diofant.core.cache import clear_cache
+
+    # package attributes are shadowed by functions with same names
+    meijerint = sys.modules['diofant.integrals.meijerint']
+    hyperexpand = sys.modules['diofant.simplify.hyperexpand']
+
+    x = Symbol('x', positive=True)
+    old = set_disk_cache(None)
+    tables = meijerint._lookup_table, hyperexpand._collection
+    tmp = tempfile.mkdtemp()
+    set_disk_cache(tmp)
+    try:
+        for i in range(2):
+            clear_cache()
+            meijerint._lookup_table = hyperexpand._collection = None
+            assert integrate(exp(-x)*sin(x), (x, 0, oo)) == S.Half
+        assert isinstance(meijerint._lookup_table, LazyTable)
+        assert isinstance(hyperexpand._collection.table, LazyTable)
+    finally:
+        meijerint._lookup_table, hyperexpand._collection = tables
+        set_disk_cache(old.directory if old else None)
+        shutil.rmtree(tmp)